@@ -0,0 +1,75 @@
+"""Shared deadline scheduler for tweet scheduling.
+
+threading.Timer spawns one OS thread per scheduled tweet, so a bulk
+schedule of N tweets parks N threads that sleep idle for hours. This
+module keeps every pending job in a single heap ordered by deadline and
+runs one daemon worker that waits on the nearest one, so scheduling cost
+is a small tuple per job regardless of how many are outstanding.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable
+
+# Heap of (run_at_epoch, token); the token breaks ties so callables
+# never get compared, and doubles as the cancellation handle
+_pending: list = []
+
+# token -> callable; cancel() simply drops the entry and the worker
+# skips heap heads whose token is gone
+_jobs: dict = {}
+
+_cv = threading.Condition()
+_seq = itertools.count()
+_worker: threading.Thread | None = None
+
+
+def schedule(seconds: float, fn: Callable[[], None]) -> int:
+    """Run fn after roughly seconds on the shared worker thread.
+
+    Returns a token that can be passed to cancel(). The worker thread is
+    started lazily on first use and is a daemon, matching the old
+    Timer.daemon = True behavior.
+    """
+    global _worker
+    run_at = time.time() + max(0.0, seconds)
+    with _cv:
+        token = next(_seq)
+        _jobs[token] = fn
+        heapq.heappush(_pending, (run_at, token))
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name="tweet-scheduler", daemon=True)
+            _worker.start()
+        _cv.notify()
+    return token
+
+
+def cancel(token: int) -> bool:
+    """Cancel a scheduled job. Returns True if it had not run yet."""
+    with _cv:
+        return _jobs.pop(token, None) is not None
+
+
+def _run() -> None:
+    while True:
+        with _cv:
+            while True:
+                # Cancelled jobs leave stale heap heads behind; drop them
+                while _pending and _pending[0][1] not in _jobs:
+                    heapq.heappop(_pending)
+                if not _pending:
+                    _cv.wait()
+                    continue
+                delta = _pending[0][0] - time.time()
+                if delta <= 0:
+                    _, token = heapq.heappop(_pending)
+                    fn = _jobs.pop(token, None)
+                    break
+                # A nearer deadline pushed meanwhile wakes us early
+                _cv.wait(timeout=delta)
+        if fn is not None:
+            fn()
@@ -14,8 +14,12 @@ print("✅ Running launcher from:", BASE_DIR)
 print("✅ sys.path[0]:", sys.path[0])
 # Required local imports for this module
 from pathlib import Path
+import base64
+import functools
+import hashlib
 import json
 import re
+import secrets
 import threading
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
@@ -34,7 +38,78 @@ from tweet import (
 from token_manager import get_tokens
 from twitter_utils import read_tweets_from_file
 
-CONFIG_FILE = Path("config.json")
+# Optional at-rest encryption for the credential store; plaintext fallback
+# when the cryptography package (or an OS keyring) is not installed
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+except ImportError:
+    AESGCM = None
+
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+# This GUI owns the (possibly encrypted) store; sashimi_gui keeps the
+# plaintext config.json, so a distinct filename stops the two apps from
+# clobbering each other's format
+CONFIG_FILE = Path("config_secure.json")
+# Pre-encryption store, still written by sashimi_gui; read as a fallback
+# so existing installs keep their saved credentials
+LEGACY_CONFIG_FILE = Path("config.json")
+
+_CREDS_AAD = b"twitter-creds"
+_KEYRING_SERVICE = "sashimi-app"
+_MASTER_KEY = None  # derived once per session
+
+
+def _get_master_key():
+    """Return the 32-byte master key, creating/deriving it on first use."""
+    global _MASTER_KEY
+    if _MASTER_KEY is not None:
+        return _MASTER_KEY
+    if keyring is not None:
+        stored = keyring.get_password(_KEYRING_SERVICE, "k_master")
+        if stored is None:
+            stored = base64.b64encode(secrets.token_bytes(32)).decode()
+            keyring.set_password(_KEYRING_SERVICE, "k_master", stored)
+        _MASTER_KEY = base64.b64decode(stored)
+    else:
+        # No OS keyring available: derive from a per-install random salt so
+        # the ciphertext is at least not portable between machines
+        salt_file = Path(".sashimi_salt")
+        if salt_file.exists():
+            salt = salt_file.read_bytes()
+        else:
+            salt = secrets.token_bytes(16)
+            salt_file.write_bytes(salt)
+        _MASTER_KEY = hashlib.scrypt(
+            b"sashimi-app", salt=salt, n=2 ** 14, r=8, p=1, dklen=32
+        )
+    return _MASTER_KEY
+
+
+def encrypt_credentials(creds):
+    """Wrap a credential dict in an AES-GCM envelope {"n": nonce, "c": ct}."""
+    nonce = secrets.token_bytes(12)
+    ct = AESGCM(_get_master_key()).encrypt(
+        nonce, json.dumps(creds).encode(), _CREDS_AAD
+    )
+    return {"n": base64.b64encode(nonce).decode(), "c": base64.b64encode(ct).decode()}
+
+
+def decrypt_credentials(envelope):
+    """Reverse encrypt_credentials() back into the credential dict."""
+    nonce = base64.b64decode(envelope["n"])
+    ct = base64.b64decode(envelope["c"])
+    return json.loads(AESGCM(_get_master_key()).decrypt(nonce, ct, _CREDS_AAD))
+
+# Cap on log/chat textbox length: older lines are trimmed so long-running
+# sessions keep bounded memory and a stable per-insert redraw cost
+LOG_MAX_LINES = 2000
+
+# Timestamp format for log/chat lines, parsed once at module scope
+_TS_FMT = "%H:%M:%S"
 
 # Sashimi-Inspired Modern Color Palette (White Background, Orange/Red Accents)
 COLORS = {
@@ -57,6 +132,54 @@ COLORS = {
     'glass_bg': '#fefefe',  # Semi-transparent white for glass effects
 }
 
+# Shared font cache: Tk re-parses literal ("Family", size, weight) tuples for
+# every widget, so each style is created once and the object reused. Shared
+# font objects also make a later global restyle O(1).
+_FONT_CACHE = {}
+
+
+def get_font(size, weight="normal", family="Helvetica"):
+    """Return a shared ctk.CTkFont for the given style, creating it once."""
+    key = (family, size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = ctk.CTkFont(family=family, size=size, weight=weight)
+        _FONT_CACHE[key] = font
+    return font
+
+
+# Shared styling for the credential form rows, built once instead of
+# re-spelling the same keyword arguments per field
+_FIELD_FRAME_KW = dict(
+    fg_color=COLORS['secondary'],
+    corner_radius=12,
+    border_width=1,
+    border_color=COLORS['border'],
+)
+_FIELD_ENTRY_KW = dict(
+    width=400,
+    height=45,
+    fg_color=COLORS['primary'],
+    border_color=COLORS['border'],
+    text_color=COLORS['text_primary'],
+    corner_radius=8,
+)
+
+# Shared button styles: partials centralise the repeated kwargs so call
+# sites only spell out what differs (per-site overrides still work)
+_primary_button = functools.partial(
+    ctk.CTkButton,
+    fg_color=COLORS['accent'],
+    hover_color=COLORS['highlight'],
+    corner_radius=20,
+)
+_success_button = functools.partial(
+    ctk.CTkButton,
+    fg_color=COLORS['success'],
+    hover_color='#27ae60',
+    corner_radius=25,
+)
+
 
 class PizzaApp(ctk.CTk):
     def __init__(self):
@@ -98,6 +221,10 @@ class PizzaApp(ctk.CTk):
         self.container.grid_rowconfigure(0, weight=1)
         self.container.grid_columnconfigure(0, weight=1)
 
+        # One shared navbar, re-gridded into whichever page is current;
+        # widget creation is the startup hotspot, so build it exactly once
+        self.navbar = NavBar(self.container, self)
+
         # Frames for navigation
         self.frames = {}
         for F in (MainPage, SettingsPage, AgentPosterPage):
@@ -112,16 +239,36 @@ class PizzaApp(ctk.CTk):
     def show_frame(self, page_name):
         frame = self.frames[page_name]
         print(f"Switching to: {page_name}")
+        # Let lazily-built pages construct their widgets on first show
+        if hasattr(frame, "on_show"):
+            frame.on_show()
         frame.tkraise()
+        if getattr(frame, "uses_navbar", False):
+            # Move the shared navbar into the current page
+            self.navbar.grid(in_=frame, row=0, column=0, sticky="ew")
+            self.navbar.lift()
+        else:
+            self.navbar.grid_remove()
         frame.update_idletasks()
 
+    def destroy(self):
+        # Stop any running AI auto-reply worker so no thread outlives the UI
+        main_page = self.frames.get("MainPage")
+        if main_page is not None and getattr(main_page, "_ai_stop", None) is not None:
+            main_page._ai_stop.set()
+        super().destroy()
 
     def load_credentials(self):
         """Load saved credentials or return default structure."""
-        if CONFIG_FILE.exists():
+        for path in (CONFIG_FILE, LEGACY_CONFIG_FILE):
+            if not path.exists():
+                continue
             try:
-                with open(CONFIG_FILE, "r") as f:
-                    return json.load(f)
+                with open(path, "r") as f:
+                    data = json.load(f)
+                if AESGCM is not None and "n" in data and "c" in data:
+                    return decrypt_credentials(data)
+                return data  # legacy plaintext config
             except Exception:
                 pass
         return {
@@ -132,46 +279,46 @@ class PizzaApp(ctk.CTk):
         }
 
     def save_credentials(self, creds):
-        """Save credentials to both config.json and twitter_credentials.py."""
-        try:
-            # Save to config.json for GUI
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(creds, f, indent=4)
-            
-            # Also update twitter_credentials.py for backend
-            creds_file = Path("twitter_credentials.py")
-            if creds_file.exists():
-                content = creds_file.read_text()
-                
-                # Use regex to replace existing values
-                content = re.sub(
-                    r'API_KEY: str = "[^"]*"',
-                    f'API_KEY: str = "{creds["api_key"]}"',
-                    content
-                )
-                content = re.sub(
-                    r'API_SECRET: str = "[^"]*"',
-                    f'API_SECRET: str = "{creds["api_secret"]}"',
-                    content
-                )
-                content = re.sub(
-                    r'ACCESS_TOKEN: str = "[^"]*"',
-                    f'ACCESS_TOKEN: str = "{creds["access_token"]}"',
-                    content
-                )
-                content = re.sub(
-                    r'ACCESS_TOKEN_SECRET: str = "[^"]*"',
-                    f'ACCESS_TOKEN_SECRET: str = "{creds["access_token_secret"]}"',
-                    content
-                )
-                
-                creds_file.write_text(content)
+        """Save credentials to both config_secure.json and twitter_credentials.py.
+
+        Pure persistence: no widget access, so it is safe to call from a
+        worker thread. Raises on failure; callers own the UI feedback.
+        """
+        # Save to config_secure.json for GUI, encrypted at rest when possible
+        payload = encrypt_credentials(creds) if AESGCM is not None else creds
+        with open(CONFIG_FILE, "w") as f:
+            json.dump(payload, f, indent=4)
             
-            messagebox.showinfo("Success", "✅ Credentials saved successfully!")
-            self.credentials = creds
-            self.show_frame("MainPage")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save credentials:\n{e}")
+        # Also update twitter_credentials.py for backend
+        creds_file = Path("twitter_credentials.py")
+        if creds_file.exists():
+            content = creds_file.read_text()
+
+            # Use regex to replace existing values
+            content = re.sub(
+                r'API_KEY: str = "[^"]*"',
+                f'API_KEY: str = "{creds["api_key"]}"',
+                content
+            )
+            content = re.sub(
+                r'API_SECRET: str = "[^"]*"',
+                f'API_SECRET: str = "{creds["api_secret"]}"',
+                content
+            )
+            content = re.sub(
+                r'ACCESS_TOKEN: str = "[^"]*"',
+                f'ACCESS_TOKEN: str = "{creds["access_token"]}"',
+                content
+            )
+            content = re.sub(
+                r'ACCESS_TOKEN_SECRET: str = "[^"]*"',
+                f'ACCESS_TOKEN_SECRET: str = "{creds["access_token_secret"]}"',
+                content
+            )
+
+            creds_file.write_text(content)
+
+        self.credentials = creds
 
 
 class NavBar(ctk.CTkFrame):
@@ -198,7 +345,7 @@ class NavBar(ctk.CTkFrame):
         self.logo_label = ctk.CTkLabel(
             self,
             text="🍣",
-            font=("Helvetica", 36),
+            font=get_font(36),
             text_color=COLORS['accent']
         )
         self.logo_label.grid(row=0, column=0, padx=30, pady=20, sticky="w")
@@ -207,7 +354,7 @@ class NavBar(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self,
             text="Sashimi App",
-            font=("Helvetica", 28, "bold"),
+            font=get_font(28, "bold"),
             text_color=COLORS['text_primary']
         )
         self.title_label.grid(row=0, column=1, padx=15, pady=20, sticky="w")
@@ -216,7 +363,7 @@ class NavBar(ctk.CTkFrame):
         self.subtitle_label = ctk.CTkLabel(
             self,
             text="X Automation Suite",
-            font=("Helvetica", 12),
+            font=get_font(12),
             text_color=COLORS['text_secondary']
         )
         self.subtitle_label.grid(row=1, column=1, padx=15, pady=(0, 20), sticky="w")
@@ -225,7 +372,7 @@ class NavBar(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             self,
             text="● Online",
-            font=("Helvetica", 11, "bold"),
+            font=get_font(11, "bold"),
             text_color=COLORS['success']
         )
         self.status_label.grid(row=0, column=2, padx=20, pady=20, sticky="e")
@@ -236,7 +383,7 @@ class NavBar(ctk.CTkFrame):
             text="🏠 Home",
             width=130,
             height=45,
-            font=("Helvetica", 13, "bold"),
+            font=get_font(13, "bold"),
             fg_color="transparent",
             hover_color=COLORS['card_hover'],
             text_color=COLORS['text_primary'],
@@ -253,7 +400,7 @@ class NavBar(ctk.CTkFrame):
             text="🤖 Agent",
             width=130,
             height=45,
-            font=("Helvetica", 13, "bold"),
+            font=get_font(13, "bold"),
             fg_color=COLORS['accent'],
             hover_color=COLORS['highlight'],
             text_color="white",
@@ -269,7 +416,7 @@ class NavBar(ctk.CTkFrame):
             text="⚙️ Settings",
             width=130,
             height=45,
-            font=("Helvetica", 13, "bold"),
+            font=get_font(13, "bold"),
             fg_color="transparent",
             hover_color=COLORS['card_hover'],
             text_color=COLORS['text_primary'],
@@ -290,20 +437,19 @@ class NavBar(ctk.CTkFrame):
 class MainPage(ctk.CTkFrame):
     """Enhanced main dashboard page with modern card layout."""
 
+    uses_navbar = True
+
     def __init__(self, parent, controller):
         super().__init__(parent, fg_color=COLORS['primary'])
         self.controller = controller
-        
+        self._ai_stop = None  # set while an AI auto-reply worker is running
+
         # Configure this frame to expand
         self.grid_rowconfigure(0, weight=0)  # navbar
         self.grid_rowconfigure(1, weight=1)  # content
         self.grid_columnconfigure(0, weight=1)
 
-        # Enhanced navbar
-        self.navbar = NavBar(self, controller)
-        self.navbar.grid(row=0, column=0, sticky="ew")
-
-        # Main content area with padding
+        # Main content area with padding (row 0 hosts the shared navbar)
         content_frame = ctk.CTkFrame(self, fg_color=COLORS['primary'])
         content_frame.grid(row=1, column=0, sticky="nsew", padx=30, pady=20)
         content_frame.grid_columnconfigure(0, weight=1)
@@ -324,7 +470,7 @@ class MainPage(ctk.CTkFrame):
         welcome_label = ctk.CTkLabel(
             header_frame,
             text="🚀 Twitter Automation Dashboard",
-            font=("Helvetica", 28, "bold"),
+            font=get_font(28, "bold"),
             text_color=COLORS['text_primary']
         )
         welcome_label.grid(row=0, column=0, pady=25, padx=30)
@@ -333,7 +479,7 @@ class MainPage(ctk.CTkFrame):
         subtitle_label = ctk.CTkLabel(
             header_frame,
             text="Manage your Twitter presence with powerful automation tools",
-            font=("Helvetica", 16),
+            font=get_font(16),
             text_color=COLORS['text_secondary']
         )
         subtitle_label.grid(row=1, column=0, pady=(0, 25), padx=30)
@@ -378,20 +524,35 @@ class MainPage(ctk.CTkFrame):
         # Activity log header
         log_header = ctk.CTkFrame(right_column, fg_color=COLORS['card_bg'], corner_radius=10)
         log_header.grid(row=0, column=0, sticky="ew", pady=(0, 10))
-        
+        log_header.grid_columnconfigure(0, weight=1)
+
         log_title = ctk.CTkLabel(
             log_header,
             text="📊 Activity Log",
-            font=("Helvetica", 18, "bold"),
+            font=get_font(18, "bold"),
             text_color=COLORS['text_primary']
         )
-        log_title.grid(row=0, column=0, pady=15, padx=20)
+        log_title.grid(row=0, column=0, pady=15, padx=20, sticky="w")
+
+        # Stop button for the AI auto-reply worker
+        self.stop_ai_button = ctk.CTkButton(
+            log_header,
+            text="⏹ Stop Auto Reply",
+            width=140,
+            height=32,
+            font=get_font(12, "bold"),
+            fg_color=COLORS['error'],
+            hover_color=COLORS['highlight'],
+            corner_radius=16,
+            command=self.stop_auto_reply,
+        )
+        self.stop_ai_button.grid(row=0, column=1, pady=15, padx=(0, 20), sticky="e")
 
         # Enhanced log box
         self.log_box = ctk.CTkTextbox(
             right_column, 
             height=400,
-            font=("Consolas", 12),
+            font=get_font(12, family="Consolas"),
             fg_color=COLORS['card_bg'],
             text_color=COLORS['text_primary'],
             corner_radius=10,
@@ -403,6 +564,10 @@ class MainPage(ctk.CTkFrame):
         self.log_box.insert("end", f"💡 [{datetime.now().strftime('%H:%M:%S')}] Tip: Use the cards on the left to get started with automation.\n")
         self.log_box.insert("end", f"🔧 [{datetime.now().strftime('%H:%M:%S')}] Make sure to configure your Twitter API credentials in Settings.\n\n")
 
+    def on_show(self):
+        """Reset the shared navbar status when returning to the dashboard."""
+        self.controller.navbar.update_status("Online")
+
     def create_action_card(self, parent, icon, title, description, command, color, row):
         """Create an ultra-modern action card with glassmorphism and sleek design."""
         # Main card container with shadow effect
@@ -456,7 +621,7 @@ class MainPage(ctk.CTkFrame):
         icon_label = ctk.CTkLabel(
             icon_frame,
             text=icon,
-            font=("Helvetica", 20),
+            font=get_font(20),
             text_color=color
         )
         icon_label.place(relx=0.5, rely=0.5, anchor="center")
@@ -470,7 +635,7 @@ class MainPage(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             text_frame,
             text=title,
-            font=("Helvetica", 18, "bold"),
+            font=get_font(18, "bold"),
             text_color=COLORS['text_primary'],
             anchor="w"
         )
@@ -480,7 +645,7 @@ class MainPage(ctk.CTkFrame):
         desc_label = ctk.CTkLabel(
             text_frame,
             text=description,
-            font=("Helvetica", 13),
+            font=get_font(13),
             text_color=COLORS['text_secondary'],
             anchor="w",
             wraplength=400
@@ -493,7 +658,7 @@ class MainPage(ctk.CTkFrame):
             text="Launch →",
             width=120,
             height=42,
-            font=("Helvetica", 12, "bold"),
+            font=get_font(12, "bold"),
             fg_color=color,
             hover_color=self.darken_color(color),
             text_color="white",
@@ -542,7 +707,7 @@ class MainPage(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text="📝 Post a Tweet",
-            font=("Helvetica", 20, "bold"),
+            font=get_font(20, "bold"),
             text_color=COLORS['text_primary']
         )
         title_label.pack(pady=(0, 10))
@@ -554,7 +719,7 @@ class MainPage(ctk.CTkFrame):
         text_area = ctk.CTkTextbox(
             tweet_frame,
             height=120,
-            font=("Helvetica", 14),
+            font=get_font(14),
             fg_color=COLORS['primary'],
             text_color=COLORS['text_primary'],
             corner_radius=8
@@ -565,7 +730,7 @@ class MainPage(ctk.CTkFrame):
         char_label = ctk.CTkLabel(
             tweet_frame,
             text="0/280 characters",
-            font=("Helvetica", 12),
+            font=get_font(12),
             text_color=COLORS['text_secondary']
         )
         char_label.pack(pady=(0, 10))
@@ -594,28 +759,26 @@ class MainPage(ctk.CTkFrame):
                 return
             
             try:
-                self.navbar.update_status("Posting...", COLORS['warning'])
+                self.controller.navbar.update_status("Posting...", COLORS['warning'])
                 post_tweet(message)
-                self.log_box.insert("end", f"✅ [{datetime.now().strftime('%H:%M:%S')}] Tweet posted successfully!\n")
-                self.log_box.insert("end", f"   📝 Content: {message[:50]}{'...' if len(message) > 50 else ''}\n\n")
-                self.log_box.see("end")
-                self.navbar.update_status("Ready", COLORS['success'])
+                self._log(
+                    f"✅ [{datetime.now().strftime('%H:%M:%S')}] Tweet posted successfully!\n"
+                    f"   📝 Content: {message[:50]}{'...' if len(message) > 50 else ''}\n\n"
+                )
+                self.controller.navbar.update_status("Ready", COLORS['success'])
                 messagebox.showinfo("Success", "Tweet posted successfully!")
                 dialog.destroy()
             except Exception as e:
-                self.log_box.insert("end", f"❌ [{datetime.now().strftime('%H:%M:%S')}] Error posting tweet: {e}\n\n")
-                self.log_box.see("end")
-                self.navbar.update_status("Error", COLORS['error'])
+                self._log(f"❌ [{datetime.now().strftime('%H:%M:%S')}] Error posting tweet: {e}\n\n")
+                self.controller.navbar.update_status("Error", COLORS['error'])
                 messagebox.showerror("Error", f"Failed to post tweet:\n{e}")
         
-        ctk.CTkButton(
+        _success_button(
             button_frame,
             text="🚀 Post Tweet",
-            font=("Helvetica", 14, "bold"),
+            font=get_font(14, "bold"),
             width=120,
             height=40,
-            fg_color=COLORS['success'],
-            hover_color='#27ae60',
             corner_radius=20,
             command=post_tweet_click
         ).pack(side="right", padx=(10, 0))
@@ -623,7 +786,7 @@ class MainPage(ctk.CTkFrame):
         ctk.CTkButton(
             button_frame,
             text="Cancel",
-            font=("Helvetica", 14),
+            font=get_font(14),
             width=100,
             height=40,
             fg_color=COLORS['text_muted'],
@@ -712,18 +875,17 @@ class MainPage(ctk.CTkFrame):
                 now = datetime.now()
                 if y == now.year and mo == now.month:
                     schedule_tweet_in_month(message, y, mo, d, f"{hh:02d}:{mm:02d}")
-                    self.log_box.insert("end", f"⏰ Tweet scheduled for {y}-{mo:02d}-{d:02d} {hh:02d}:{mm:02d}\n")
+                    self._log(f"⏰ Tweet scheduled for {y}-{mo:02d}-{d:02d} {hh:02d}:{mm:02d}\n")
                 else:
                     # Compute minutes until the datetime and use schedule_tweet
                     then = datetime(y, mo, d, hh, mm)
                     delta = then - now
                     delay_minutes = int(max(0, delta.total_seconds() // 60))
                     schedule_tweet(message, delay_minutes=delay_minutes)
-                    self.log_box.insert("end", f"⏰ Tweet scheduled for {then.strftime('%Y-%m-%d %H:%M')}\n")
+                    self._log(f"⏰ Tweet scheduled for {then.strftime('%Y-%m-%d %H:%M')}\n")
                 messagebox.showinfo("Success", "Tweet scheduled!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to schedule tweet:\n{e}")
-            self.log_box.see("end")
 
         ctk.CTkButton(top, text="OK", command=on_ok).grid(row=r, column=0, pady=12)
         ctk.CTkButton(top, text="Cancel", command=top.destroy).grid(row=r, column=1, pady=12)
@@ -758,23 +920,22 @@ class MainPage(ctk.CTkFrame):
 
         def on_start_bulk():
             freq_min = int(freq_var.get())
-            self.log_box.insert("end", f"📁 Scheduling tweets from {Path(filename).name} every {freq_min} minutes\n")
             try:
                 timers = bulk_schedule_from_file(filename, freq_min)
                 scheduled_count = len(timers)
-                self.log_box.insert("end", f"✅ Created {scheduled_count} scheduled posts.\n")
+                self._log(
+                    f"📁 Scheduling tweets from {Path(filename).name} every {freq_min} minutes\n"
+                    f"✅ Created {scheduled_count} scheduled posts.\n"
+                )
                 messagebox.showinfo("Started", f"Bulk scheduling created {scheduled_count} scheduled posts!")
             except Exception as e:
-                self.log_box.insert("end", f"❌ Bulk scheduling error: {e}\n")
+                self._log(f"❌ Bulk scheduling error: {e}\n")
                 messagebox.showerror("Error", f"Failed to schedule tweets:\n{e}")
-            self.log_box.see("end")
             freq_top.destroy()
 
         ctk.CTkButton(freq_top, text="Start", command=on_start_bulk).grid(row=r, column=0, pady=8)
         ctk.CTkButton(freq_top, text="Cancel", command=freq_top.destroy).grid(row=r, column=1, pady=8)
 
-        self.log_box.see("end")
-
     def auto_reply(self):
         """Start AI-powered auto-reply mode with token accounting."""
         # Ask for who to reply to (user spec) and interval
@@ -788,57 +949,104 @@ class MainPage(ctk.CTkFrame):
         if not interval_str:
             return
 
-        try:
-            interval = int(interval_str)
-        except ValueError:
-            messagebox.showerror("Error", "Please enter a valid number")
+        # isdigit() pre-check avoids exception machinery for the common case
+        interval_str = interval_str.strip()
+        if not interval_str.isdigit() or int(interval_str) <= 0:
+            messagebox.showerror("Error", "Please enter a valid positive number")
             return
+        interval = int(interval_str)
 
-        # Start AI auto-reply thread
-        def run_ai():
+        # Start AI auto-reply thread with a cooperative stop token
+        self._ai_stop = threading.Event()
+
+        def run_ai(stop_event=self._ai_stop):
             try:
-                auto_reply_ai(interval, user_spec)
+                # Token accounting does file I/O; keep it off the UI thread and
+                # marshal the log line back via after()
+                left, limit = get_tokens()
+                self.after(0, self._log, f"🤖 AI Auto-reply started (interval {interval} min). Tokens left: {left}/{limit}\n")
+                auto_reply_ai(interval, user_spec, stop_event=stop_event)
             except Exception as e:
-                self.log_box.insert("end", f"❌ AI Auto-reply error: {e}\n")
-                self.log_box.see("end")
+                self.after(0, self._log, f"❌ AI Auto-reply error: {e}\n")
 
         thread = threading.Thread(target=run_ai, daemon=True)
         thread.start()
-        left, limit = get_tokens()
-        self.log_box.insert("end", f"🤖 AI Auto-reply started (interval {interval} min). Tokens left: {left}/{limit}\n")
-        messagebox.showinfo("Started", "AI Auto-reply started!\nPress Ctrl+C in terminal to stop.")
-        self.log_box.see("end")
+        messagebox.showinfo("Started", "AI Auto-reply started!\nUse the Stop button in the Activity Log to stop.")
+
+    def _log(self, message):
+        """Append to the activity log. Must run on the UI thread.
+
+        Scrolls at most once per call, and only when the view is already at
+        the bottom so a user reading older entries is not yanked back down.
+        """
+        at_bottom = self.log_box.yview()[1] > 0.999
+        self.log_box.insert("end", message)
+        # Ring-buffer trim: drop the oldest lines once over the cap
+        lines = int(self.log_box.index("end-1c").split(".")[0])
+        if lines > LOG_MAX_LINES:
+            self.log_box.delete("1.0", f"{lines - LOG_MAX_LINES + 1}.0")
+        if at_bottom:
+            self.log_box.see("end")
+
+    def stop_auto_reply(self):
+        """Signal the AI auto-reply worker to stop after its current cycle."""
+        if self._ai_stop is None or self._ai_stop.is_set():
+            self._log("⏹ No AI auto-reply is running.\n")
+        else:
+            self._ai_stop.set()
+            self._log(f"⏹ [{datetime.now().strftime('%H:%M:%S')}] AI Auto-reply stop requested.\n")
 
 
 class SettingsPage(ctk.CTkFrame):
-    """Enhanced settings page with modern credential management."""
+    """Enhanced settings page with modern credential management.
+
+    Widgets are built lazily on first show to keep app startup fast.
+    """
 
     def __init__(self, parent, controller):
         super().__init__(parent, fg_color=COLORS['primary'])
         self.controller = controller
-        
+        self._built = False
+
+    def on_show(self):
+        """Build the page widgets the first time the page is shown."""
+        if not self._built:
+            self._build()
+            self._built = True
+
+    def _build(self):
+        controller = self.controller
+        # Bind hot palette entries to locals: LOAD_FAST beats a global dict
+        # lookup for every one of the dozens of widgets built below
+        primary = COLORS['primary']
+        secondary = COLORS['secondary']
+        highlight = COLORS['highlight']
+        text_primary = COLORS['text_primary']
+        text_secondary = COLORS['text_secondary']
+        card_bg = COLORS['card_bg']
+        border = COLORS['border']
+
         # Configure this frame to expand
         self.grid_rowconfigure(0, weight=0)  # navbar
         self.grid_rowconfigure(1, weight=1)  # content
         self.grid_columnconfigure(0, weight=1)
 
         # Enhanced navbar
-        top = ctk.CTkFrame(self, fg_color=COLORS['secondary'], height=80, corner_radius=0)
+        top = ctk.CTkFrame(self, fg_color=secondary, height=80, corner_radius=0)
         top.grid(row=0, column=0, sticky="ew")
-        
+        # Freeze the bar height so adding children doesn't trigger re-layout
+        top.grid_propagate(False)
+
         # Configure top navbar grid
         top.grid_columnconfigure(1, weight=1)
 
         # Back button with enhanced styling
-        back_btn = ctk.CTkButton(
+        back_btn = _primary_button(
             top,
             text="← Back to Dashboard",
             width=150,
             height=40,
-            font=("Helvetica", 14, "bold"),
-            fg_color=COLORS['accent'],
-            hover_color=COLORS['highlight'],
-            corner_radius=20,
+            font=get_font(14, "bold"),
             command=lambda: controller.show_frame("MainPage"),
         )
         back_btn.grid(row=0, column=0, padx=25, pady=15, sticky="w")
@@ -847,13 +1055,13 @@ class SettingsPage(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             top, 
             text="⚙️ Settings & Configuration", 
-            font=("Helvetica", 24, "bold"),
-            text_color=COLORS['text_primary']
+            font=get_font(24, "bold"),
+            text_color=text_primary
         )
         title_label.grid(row=0, column=1, padx=20, pady=15, sticky="w")
 
         # Main content area
-        content_frame = ctk.CTkFrame(self, fg_color=COLORS['primary'])
+        content_frame = ctk.CTkFrame(self, fg_color=primary)
         content_frame.grid(row=1, column=0, sticky="nsew", padx=30, pady=20)
         content_frame.grid_columnconfigure(0, weight=1)
         content_frame.grid_rowconfigure(0, weight=1)
@@ -862,9 +1070,9 @@ class SettingsPage(ctk.CTkFrame):
         form_frame = ctk.CTkFrame(
             content_frame, 
             corner_radius=20, 
-            fg_color=COLORS['card_bg'],
+            fg_color=card_bg,
             border_width=1,
-            border_color=COLORS['border']
+            border_color=border
         )
         form_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         form_frame.grid_columnconfigure(0, weight=1)
@@ -882,16 +1090,16 @@ class SettingsPage(ctk.CTkFrame):
         icon_label = ctk.CTkLabel(
             title_section,
             text="🔐",
-            font=("Helvetica", 32),
-            text_color=COLORS['highlight']
+            font=get_font(32),
+            text_color=highlight
         )
         icon_label.grid(row=0, column=0, padx=(0, 15), pady=5)
 
         title_text = ctk.CTkLabel(
             title_section,
             text="Twitter API Credentials",
-            font=("Helvetica", 26, "bold"),
-            text_color=COLORS['text_primary']
+            font=get_font(26, "bold"),
+            text_color=text_primary
         )
         title_text.grid(row=0, column=1, sticky="w", pady=5)
 
@@ -899,8 +1107,8 @@ class SettingsPage(ctk.CTkFrame):
         subtitle = ctk.CTkLabel(
             header_frame,
             text="Configure your Twitter API credentials to enable automation features",
-            font=("Helvetica", 16),
-            text_color=COLORS['text_secondary']
+            font=get_font(16),
+            text_color=text_secondary
         )
         subtitle.grid(row=1, column=0, sticky="ew", pady=(10, 0))
 
@@ -919,40 +1127,7 @@ class SettingsPage(ctk.CTkFrame):
         form_content.grid_columnconfigure(0, weight=1)
 
         for idx, (label, key, placeholder) in enumerate(fields):
-            # Field container
-            field_frame = ctk.CTkFrame(
-                form_content,
-                fg_color=COLORS['secondary'],
-                corner_radius=12,
-                border_width=1,
-                border_color=COLORS['border']
-            )
-            field_frame.grid(row=idx, column=0, sticky="ew", pady=15)
-            field_frame.grid_columnconfigure(1, weight=1)
-
-            # Field label
-            label_widget = ctk.CTkLabel(
-                field_frame,
-                text=label,
-                font=("Helvetica", 16, "bold"),
-                text_color=COLORS['text_primary']
-            )
-            label_widget.grid(row=0, column=0, padx=20, pady=(15, 5), sticky="w")
-
-            # Input field
-            entry = ctk.CTkEntry(
-                field_frame,
-                placeholder_text=placeholder,
-                show="*" if "secret" in key.lower() else "",
-                width=400,
-                height=45,
-                font=("Helvetica", 14),
-                fg_color=COLORS['primary'],
-                border_color=COLORS['border'],
-                text_color=COLORS['text_primary'],
-                corner_radius=8
-            )
-            entry.grid(row=1, column=0, padx=20, pady=(0, 15), sticky="ew")
+            entry = self._make_field(form_content, idx, label, key, placeholder)
             entry.insert(0, creds.get(key, ""))
             self.entries[key] = entry
 
@@ -961,85 +1136,153 @@ class SettingsPage(ctk.CTkFrame):
         save_frame.grid(row=2, column=0, sticky="ew", padx=40, pady=(20, 40))
         save_frame.grid_columnconfigure(0, weight=1)
 
-        save_btn = ctk.CTkButton(
+        self.save_btn = _success_button(
             save_frame,
             text="💾 Save Credentials",
-            font=("Helvetica", 18, "bold"),
+            font=get_font(18, "bold"),
             width=300,
             height=50,
-            fg_color=COLORS['success'],
-            hover_color='#27ae60',
-            corner_radius=25,
             command=self.save,
         )
-        save_btn.grid(row=0, column=0, pady=20)
+        self.save_btn.grid(row=0, column=0, pady=20)
+
+        # One explicit reflow at the end of the build instead of many
+        # implicit ones while widgets were being added
+        self.update_idletasks()
+
+    def _make_field(self, parent, row, label, key, placeholder):
+        """Create one labelled credential row and return its entry widget."""
+        field_frame = ctk.CTkFrame(parent, **_FIELD_FRAME_KW)
+        field_frame.grid(row=row, column=0, sticky="ew", pady=15)
+        field_frame.grid_columnconfigure(1, weight=1)
+
+        label_widget = ctk.CTkLabel(
+            field_frame,
+            text=label,
+            font=get_font(16, "bold"),
+            text_color=COLORS['text_primary']
+        )
+        label_widget.grid(row=0, column=0, padx=20, pady=(15, 5), sticky="w")
+
+        entry = ctk.CTkEntry(
+            field_frame,
+            placeholder_text=placeholder,
+            show="*" if "secret" in key.lower() else "",
+            font=get_font(14),
+            **_FIELD_ENTRY_KW
+        )
+        entry.grid(row=1, column=0, padx=20, pady=(0, 15), sticky="ew")
+        return entry
 
     def save(self):
         creds = {k: v.get().strip() for k, v in self.entries.items()}
         if not all(creds.values()):
             messagebox.showerror("Error", "All fields are required!")
             return
-        self.controller.save_credentials(creds)
+        # Disable the button while the worker runs: the file writes happen
+        # off the UI thread and rapid double-clicks coalesce into one save
+        self.save_btn.configure(state="disabled", text="💾 Saving...")
+        threading.Thread(target=self._save_worker, args=(creds,), daemon=True).start()
+
+    def _save_worker(self, creds):
+        """Persist credentials off the UI thread and report back via after()."""
+        try:
+            self.controller.save_credentials(creds)
+        except Exception as e:
+            self.after(0, self._save_done, e)
+        else:
+            self.after(0, self._save_done, None)
+
+    def _save_done(self, error):
+        """Runs on the UI thread once the save worker finishes."""
+        self.save_btn.configure(state="normal", text="💾 Save Credentials")
+        if error is None:
+            messagebox.showinfo("Success", "✅ Credentials saved successfully!")
+            self.controller.show_frame("MainPage")
+        else:
+            messagebox.showerror("Error", f"Failed to save credentials:\n{error}")
 
 
 class AgentPosterPage(ctk.CTkFrame):
-    """Placeholder page for future AI agent posting experience."""
+    """Placeholder page for future AI agent posting experience.
+
+    Widgets are built lazily on first show to keep app startup fast.
+    """
+
+    uses_navbar = True
 
     def __init__(self, parent, controller):
         super().__init__(parent, fg_color=COLORS['primary'])
         self.controller = controller
+        self._built = False
+
+    def on_show(self):
+        """Build the page widgets the first time the page is shown."""
+        if not self._built:
+            self._build()
+            self._built = True
+        self.controller.navbar.update_status("Agent Poster", COLORS['highlight'])
+
+    def _build(self):
+        # Bind hot palette entries to locals: LOAD_FAST beats a global dict
+        # lookup for every widget built below
+        primary = COLORS['primary']
+        highlight = COLORS['highlight']
+        text_primary = COLORS['text_primary']
+        text_secondary = COLORS['text_secondary']
+        card_bg = COLORS['card_bg']
+        border = COLORS['border']
 
         self.grid_rowconfigure(0, weight=0)
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
-        # Reuse navbar for consistent navigation
-        self.navbar = NavBar(self, controller)
-        self.navbar.grid(row=0, column=0, sticky="ew")
-        self.navbar.update_status("Agent Poster", COLORS['highlight'])
-
-        content = ctk.CTkFrame(self, fg_color=COLORS['primary'])
+        content = ctk.CTkFrame(self, fg_color=primary)
         content.grid(row=1, column=0, sticky="nsew", padx=30, pady=30)
         content.grid_rowconfigure(1, weight=1)
         content.grid_columnconfigure(0, weight=1)
 
         hero = ctk.CTkFrame(
             content,
-            fg_color=COLORS['card_bg'],
+            fg_color=card_bg,
             corner_radius=20,
             border_width=1,
-            border_color=COLORS['border'],
+            border_color=border,
+            height=280,
         )
         hero.grid(row=0, column=0, sticky="ew", pady=(0, 20))
+        # Fixed-size banner: freeze it so each child added below doesn't
+        # re-run a geometry pass over the whole page
+        hero.grid_propagate(False)
         hero.grid_columnconfigure(0, weight=1)
 
         ctk.CTkLabel(
             hero,
             text="🤖",
-            font=("Helvetica", 80),
-            text_color=COLORS['highlight'],
+            font=get_font(80),
+            text_color=highlight,
         ).grid(row=0, column=0, pady=(30, 10))
 
         ctk.CTkLabel(
             hero,
             text="Agent Poster",
-            font=("Helvetica", 28, "bold"),
-            text_color=COLORS['text_primary'],
+            font=get_font(28, "bold"),
+            text_color=text_primary,
         ).grid(row=1, column=0, pady=(0, 10))
 
         ctk.CTkLabel(
             hero,
             text="Chat with your AI assistant to craft and schedule posts (coming soon)",
-            font=("Helvetica", 16),
-            text_color=COLORS['text_secondary'],
+            font=get_font(16),
+            text_color=text_secondary,
         ).grid(row=2, column=0, pady=(0, 30))
 
         chat_shell = ctk.CTkFrame(
             content,
-            fg_color=COLORS['card_bg'],
+            fg_color=card_bg,
             corner_radius=18,
             border_width=1,
-            border_color=COLORS['border'],
+            border_color=border,
         )
         chat_shell.grid(row=1, column=0, sticky="nsew")
         chat_shell.grid_rowconfigure(1, weight=1)
@@ -1048,24 +1291,30 @@ class AgentPosterPage(ctk.CTkFrame):
         ctk.CTkLabel(
             chat_shell,
             text="Agent Chat",
-            font=("Helvetica", 20, "bold"),
-            text_color=COLORS['text_primary'],
+            font=get_font(20, "bold"),
+            text_color=text_primary,
         ).grid(row=0, column=0, sticky="w", padx=24, pady=(20, 10))
 
         self.chat_log = ctk.CTkTextbox(
             chat_shell,
-            fg_color=COLORS['primary'],
-            text_color=COLORS['text_primary'],
-            font=("Helvetica", 14),
+            fg_color=primary,
+            text_color=text_primary,
+            font=get_font(14),
             corner_radius=12,
             border_width=0,
         )
         self.chat_log.grid(row=1, column=0, sticky="nsew", padx=24)
-        self.chat_log.insert(
+        # Read-only via a <Key> break instead of state toggling, so inserts
+        # skip the two configure round-trips per message
+        self.chat_log.bind("<Key>", lambda e: "break")
+        # Precreate styling tags once on the underlying Text widget
+        self.chat_log._textbox.tag_configure("user", foreground=text_primary)
+        self.chat_log._textbox.tag_configure("agent", foreground=highlight)
+        self.chat_log._textbox.insert(
             "end",
             "🤖 Agent: Hi! I'll soon help craft bespoke tweets with AI. For now, this is a placeholder.\n",
+            "agent",
         )
-        self.chat_log.configure(state="disabled")
 
         input_frame = ctk.CTkFrame(chat_shell, fg_color="transparent")
         input_frame.grid(row=2, column=0, sticky="ew", padx=24, pady=(12, 24))
@@ -1075,9 +1324,9 @@ class AgentPosterPage(ctk.CTkFrame):
             input_frame,
             placeholder_text="Type your request...",
             height=44,
-            font=("Helvetica", 14),
-            fg_color=COLORS['primary'],
-            text_color=COLORS['text_primary'],
+            font=get_font(14),
+            fg_color=primary,
+            text_color=text_primary,
             corner_radius=12,
         )
         self.chat_entry.grid(row=0, column=0, sticky="ew", padx=(0, 12))
@@ -1087,25 +1336,33 @@ class AgentPosterPage(ctk.CTkFrame):
             if not msg:
                 return
             self.chat_entry.delete(0, "end")
-            self.chat_log.configure(state="normal")
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.chat_log.insert("end", f"🧑‍💻 You [{timestamp}]: {msg}\n")
-            self.chat_log.insert("end", "🤖 Agent: I'll handle this soon. Stay tuned!\n")
+            # time.strftime runs at C level without datetime object churn
+            timestamp = time.strftime(_TS_FMT)
+            # The widget stays state=normal (keystrokes are broken in the
+            # <Key> binding), so no configure calls are needed per message
+            text = self.chat_log._textbox
+            text.insert("end", f"🧑‍💻 You [{timestamp}]: {msg}\n", "user")
+            text.insert("end", "🤖 Agent: I'll handle this soon. Stay tuned!\n", "agent")
+            # Ring-buffer trim
+            lines = int(text.index("end-1c").split(".")[0])
+            if lines > LOG_MAX_LINES:
+                text.delete("1.0", f"{lines - LOG_MAX_LINES + 1}.0")
             self.chat_log.see("end")
-            self.chat_log.configure(state="disabled")
 
-        ctk.CTkButton(
+        _primary_button(
             input_frame,
             text="Send",
             width=110,
             height=44,
-            font=("Helvetica", 14, "bold"),
-            fg_color=COLORS['accent'],
-            hover_color=COLORS['highlight'],
+            font=get_font(14, "bold"),
             corner_radius=12,
             command=send_placeholder,
         ).grid(row=0, column=1)
 
+        # One explicit reflow at the end of the build instead of many
+        # implicit ones while widgets were being added
+        self.update_idletasks()
+
 
 if __name__ == "__main__":
     app = PizzaApp()
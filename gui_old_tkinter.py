@@ -12,18 +12,32 @@ Features:
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, scrolledtext
+from tkinter import messagebox, scrolledtext
+import asyncio
+import concurrent.futures
+import csv
+import json
+import random
+import sched
 import threading
-import calendar
+import time
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
+# Imported once at module load; the GUI degrades gracefully without PIL
+try:
+    from PIL import Image, ImageTk
+    _PIL_OK = True
+except ImportError:
+    _PIL_OK = False
+
 # Import backend modules
-from twitter_credentials import load_credentials
+from twitter_credentials import CREDENTIALS_FILE, load_credentials
 from twitter_utils import (
     get_api,
     compute_delay_seconds,
+    iter_tweets_from_file,
     read_tweets_from_file,
     compute_delay_to_month_day_time,
 )
@@ -33,8 +47,67 @@ from tweet import (
     schedule_tweet_in_month,
     bulk_post_from_file,
     auto_reply_to_mentions,
+    check_mentions_once,
+)
+from post_tweet import post_tweets_with_images
+
+# Static screen data hoisted to module level so screen builders don't
+# reallocate the lists per call
+_CRED_FIELDS = (
+    # (label, key, is_secret) — is_secret selects masked entry display
+    ("API Key", "api_key", False),
+    ("API Secret", "api_secret", True),
+    ("Access Token", "access_token", False),
+    ("Access Token Secret", "access_token_secret", True),
 )
 
+_MENU = (
+    ("Post a Tweet", "_show_post_interface"),
+    ("Schedule a Tweet", "_show_schedule_interface"),
+    ("Bulk Post from File", "_show_bulk_interface"),
+    ("Enable Auto-Reply Mode", "_show_auto_reply_interface"),
+    ("Exit", "_quit"),
+)
+
+
+def _digits_only(proposed):
+    """validatecommand helper: allow only empty or all-digit entry text."""
+    return proposed == "" or proposed.isdigit()
+
+
+# Bounded worker pool for bulk immediate posting; posting is latency-bound
+# network I/O, so a small fixed pool hides round-trips without spawning a
+# thread per tweet
+_POST_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="tweet"
+)
+
+
+def _delayed_post(msg, delay_seconds):
+    """Pool worker body: sleep out this tweet's stagger, then post it."""
+    if delay_seconds > 0:
+        time.sleep(delay_seconds)
+    post_tweet(msg)
+
+
+def _read_image_pairs(file_path):
+    """Return (text, image_path) pairs from a CSV with an image_path column.
+
+    Returns None when the file is not such a CSV, so callers can fall back
+    to the plain text-per-line bulk path.
+    """
+    if not file_path.lower().endswith(".csv"):
+        return None
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or "image_path" not in reader.fieldnames:
+            return None
+        return [
+            ((row.get("text") or "").strip(), (row.get("image_path") or "").strip())
+            for row in reader
+            if (row.get("text") or "").strip() and (row.get("image_path") or "").strip()
+        ]
+
 
 class PizzaAppGUI:
     def __init__(self, root):
@@ -53,8 +126,68 @@ class PizzaAppGUI:
         self.subtitle_color = "#8892a6"  # Muted text
         
         self.root.configure(bg=self.bg_color)
-        
-        # Check if credentials exist
+
+        # Fonts and widget option bundles built once; constructors splat
+        # these instead of re-creating literal tuples/dicts per widget
+        self._FONT_SMALL = ("Helvetica", 11)
+        self._FONT_LABEL = ("Helvetica", 12)
+        self._entry_opts = dict(
+            font=self._FONT_LABEL,
+            bg=self.button_color,
+            fg=self.text_color,
+            insertbackground=self.text_color,
+            relief="flat",
+            bd=0,
+        )
+
+        # One persistent asyncio loop in a daemon thread runs every
+        # long-running job; no per-job thread spawn, and completion
+        # callbacks are marshalled back to Tk via root.after
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+        # Decode and resize the logo once; screen builders reuse these
+        # PhotoImages instead of re-running PIL resample per navigation
+        self._logos = {}
+        if _PIL_OK:
+            # No separate exists() stat: a missing/broken file surfaces as
+            # an error from open() and the builders just skip the label
+            try:
+                img = Image.open("logo.png")
+                for size in (100, 60):
+                    self._logos[size] = ImageTk.PhotoImage(
+                        img.resize((size, size), Image.Resampling.LANCZOS)
+                    )
+            except Exception:
+                pass
+
+        # Screen stack: each screen is built once into a hidden Frame and
+        # shown with a pack swap instead of a full destroy+rebuild
+        self._screens = {}
+        self._screen_widgets = {}
+        self._current = None
+
+        # Handle on the running auto-reply task, for cancellation
+        self._autoreply_fut = None
+
+        # Single stdlib scheduler for bulk-scheduled tweets; one worker
+        # thread drains its heap no matter how many events are pending
+        self._sched = sched.scheduler(time.time, time.sleep)
+        self._sched_thread = None
+        self._bulk_events = []
+
+        # Reusable worker pool for one-shot background jobs, so each
+        # button press doesn't pay thread creation
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="pizza"
+        )
+
+        # Result of eagerly parsing the day-of-month schedule value; set by
+        # the sched_value trace so submit does no string work
+        self._parsed_sched = None
+
+        # Check if credentials exist (cached after the first load)
+        self._creds = None
         self.credentials_valid = self._check_credentials()
         
         if not self.credentials_valid:
@@ -63,21 +196,72 @@ class PizzaAppGUI:
             self._build_main_interface()
     
     def _check_credentials(self):
-        """Check if valid credentials are configured."""
+        """Check if valid credentials are configured.
+
+        The parsed credentials are cached in self._creds so repeated
+        checks don't re-read and re-validate on every screen change.
+        """
+        if self._creds is not None:
+            return True
         try:
-            load_credentials()
+            self._creds = load_credentials()
             return True
         except Exception:
             return False
     
+    def _make_button(self, parent, text, command, bg=None, hover=None,
+                     fg="white", font=None, height=50, width=None):
+        """Flat canvas-drawn button.
+
+        Hover mutates one rectangle fill instead of re-rendering a native
+        Button widget; the drawing is created once and only recoloured.
+        """
+        bg = bg or self.accent_color
+        hover = hover or "#E85A2B"
+        font = font or ("Helvetica", 14, "bold")
+        canvas = tk.Canvas(
+            parent,
+            height=height,
+            bg=self.card_color,
+            highlightthickness=0,
+            cursor="hand2",
+        )
+        if width is not None:
+            canvas.configure(width=width)
+        rect = canvas.create_rectangle(0, 0, width or 0, height, fill=bg, outline="")
+        label = canvas.create_text((width or 0) / 2, height / 2, text=text, fill=fg, font=font)
+
+        def _resize(event):
+            canvas.coords(rect, 0, 0, event.width, height)
+            canvas.coords(label, event.width / 2, height / 2)
+
+        canvas.bind("<Configure>", _resize)
+        canvas.bind("<Enter>", lambda e: canvas.itemconfig(rect, fill=hover))
+        canvas.bind("<Leave>", lambda e: canvas.itemconfig(rect, fill=bg))
+        canvas.bind("<Button-1>", lambda e: command())
+        return canvas
+
+    def _navigate(self, name):
+        """Show a prebuilt screen: O(1) pack swap, no widget teardown."""
+        if self._current is not None:
+            self._current.pack_forget()
+        screen = self._screens[name]
+        screen.pack(fill="both", expand=True)
+        self._current = screen
+
     def _show_credential_setup(self):
-        """Show credential input form with dark theme."""
-        # Clear window
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
+        """Show the credential input form, building it on first use."""
+        if "credentials" not in self._screens:
+            self._build_credential_screen()
+        self._navigate("credentials")
+
+    def _build_credential_screen(self):
+        """Build the credential form with dark theme."""
+        screen = tk.Frame(self.root, bg=self.bg_color)
+        self._screens["credentials"] = screen
+
         # Main container
-        main_container = tk.Frame(self.root, bg=self.bg_color)
+        main_container = tk.Frame(screen, bg=self.bg_color)
         main_container.pack(fill="both", expand=True, padx=40, pady=40)
         
         # Card container for form
@@ -88,18 +272,10 @@ class PizzaAppGUI:
         header = tk.Frame(card, bg=self.card_color)
         header.pack(pady=(40, 20))
         
-        # Try to load logo
-        try:
-            from PIL import Image, ImageTk
-            if os.path.exists("logo.png"):
-                logo_img = Image.open("logo.png")
-                logo_img = logo_img.resize((100, 100), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_img)
-                logo_label = tk.Label(header, image=logo_photo, bg=self.card_color)
-                logo_label.image = logo_photo
-                logo_label.pack(pady=(0, 20))
-        except Exception:
-            pass
+        # Reuse the logo decoded at startup (instance holds the strong ref)
+        photo = self._logos.get(100)
+        if photo is not None:
+            tk.Label(header, image=photo, bg=self.card_color).pack(pady=(0, 20))
         
         title = tk.Label(
             header,
@@ -135,94 +311,91 @@ class PizzaAppGUI:
         info_text.pack(pady=(0, 30))
         
         # Input fields
-        fields = [
-            ("API Key", "api_key"),
-            ("API Secret", "api_secret"),
-            ("Access Token", "access_token"),
-            ("Access Token Secret", "access_token_secret"),
-        ]
-        
         self.cred_entries = {}
-        
-        for label_text, field_name in fields:
+
+        for label_text, field_name, is_secret in _CRED_FIELDS:
             field_container = tk.Frame(form_frame, bg=self.card_color)
             field_container.pack(fill="x", pady=8)
             
             label = tk.Label(
                 field_container,
                 text=label_text,
-                font=("Helvetica", 11),
+                font=self._FONT_SMALL,
                 bg=self.card_color,
                 fg=self.text_color,
                 anchor="w",
             )
             label.pack(anchor="w", pady=(0, 5))
-            
+
             entry = tk.Entry(
                 field_container,
-                font=("Helvetica", 12),
-                bg=self.button_color,
-                fg=self.text_color,
-                insertbackground=self.text_color,
-                relief="flat",
-                show="*" if "secret" in field_name.lower() else "",
-                bd=0,
+                show="*" if is_secret else "",
+                **self._entry_opts,
             )
             entry.pack(fill="x", ipady=10, ipadx=10)
             self.cred_entries[field_name] = entry
         
         # Save button
-        save_btn = tk.Button(
+        save_btn = self._make_button(
             form_frame,
-            text="Save and Continue",
+            "Save and Continue",
+            self._save_credentials,
             font=("Helvetica", 13, "bold"),
-            bg=self.accent_color,
-            fg="white",
-            activebackground="#E85A2B",
-            activeforeground="white",
-            relief="flat",
-            cursor="hand2",
-            command=self._save_credentials,
-            bd=0,
         )
-        save_btn.pack(fill="x", pady=(30, 20), ipady=12)
+        save_btn.pack(fill="x", pady=(30, 20))
+
+        # The screen builds unmapped, so geometry requests queue up; flush
+        # them in one pass here rather than per-widget at first show
+        self.root.update_idletasks()
     
     def _save_credentials(self):
-        """Save credentials to twitter_credentials.py."""
+        """Save credentials to ~/.pizzaapp/credentials.json."""
         api_key = self.cred_entries["api_key"].get().strip()
         api_secret = self.cred_entries["api_secret"].get().strip()
         access_token = self.cred_entries["access_token"].get().strip()
         access_token_secret = self.cred_entries["access_token_secret"].get().strip()
-        
+
         if not all([api_key, api_secret, access_token, access_token_secret]):
             messagebox.showerror("Error", "All fields are required!")
             return
-        
-        # Write to twitter_credentials.py
-        creds_file = Path("twitter_credentials.py")
+
+        # Write the JSON sidecar (works in frozen builds, where the
+        # bundled twitter_credentials.py is not writable)
+        vals = {
+            "api_key": api_key,
+            "api_secret": api_secret,
+            "access_token": access_token,
+            "access_token_secret": access_token_secret,
+        }
         try:
-            content = creds_file.read_text()
-            # Replace placeholder values
-            content = content.replace('API_KEY: str = "YOUR_API_KEY"', f'API_KEY: str = "{api_key}"')
-            content = content.replace('API_SECRET: str = "YOUR_API_SECRET"', f'API_SECRET: str = "{api_secret}"')
-            content = content.replace('ACCESS_TOKEN: str = "YOUR_ACCESS_TOKEN"', f'ACCESS_TOKEN: str = "{access_token}"')
-            content = content.replace('ACCESS_TOKEN_SECRET: str = "YOUR_ACCESS_TOKEN_SECRET"', f'ACCESS_TOKEN_SECRET: str = "{access_token_secret}"')
-            creds_file.write_text(content)
-            
+            CREDENTIALS_FILE.parent.mkdir(exist_ok=True)
+            # Write to a temp file and atomically swap it in so a crash
+            # mid-write cannot corrupt the stored credentials
+            tmp = CREDENTIALS_FILE.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(vals, indent=4))
+            os.replace(tmp, CREDENTIALS_FILE)
+
             messagebox.showinfo("Success", "Credentials saved successfully!")
+            # Populate the cache from the entries; no reload needed
+            self._creds = (api_key, api_secret, access_token, access_token_secret)
             self.credentials_valid = True
             self._build_main_interface()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save credentials: {e}")
     
     def _build_main_interface(self):
+        """Show the main menu, building it on first use."""
+        if "main" not in self._screens:
+            self._build_main_screen()
+        self._navigate("main")
+
+    def _build_main_screen(self):
         """Build the main menu interface with dark theme."""
-        # Clear window
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
+        screen = tk.Frame(self.root, bg=self.bg_color)
+        self._screens["main"] = screen
+
         # Main container
-        main_container = tk.Frame(self.root, bg=self.bg_color)
+        main_container = tk.Frame(screen, bg=self.bg_color)
         main_container.pack(fill="both", expand=True)
         
         # Card container (centered dialog box)
@@ -236,18 +409,10 @@ class PizzaAppGUI:
         header = tk.Frame(card, bg=self.card_color)
         header.pack(fill="x", padx=30, pady=(30, 20))
         
-        # Try to load logo (small version for header)
-        try:
-            from PIL import Image, ImageTk
-            if os.path.exists("logo.png"):
-                logo_img = Image.open("logo.png")
-                logo_img = logo_img.resize((60, 60), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_img)
-                logo_label = tk.Label(header, image=logo_photo, bg=self.card_color)
-                logo_label.image = logo_photo
-                logo_label.pack(side="left", padx=(0, 15))
-        except Exception:
-            pass
+        # Reuse the small logo decoded at startup
+        photo = self._logos.get(60)
+        if photo is not None:
+            tk.Label(header, image=photo, bg=self.card_color).pack(side="left", padx=(0, 15))
         
         # Title
         title_frame = tk.Frame(header, bg=self.card_color)
@@ -273,53 +438,31 @@ class PizzaAppGUI:
             cursor="hand2",
         )
         close_btn.pack(side="right")
-        close_btn.bind("<Button-1>", lambda e: self.root.quit())
+        close_btn.bind("<Button-1>", self._on_quit)
         
         # Menu buttons container
         menu_frame = tk.Frame(card, bg=self.card_color)
         menu_frame.pack(padx=30, pady=(20, 30), fill="both")
         
-        # Menu buttons
-        buttons = [
-            ("Post a Tweet", self._show_post_interface),
-            ("Schedule a Tweet", self._show_schedule_interface),
-            ("Bulk Post from File", self._show_bulk_interface),
-            ("Enable Auto-Reply Mode", self._show_auto_reply_interface),
-            ("Exit", self.root.quit),
-        ]
-        
-        for btn_text, btn_command in buttons:
-            if btn_text == "Exit":
-                # Special styling for exit button
-                btn = tk.Button(
-                    menu_frame,
-                    text=btn_text,
-                    font=("Helvetica", 15),
-                    bg=self.button_color,
-                    fg=self.text_color,
-                    activebackground=self.button_hover,
-                    activeforeground=self.text_color,
-                    relief="flat",
-                    cursor="hand2",
-                    command=btn_command,
-                    bd=0,
-                )
-                btn.pack(fill="x", pady=(30, 0), ipady=15)
-            else:
-                btn = tk.Button(
-                    menu_frame,
-                    text=btn_text,
-                    font=("Helvetica", 15),
-                    bg=self.button_color,
-                    fg=self.text_color,
-                    activebackground=self.button_hover,
-                    activeforeground=self.text_color,
-                    relief="flat",
-                    cursor="hand2",
-                    command=btn_command,
-                    bd=0,
-                )
-                btn.pack(fill="x", pady=(0, 12), ipady=15)
+        # Menu buttons from the static module-level table; one constructor
+        # path, only the Exit button's spacing differs
+        for btn_text, method_name in _MENU:
+            btn = self._make_button(
+                menu_frame,
+                btn_text,
+                getattr(self, method_name),
+                bg=self.button_color,
+                hover=self.button_hover,
+                fg=self.text_color,
+                font=("Helvetica", 15),
+                height=55,
+                width=360,
+            )
+            pady = (30, 0) if btn_text == "Exit" else (0, 12)
+            btn.pack(fill="x", pady=pady)
+
+        # Flush the queued geometry work in one pass (screen is unmapped)
+        self.root.update_idletasks()
     
     def _show_post_interface(self):
         """Show the post tweet interface."""
@@ -338,7 +481,7 @@ class PizzaAppGUI:
             title="Schedule a Tweet",
             inputs=[
                 {"label": "Tweet message", "type": "text", "key": "message", "height": 5},
-                {"label": "Schedule type", "type": "choice", "key": "sched_type", 
+                {"label": "Schedule type", "type": "radio", "key": "sched_type",
                  "options": ["Minutes from now", "Today at time (HH:MM)", "Day of month"]},
                 {"label": "Value (minutes/HH:MM/day+time)", "type": "entry", "key": "sched_value"}
             ],
@@ -367,17 +510,25 @@ class PizzaAppGUI:
                 {"label": "Reply message", "type": "text", "key": "reply", "height": 4}
             ],
             button_text="Start Auto-Reply",
-            action=self._execute_auto_reply
+            action=self._execute_auto_reply,
+            secondary=("Stop Auto-Reply", self._stop_auto_reply),
         )
     
-    def _show_operation_screen(self, title, inputs, button_text, action):
+    def _show_operation_screen(self, title, inputs, button_text, action, secondary=None):
+        """Show a generic operation screen, building it on first use."""
+        if title not in self._screens:
+            self._build_operation_screen(title, inputs, button_text, action, secondary)
+        # Point the execute handlers at this screen's widgets
+        self.operation_widgets = self._screen_widgets[title]
+        self._navigate(title)
+
+    def _build_operation_screen(self, title, inputs, button_text, action, secondary=None):
         """Generic operation screen builder."""
-        # Clear window
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
+        screen = tk.Frame(self.root, bg=self.bg_color)
+        self._screens[title] = screen
+
         # Main container
-        main_container = tk.Frame(self.root, bg=self.bg_color)
+        main_container = tk.Frame(screen, bg=self.bg_color)
         main_container.pack(fill="both", expand=True, padx=40, pady=40)
         
         # Card
@@ -398,7 +549,7 @@ class PizzaAppGUI:
             cursor="hand2",
         )
         back_btn.pack(anchor="w")
-        back_btn.bind("<Button-1>", lambda e: self._build_main_interface())
+        back_btn.bind("<Button-1>", self._on_back)
         
         # Title
         title_label = tk.Label(
@@ -414,9 +565,9 @@ class PizzaAppGUI:
         form_frame = tk.Frame(card, bg=self.card_color)
         form_frame.pack(padx=40, pady=20, fill="both", expand=True)
         
-        # Store widget references
-        self.operation_widgets = {}
-        
+        # Store widget references per screen so cached screens keep their own
+        widgets = self._screen_widgets[title] = {}
+
         for inp in inputs:
             field_container = tk.Frame(form_frame, bg=self.card_color)
             field_container.pack(fill="x", pady=10)
@@ -424,97 +575,132 @@ class PizzaAppGUI:
             label = tk.Label(
                 field_container,
                 text=inp["label"],
-                font=("Helvetica", 12),
+                font=self._FONT_LABEL,
                 bg=self.card_color,
                 fg=self.text_color,
                 anchor="w",
             )
             label.pack(anchor="w", pady=(0, 8))
-            
+
             if inp["type"] == "text":
-                widget = scrolledtext.ScrolledText(
-                    field_container,
+                # Plain Text + Scrollbar: cheaper to construct than the
+                # ScrolledText wrapper with its attribute-proxy frame
+                text_frame = tk.Frame(field_container, bg=self.card_color)
+                text_frame.pack(fill="both", padx=2, pady=2)
+                widget = tk.Text(
+                    text_frame,
                     height=inp.get("height", 5),
-                    font=("Helvetica", 12),
-                    bg=self.button_color,
-                    fg=self.text_color,
-                    insertbackground=self.text_color,
-                    relief="flat",
                     wrap="word",
-                    bd=0,
+                    **self._entry_opts,
                 )
-                widget.pack(fill="both", padx=2, pady=2)
+                sb = tk.Scrollbar(text_frame, command=widget.yview)
+                widget.configure(yscrollcommand=sb.set)
+                widget.pack(side="left", fill="both", expand=True)
+                sb.pack(side="right", fill="y")
             elif inp["type"] == "entry":
-                widget = tk.Entry(
-                    field_container,
-                    font=("Helvetica", 12),
-                    bg=self.button_color,
-                    fg=self.text_color,
-                    insertbackground=self.text_color,
-                    relief="flat",
-                    bd=0,
-                )
-                widget.pack(fill="x", ipady=10, ipadx=10)
+                var = tk.StringVar()
+                entry_kw = dict(self._entry_opts, textvariable=var)
+                if inp["key"] in ("delay", "interval"):
+                    # Reject non-digit keystrokes at the Tcl level so the
+                    # executors never see bad integer input
+                    vcmd = (self.root.register(_digits_only), "%P")
+                    entry_kw.update(validate="key", validatecommand=vcmd)
+                entry = tk.Entry(field_container, **entry_kw)
+                entry.pack(fill="x", ipady=10, ipadx=10)
+                if inp["key"] == "sched_value":
+                    # Parse while the user types; submit just reads the result
+                    var.trace_add("write", lambda *_args, v=var: self._parse_sched_value(v))
+                # Handlers read the variable: one Tcl round trip per submit
+                widget = var
             elif inp["type"] == "file":
                 file_frame = tk.Frame(field_container, bg=self.card_color)
                 file_frame.pack(fill="x")
-                
+
                 widget = tk.Entry(
                     file_frame,
-                    font=("Helvetica", 11),
-                    bg=self.button_color,
-                    fg=self.text_color,
-                    insertbackground=self.text_color,
-                    relief="flat",
-                    state="readonly",
-                    bd=0,
+                    **dict(self._entry_opts, font=self._FONT_SMALL, state="readonly"),
                 )
                 widget.pack(side="left", fill="x", expand=True, ipady=8, ipadx=10)
                 
-                browse_btn = tk.Button(
+                self._file_entry = widget
+                browse_btn = self._make_button(
                     file_frame,
-                    text="Browse",
-                    font=("Helvetica", 11),
+                    "Browse",
+                    self._on_browse,
                     bg=self.button_hover,
+                    hover=self.accent_color,
                     fg=self.text_color,
-                    activebackground=self.accent_color,
-                    activeforeground="white",
-                    relief="flat",
-                    cursor="hand2",
-                    command=lambda w=widget: self._browse_file_for_widget(w),
-                    bd=0,
-                )
-                browse_btn.pack(side="left", padx=(10, 0), ipady=8, ipadx=15)
-            elif inp["type"] == "choice":
-                widget = ttk.Combobox(
-                    field_container,
-                    values=inp["options"],
-                    font=("Helvetica", 11),
-                    state="readonly",
+                    font=self._FONT_SMALL,
+                    height=36,
+                    width=100,
                 )
-                widget.set(inp["options"][0])
-                widget.pack(fill="x", ipady=5)
+                browse_btn.pack(side="left", padx=(10, 0))
+            elif inp["type"] == "radio":
+                # Plain radio buttons: no ttk theme engine or popdown
+                # window for three static options
+                var = tk.StringVar(value=inp["options"][0])
+                radio_frame = tk.Frame(field_container, bg=self.card_color)
+                radio_frame.pack(fill="x")
+                for option in inp["options"]:
+                    tk.Radiobutton(
+                        radio_frame,
+                        text=option,
+                        variable=var,
+                        value=option,
+                        font=self._FONT_SMALL,
+                        bg=self.card_color,
+                        fg=self.text_color,
+                        selectcolor=self.button_color,
+                        activebackground=self.card_color,
+                        activeforeground=self.text_color,
+                    ).pack(anchor="w", pady=2)
+                widget = var
             
-            self.operation_widgets[inp["key"]] = widget
+            widgets[inp["key"]] = widget
         
         # Action button
-        action_btn = tk.Button(
-            card,
-            text=button_text,
-            font=("Helvetica", 14, "bold"),
-            bg=self.accent_color,
-            fg="white",
-            activebackground="#E85A2B",
-            activeforeground="white",
-            relief="flat",
-            cursor="hand2",
-            command=action,
-            bd=0,
-        )
-        action_btn.pack(fill="x", padx=40, pady=(20, 30), ipady=12)
+        action_btn = self._make_button(card, button_text, action)
+        pady = (20, 30) if secondary is None else (20, 12)
+        action_btn.pack(fill="x", padx=40, pady=pady)
+
+        if secondary is not None:
+            sec_text, sec_command = secondary
+            sec_btn = self._make_button(
+                card,
+                sec_text,
+                sec_command,
+                bg=self.button_color,
+                hover=self.button_hover,
+                fg=self.text_color,
+            )
+            sec_btn.pack(fill="x", padx=40, pady=(0, 30))
+
+        # Flush the queued geometry work in one pass (screen is unmapped)
+        self.root.update_idletasks()
     
+    # Named handlers: bound methods instead of per-build lambda closures
+    def _on_back(self, _event):
+        """Back link: return to the main menu."""
+        self._build_main_interface()
+
+    def _on_quit(self, _event):
+        """Close button: quit the application."""
+        self._quit()
+
+    def _quit(self):
+        """Exit menu entry: quit the application."""
+        self._pool.shutdown(wait=False)
+        self.root.quit()
+
+    def _on_browse(self):
+        """Browse button: pick a file into the operation file entry."""
+        self._browse_file_for_widget(self._file_entry)
+
     def _browse_file_for_widget(self, widget):
         """Browse for file and update widget."""
+        # Deferred: the dialog module is only needed if Browse is clicked
+        from tkinter import filedialog
+
         filename = filedialog.askopenfilename(
             title="Select file",
             filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"), ("All files", "*.*")],
@@ -539,6 +725,16 @@ class PizzaAppGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to post tweet:\n{e}")
     
+    def _parse_sched_value(self, var):
+        """Eagerly parse a "<day> <HH:MM>" schedule value as it is typed."""
+        self._parsed_sched = None
+        parts = var.get().split()
+        if len(parts) == 2:
+            try:
+                self._parsed_sched = (int(parts[0]), parts[1])
+            except ValueError:
+                pass
+
     def _execute_schedule(self):
         """Execute scheduled tweet."""
         message = self.operation_widgets["message"].get("1.0", "end-1c").strip()
@@ -561,12 +757,11 @@ class PizzaAppGUI:
                 schedule_tweet(message, time_hhmm=value)
                 messagebox.showinfo("Success", f"Tweet scheduled for today at {value}!")
             else:  # Day of month
-                parts = value.split()
-                if len(parts) != 2:
+                # Parsed eagerly by the sched_value trace while typing
+                if self._parsed_sched is None:
                     messagebox.showerror("Error", "Format: <day> <HH:MM> (e.g., 25 14:30)")
                     return
-                day = int(parts[0])
-                time_str = parts[1]
+                day, time_str = self._parsed_sched
                 now = datetime.now()
                 schedule_tweet_in_month(message, now.year, now.month, day, time_str)
                 messagebox.showinfo("Success", f"Tweet scheduled for day {day} at {time_str}!")
@@ -578,7 +773,7 @@ class PizzaAppGUI:
     def _execute_bulk(self):
         """Execute bulk posting."""
         file_path = self.operation_widgets["file_path"].get()
-        delay_str = self.operation_widgets["delay"].get().strip()
+        delay_str = self.operation_widgets["delay"].get()  # digits-only by validation
         
         if not file_path:
             messagebox.showerror("Error", "Please select a file!")
@@ -589,25 +784,47 @@ class PizzaAppGUI:
         
         try:
             delay = int(delay_str)
-            
-            def run():
-                try:
-                    bulk_post_from_file(file_path, delay)
-                    messagebox.showinfo("Success", "Bulk posting completed!")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Bulk posting failed:\n{e}")
-            
-            threading.Thread(target=run, daemon=True).start()
-            messagebox.showinfo("Started", "Bulk posting started in background!")
-            self._build_main_interface()
         except ValueError:
             messagebox.showerror("Error", "Delay must be a number!")
+            return
+
+        try:
+            self._run_job(self._bulk_job(file_path, delay), self._on_bulk_done)
+            messagebox.showinfo("Started", "Bulk posting started in background!")
+            self._build_main_interface()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start bulk posting:\n{e}")
-    
+
+    async def _bulk_job(self, file_path, delay):
+        """Run the blocking bulk backend in the loop's executor."""
+        await self._loop.run_in_executor(None, bulk_post_from_file, file_path, delay)
+
+    def _on_bulk_done(self, fut):
+        """Report bulk completion; runs on the Tk thread."""
+        exc = fut.exception()
+        if exc is None:
+            messagebox.showinfo("Success", "Bulk posting completed!")
+        else:
+            messagebox.showerror("Error", f"Bulk posting failed:\n{exc}")
+
+    def _run_job(self, coro, on_done):
+        """Submit a coroutine to the background loop.
+
+        The finished future is handed to on_done via root.after so all
+        messagebox calls stay on the Tk thread. Returns the future so
+        callers can keep a cancellation handle.
+        """
+        fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        fut.add_done_callback(lambda f: self.root.after(0, on_done, f))
+        return fut
+
+    def _ui(self, fn):
+        """Marshal fn onto the Tk thread; safe to call from worker threads."""
+        self.root.after(0, fn)
+
     def _execute_auto_reply(self):
         """Execute auto-reply mode."""
-        interval_str = self.operation_widgets["interval"].get().strip()
+        interval_str = self.operation_widgets["interval"].get()  # digits-only by validation
         reply = self.operation_widgets["reply"].get("1.0", "end-1c").strip()
         
         if not interval_str:
@@ -619,20 +836,48 @@ class PizzaAppGUI:
         
         try:
             interval = int(interval_str)
-            
-            def run():
-                try:
-                    auto_reply_to_mentions(interval, reply)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Auto-reply error:\n{e}")
-            
-            threading.Thread(target=run, daemon=True).start()
-            messagebox.showinfo("Started", "Auto-reply mode started! Press Ctrl+C in terminal to stop.")
-            self._build_main_interface()
         except ValueError:
             messagebox.showerror("Error", "Interval must be a number!")
+            return
+
+        if self._autoreply_fut is not None:
+            messagebox.showinfo("Info", "Auto-reply is already running.")
+            return
+
+        try:
+            self._autoreply_fut = self._run_job(
+                self._auto_reply_job(interval, reply), self._on_auto_reply_done
+            )
+            messagebox.showinfo("Started", "Auto-reply mode started!")
+            self._build_main_interface()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start auto-reply:\n{e}")
+
+    async def _auto_reply_job(self, interval, reply):
+        """Poll mentions on the shared loop; cancellable between cycles."""
+        api = await self._loop.run_in_executor(None, get_api)
+        delay = max(1, int(interval)) * 60
+        while True:
+            await self._loop.run_in_executor(None, check_mentions_once, api, reply)
+            # +/-10% jitter de-syncs multiple clients polling one account
+            await asyncio.sleep(delay + random.uniform(-0.1 * delay, 0.1 * delay))
+
+    def _stop_auto_reply(self):
+        """Cancel the running auto-reply task, if any."""
+        if self._autoreply_fut is None:
+            messagebox.showinfo("Info", "Auto-reply is not running.")
+            return
+        self._autoreply_fut.cancel()
+
+    def _on_auto_reply_done(self, fut):
+        """Report how auto-reply ended; runs on the Tk thread."""
+        self._autoreply_fut = None
+        if fut.cancelled():
+            messagebox.showinfo("Stopped", "Auto-reply stopped.")
+            return
+        exc = fut.exception()
+        if exc is not None:
+            messagebox.showerror("Error", f"Auto-reply error:\n{exc}")
     
 
     
@@ -945,6 +1190,8 @@ class PizzaAppGUI:
     
     def _browse_file(self):
         """Open file browser for bulk file selection."""
+        from tkinter import filedialog
+
         filename = filedialog.askopenfilename(
             title="Select tweets file",
             filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"), ("All files", "*.*")],
@@ -966,27 +1213,89 @@ class PizzaAppGUI:
             return
         
         operation = self.bulk_operation.get()
-        
-        def run_bulk():
+
+        # All StringVar reads happen above, at click time on the Tk
+        # thread; the worker receives plain Python values so it never
+        # touches the Tcl interpreter
+        def run_bulk(file_path, delay, operation):
             try:
+                pairs = (
+                    _read_image_pairs(file_path) if operation == "immediate" else None
+                )
+                # Fail fast: scan lengths before any network I/O so one bad
+                # line late in the file cannot waste a batch of API calls
+                texts = (
+                    (t for t, _ in pairs)
+                    if pairs is not None
+                    else iter_tweets_from_file(file_path)
+                )
+                bad = [(i + 1, len(t)) for i, t in enumerate(texts) if len(t) > 280]
+                if bad:
+                    self._ui(
+                        lambda b=bad: messagebox.showerror(
+                            "Error",
+                            f"{len(b)} tweets exceed 280 characters (lines "
+                            + ", ".join(str(i) for i, _ in b[:5])
+                            + "); nothing was posted.",
+                        )
+                    )
+                    return
                 if operation == "immediate":
-                    bulk_post_from_file(file_path, delay)
-                    messagebox.showinfo("Success", "Bulk posting completed!")
+                    if pairs is not None:
+                        post_tweets_with_images(pairs)
+                    else:
+                        tweets = read_tweets_from_file(file_path)
+                        futures = [
+                            _POST_POOL.submit(_delayed_post, msg, i * delay * 60)
+                            for i, msg in enumerate(tweets)
+                        ]
+                        concurrent.futures.wait(futures)
+                    self._ui(
+                        lambda: messagebox.showinfo(
+                            "Success", "Bulk posting completed!"
+                        )
+                    )
                 else:
-                    # Schedule all tweets with frequency
-                    tweets = read_tweets_from_file(file_path)
-                    for i, msg in enumerate(tweets):
-                        seconds = i * delay * 60
-                        threading.Timer(seconds, lambda m=msg: post_tweet(m)).start()
-                    messagebox.showinfo(
-                        "Success",
-                        f"Scheduled {len(tweets)} tweets with {delay} min frequency!",
+                    # Schedule all tweets with frequency on the shared
+                    # sched.scheduler instead of a sleeping Timer thread
+                    # per tweet; stream the file so it is never held
+                    # fully in memory
+                    step = delay * 60
+                    events = [
+                        self._sched.enter(i * step, 1, post_tweet, (msg,))
+                        for i, msg in enumerate(iter_tweets_from_file(file_path))
+                    ]
+                    self._bulk_events = events
+                    count = len(events)
+                    if self._sched_thread is None or not self._sched_thread.is_alive():
+                        self._sched_thread = threading.Thread(
+                            target=self._sched.run, daemon=True
+                        )
+                        self._sched_thread.start()
+                    self._ui(
+                        lambda n=count: messagebox.showinfo(
+                            "Success",
+                            f"Scheduled {n} tweets with {delay} min frequency!",
+                        )
                     )
             except Exception as e:
-                messagebox.showerror("Error", f"Bulk operation failed:\n{e}")
+                self._ui(
+                    lambda e=e: messagebox.showerror(
+                        "Error", f"Bulk operation failed:\n{e}"
+                    )
+                )
         
-        threading.Thread(target=run_bulk, daemon=True).start()
-    
+        self._pool.submit(run_bulk, file_path, delay, operation)
+
+    def _cancel_bulk(self):
+        """Cancel any bulk-scheduled tweets that have not fired yet."""
+        for event in self._bulk_events:
+            try:
+                self._sched.cancel(event)
+            except ValueError:
+                pass  # already fired
+        self._bulk_events = []
+
     def _create_auto_reply_tab(self):
         """Create auto-reply tab."""
         frame = tk.Frame(self.notebook, bg=self.bg_color)
@@ -1035,7 +1344,7 @@ class PizzaAppGUI:
         self.reply_message.pack(fill="both", pady=(5, 20))
         
         self.reply_active = False
-        self.reply_thread = None
+        self.reply_future = None
         
         self.reply_btn = tk.Button(
             content,
@@ -1080,13 +1389,16 @@ class PizzaAppGUI:
                     try:
                         auto_reply_to_mentions(interval, message)
                     except Exception as e:
-                        messagebox.showerror("Error", f"Auto-reply error:\n{e}")
                         self.reply_active = False
-                        self.reply_btn.config(text="Start Auto-Reply", bg=self.button_color)
-                        self.reply_status.config(text="Status: Inactive", fg="#666666")
+
+                        def report(e=e):
+                            messagebox.showerror("Error", f"Auto-reply error:\n{e}")
+                            self.reply_btn.config(text="Start Auto-Reply", bg=self.button_color)
+                            self.reply_status.config(text="Status: Inactive", fg="#666666")
+
+                        self._ui(report)
                 
-                self.reply_thread = threading.Thread(target=run_auto_reply, daemon=True)
-                self.reply_thread.start()
+                self.reply_future = self._pool.submit(run_auto_reply)
             except ValueError:
                 messagebox.showerror("Error", "Interval must be a number!")
         else:
@@ -1159,14 +1471,18 @@ class PizzaAppGUI:
 
 def main():
     """Launch the GUI application."""
-    # Generate logo if it doesn't exist
-    if not os.path.exists("logo.png"):
+    # Generate the logo at most once per install; the stamp file keeps
+    # warm launches down to a single stat() with no generate_logo import
+    logo_stamp = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".logo_ok")
+    if not os.path.exists(logo_stamp):
         try:
             from generate_logo import create_pizza_logo
             create_pizza_logo()
         except Exception as e:
             print(f"Could not generate logo: {e}")
-    
+        else:
+            open(logo_stamp, "w").close()
+
     root = tk.Tk()
     app = PizzaAppGUI(root)
     root.mainloop()
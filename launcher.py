@@ -5,27 +5,54 @@ This launches the customtkinter GUI while keeping tweet.py as backend.
 Usage:
     python3 launcher.py
 """
+import logging
+import logging.handlers
 import os, sys
-print("=== DEBUG START ===")
-print("Current working dir:", os.getcwd())
-print("Launcher file path:", __file__)
-print("sys.path BEFORE:", sys.path[:3])
+import queue
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, BASE_DIR)
-print("sys.path AFTER:", sys.path[:3])
-print("Looking for gui.py in:", os.path.join(BASE_DIR, "gui.py"))
-print("Exists:", os.path.exists(os.path.join(BASE_DIR, "gui.py")))
-print("=== DEBUG END ===")
 
-import sys
+
+def _setup_logging():
+    """Route log records through a queue so worker threads never block on I/O.
+
+    Returns the QueueListener so the caller can keep it alive.
+    """
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(name)s %(levelname)s: %(message)s")
+    )
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    return listener
+
+# Startup diagnostics; opt-in so the common path does no extra stat()
+# calls or stdout writes
+if os.environ.get("PIZZA_DEBUG"):
+    print("=== DEBUG START ===")
+    print("Current working dir:", os.getcwd())
+    print("Launcher file path:", __file__)
+    print("sys.path:", sys.path[:3])
+    print("Looking for gui.py in:", os.path.join(BASE_DIR, "gui.py"))
+    print("Exists:", os.path.exists(os.path.join(BASE_DIR, "gui.py")))
+    print("=== DEBUG END ===")
+
 from gui import PizzaApp
-print("✅ launcher running from:", __file__)
-print("✅ gui module location:", PizzaApp.__module__)
+
+if os.environ.get("PIZZA_DEBUG"):
+    print("✅ launcher running from:", __file__)
+    print("✅ gui module location:", PizzaApp.__module__)
 
 
 
 def main():
     """Launch the PizzaApp GUI."""
+    listener = _setup_logging()
     try:
         app = PizzaApp()
         app.mainloop()
@@ -35,6 +62,8 @@ def main():
     except Exception as e:
         print(f"❌ Error launching PizzaApp: {e}")
         sys.exit(1)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -10,42 +10,101 @@ Usage:
 2. Run: python post_tweet.py
 """
 
+import logging
 import os
-import tweepy
+import random
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
 from dotenv import load_dotenv
 
+log = logging.getLogger(__name__)
+
+# tweepy pulls in requests/urllib3/oauthlib — hundreds of ms on a cold
+# start — so it is imported lazily on first client use rather than here
+tweepy = None
+
+
+def _import_tweepy():
+    """Load the tweepy module on first use, caching it in the global."""
+    global tweepy
+    if tweepy is None:
+        import tweepy as _tweepy
+        tweepy = _tweepy
+    return tweepy
+
 # Load environment variables
 load_dotenv()
 
-# Load credentials from .env
-API_KEY = os.getenv("API_KEY")
-API_SECRET = os.getenv("API_SECRET")
-ACCESS_TOKEN = os.getenv("ACCESS_TOKEN")
-ACCESS_TOKEN_SECRET = os.getenv("ACCESS_TOKEN_SECRET")
+# Read credentials from .env exactly once; _CREDS_OK is precomputed so
+# check_credentials is a constant-time no-op on the hot path
+_CREDS = types.SimpleNamespace(
+    API_KEY=os.getenv("API_KEY"),
+    API_SECRET=os.getenv("API_SECRET"),
+    ACCESS_TOKEN=os.getenv("ACCESS_TOKEN"),
+    ACCESS_TOKEN_SECRET=os.getenv("ACCESS_TOKEN_SECRET"),
+)
+_REQ = tuple(vars(_CREDS).items())
+_CREDS_OK = all(v for _, v in _REQ)
+
+# Kept as module globals for existing importers
+API_KEY = _CREDS.API_KEY
+API_SECRET = _CREDS.API_SECRET
+ACCESS_TOKEN = _CREDS.ACCESS_TOKEN
+ACCESS_TOKEN_SECRET = _CREDS.ACCESS_TOKEN_SECRET
 
 def check_credentials():
     """Check if all required credentials are provided."""
-    missing = []
-    if not API_KEY:
-        missing.append("API_KEY")
-    if not API_SECRET:
-        missing.append("API_SECRET")
-    if not ACCESS_TOKEN:
-        missing.append("ACCESS_TOKEN")
-    if not ACCESS_TOKEN_SECRET:
-        missing.append("ACCESS_TOKEN_SECRET")
-    if missing:
-        raise ValueError(f"Missing credentials in .env: {', '.join(missing)}")
+    if _CREDS_OK:
+        return
+    missing = [name for name, value in _REQ if not value]
+    raise ValueError(f"Missing credentials in .env: {', '.join(missing)}")
+
+# Memoized clients; tweepy uses a requests.Session internally, so reusing
+# one client reuses its HTTPS connection pool across tweets
+_CLIENT = None
+_API_V1 = None
+_LOCK = threading.Lock()
 
 def get_client():
-    """Create and return Twitter API v2 client."""
-    check_credentials()
-    return tweepy.Client(
-        consumer_key=API_KEY,
-        consumer_secret=API_SECRET,
-        access_token=ACCESS_TOKEN,
-        access_token_secret=ACCESS_TOKEN_SECRET
-    )
+    """Return the shared Twitter API v2 client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _LOCK:
+            if _CLIENT is None:
+                _import_tweepy()
+                check_credentials()
+                _CLIENT = tweepy.Client(
+                    consumer_key=API_KEY,
+                    consumer_secret=API_SECRET,
+                    access_token=ACCESS_TOKEN,
+                    access_token_secret=ACCESS_TOKEN_SECRET,
+                    wait_on_rate_limit=True
+                )
+                # Widen the session's connection pool so the 8-worker
+                # bulk executor never blocks waiting for a free socket
+                import requests.adapters
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=16, pool_maxsize=16
+                )
+                _CLIENT.session.mount("https://", adapter)
+    return _CLIENT
+
+def get_api_v1():
+    """Return the shared v1.1 API handle (media uploads), creating it on first use."""
+    global _API_V1
+    if _API_V1 is None:
+        with _LOCK:
+            if _API_V1 is None:
+                _import_tweepy()
+                check_credentials()
+                auth = tweepy.OAuth1UserHandler(
+                    API_KEY, API_SECRET, ACCESS_TOKEN, ACCESS_TOKEN_SECRET
+                )
+                _API_V1 = tweepy.API(auth)
+    return _API_V1
 
 def post_tweet(text):
     """
@@ -57,22 +116,28 @@ def post_tweet(text):
     Returns:
         dict: Response containing tweet data, or None if failed
     """
-    try:
-        client = get_client()
-        response = client.create_tweet(text=text)
-
-        tweet_id = response.data["id"]
-        tweet_url = f"https://x.com/i/status/{tweet_id}"
-
-        print("✅ Tweet posted successfully!")
-        print(f"📝 Tweet ID: {tweet_id}")
-        print(f"🔗 Tweet URL: {tweet_url}")
-
-        return response.data
-
-    except tweepy.TweepyException as e:
-        print(f"❌ Failed to post tweet: {e}")
-        return None
+    client = get_client()
+
+    # Retry transient failures with jittered exponential backoff so a 503
+    # or rate-limit blip doesn't silently drop tweets mid-batch
+    for attempt in range(4):
+        try:
+            response = client.create_tweet(text=text)
+        except tweepy.TooManyRequests:
+            time.sleep(15 * (2 ** attempt) * random.uniform(0.8, 1.2))
+        except tweepy.TwitterServerError:
+            time.sleep((2 ** attempt) * random.uniform(0.8, 1.2))
+        except tweepy.TweepyException as e:
+            log.error("Failed to post tweet: %s", e)
+            return None
+        else:
+            tweet_id = response.data["id"]
+            tweet_url = f"https://x.com/i/status/{tweet_id}"
+            log.info("Tweet %s posted: %s", tweet_id, tweet_url)
+            return response.data
+
+    log.error("Failed to post tweet after retries: %r", text)
+    return None
 
 def post_tweet_with_image(text, image_path):
     """
@@ -87,10 +152,7 @@ def post_tweet_with_image(text, image_path):
     """
     try:
         # First upload the media using v1.1 API
-        auth = tweepy.OAuth1UserHandler(
-            API_KEY, API_SECRET, ACCESS_TOKEN, ACCESS_TOKEN_SECRET
-        )
-        api = tweepy.API(auth)
+        api = get_api_v1()
         media = api.media_upload(image_path)
         media_id = media.media_id
 
@@ -101,19 +163,60 @@ def post_tweet_with_image(text, image_path):
         tweet_id = response.data["id"]
         tweet_url = f"https://x.com/i/status/{tweet_id}"
 
-        print("✅ Tweet with image posted successfully!")
-        print(f"📝 Tweet ID: {tweet_id}")
-        print(f"🔗 Tweet URL: {tweet_url}")
+        log.info("Tweet %s with image posted: %s", tweet_id, tweet_url)
 
         return response.data
 
     except tweepy.TweepyException as e:
-        print(f"❌ Failed to post tweet with image: {e}")
+        log.error("Failed to post tweet with image: %s", e)
         return None
     except FileNotFoundError:
-        print(f"❌ Image file not found: {image_path}")
+        log.error("Image file not found: %s", image_path)
         return None
 
+def post_tweets_with_images(pairs):
+    """
+    Post several tweets with attached images, sharing one client.
+
+    Media uploads and tweet creation run through a thread pool against the
+    memoized v1.1 API and v2 client, so the whole batch reuses the same
+    HTTPS connections instead of re-authenticating per image.
+
+    Args:
+        pairs: Iterable of (text, image_path) tuples
+
+    Returns:
+        list: Tweet data per pair, with None for entries that failed
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return []
+
+    api = get_api_v1()
+    client = get_client()
+
+    def upload(pair):
+        try:
+            return api.media_upload(pair[1]).media_id
+        except (tweepy.TweepyException, FileNotFoundError) as e:
+            log.error("Failed to upload %s: %s", pair[1], e)
+            return None
+
+    def send(text, media_id):
+        if media_id is None:
+            return None
+        try:
+            response = client.create_tweet(text=text, media_ids=[media_id])
+            log.info("Tweet posted: %s", response.data["id"])
+            return response.data
+        except tweepy.TweepyException as e:
+            log.error("Failed to post tweet: %s", e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        media_ids = list(ex.map(upload, pairs))
+        return list(ex.map(send, (t for t, _ in pairs), media_ids))
+
 # Example usage
 if __name__ == "__main__":
     # Test posting a text tweet
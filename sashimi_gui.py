@@ -14,16 +14,69 @@ print("🍣 Running SashimiApp from:", BASE_DIR)
 
 # Required imports
 from pathlib import Path
+from types import MappingProxyType
 import json
-import re
 import threading
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
 from datetime import datetime
 import time
 
+# Optional fast JSON codec; the C-backed orjson beats the stdlib's
+# pure-Python indented encoder, with json as the fallback
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
+# Optional PIL for pre-rendered emoji icons; text glyphs remain the fallback
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = None
+
+# Platform emoji font for icon rasterization
+_EMOJI_FONT = {
+    'win32': 'seguiemj.ttf',
+    'darwin': '/System/Library/Fonts/Apple Color Emoji.ttc',
+}.get(sys.platform, 'NotoColorEmoji.ttf')
+
+_ICON_CACHE = {}
+
+
+def _emoji_icon(ch, size):
+    """Rasterize an emoji glyph once and reuse the bitmap thereafter.
+
+    A cached CTkImage gets blitted on each repaint instead of Tk
+    re-rasterizing the color glyph run; returns None when PIL or the
+    emoji font is unavailable so callers can fall back to plain text.
+    """
+    key = (ch, size)
+    if key not in _ICON_CACHE:
+        img = None
+        if Image is not None:
+            try:
+                font = ImageFont.truetype(_EMOJI_FONT, size)
+                im = Image.new("RGBA", (size, size))
+                ImageDraw.Draw(im).text((0, 0), ch, font=font, embedded_color=True)
+                img = ctk.CTkImage(light_image=im, size=(size, size))
+            except OSError:
+                pass
+        _ICON_CACHE[key] = img
+    return _ICON_CACHE[key]
+
 # Beautiful Sashimi-inspired color palette
-SASHIMI_COLORS = {
+_RAW_COLORS = {
     'primary': '#ffffff',             # Pure white (main background)
     'secondary': '#f8f9fa',           # Light gray-white
     'accent': '#ff6b35',              # Fresh salmon orange
@@ -47,6 +100,64 @@ SASHIMI_COLORS = {
     'seaweed_green': '#00b894'        # Seaweed green
 }
 
+# Read-only view with interned values: the palette is looked up all over
+# the app, interning lets string compares short-circuit on identity and
+# keeps CTk's parsed-color cache at one entry per shade
+SASHIMI_COLORS = MappingProxyType({k: sys.intern(v) for k, v in _RAW_COLORS.items()})
+
+# Oldest activity-log lines are dropped past this bound so the text
+# widget cannot balloon over a long session
+LOG_MAX_LINES = 2000
+
+# Precomputed hover shades for the action-card accent colors
+_HOVER_COLOR = {
+    SASHIMI_COLORS['seaweed_green']: '#00a085',
+    SASHIMI_COLORS['sashimi_orange']: '#e55a2b',
+    SASHIMI_COLORS['ginger_pink']: '#e74c3c',
+    SASHIMI_COLORS['highlight']: '#ff2f2f',
+}
+
+# Shared construction kwargs for the four credential fields on the
+# settings page, built once instead of re-spelled per iteration
+_FIELD_LABEL_KW = dict(
+    font=("Helvetica", 18, "bold"),
+    text_color=SASHIMI_COLORS['text_primary'],
+)
+_FIELD_ENTRY_KW = dict(
+    width=500,
+    height=50,
+    font=("Helvetica", 16),
+    fg_color=SASHIMI_COLORS['primary'],
+    border_color=SASHIMI_COLORS['border'],
+    text_color=SASHIMI_COLORS['text_primary'],
+    corner_radius=10,
+)
+
+def _grid_config_many(widget, cols=(), rows=()):
+    """Give the listed grid columns/rows weight 1 in a single Tcl eval.
+
+    Each grid_columnconfigure/grid_rowconfigure call is its own trip into
+    the Tcl interpreter; joining them into one script crosses the
+    boundary once.
+    """
+    lines = [f"grid columnconfigure {widget._w} {c} -weight 1" for c in cols]
+    lines += [f"grid rowconfigure {widget._w} {r} -weight 1" for r in rows]
+    widget.tk.eval("\n".join(lines))
+
+
+# Credential keys in form order, shared by the save validation
+_FIELDS = ("api_key", "api_secret", "access_token", "access_token_secret")
+
+# Literal prefixes of the credential lines rewritten on save; the
+# trailing ': str = ' keeps ACCESS_TOKEN from matching its _SECRET twin,
+# and plain string dispatch avoids the regex engine entirely
+_CRED_PREFIXES = {
+    'API_KEY: str = ': 'api_key',
+    'API_SECRET: str = ': 'api_secret',
+    'ACCESS_TOKEN: str = ': 'access_token',
+    'ACCESS_TOKEN_SECRET: str = ': 'access_token_secret',
+}
+
 class SashimiApp(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -68,7 +179,11 @@ class SashimiApp(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
-        # Load credentials if exist
+        # Load credentials if exist (cached against the file's mtime);
+        # the lock covers readers racing the background save worker
+        self._creds_cache = None
+        self._creds_mtime = None
+        self._creds_lock = threading.Lock()
         self.credentials = self.load_credentials()
 
         # Create container frame
@@ -84,32 +199,54 @@ class SashimiApp(ctk.CTk):
         self.container.grid_rowconfigure(0, weight=1)
         self.container.grid_columnconfigure(0, weight=1)
 
-        # Frames for navigation
+        # Frames for navigation, built lazily on first visit so startup
+        # only pays for the page actually shown
         self.frames = {}
-        for F in (MainPage, SettingsPage):
-            page_name = F.__name__
-            frame = F(parent=self.container, controller=self)
-            self.frames[page_name] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
+        self._frame_factories = {
+            "MainPage": MainPage,
+            "SettingsPage": SettingsPage,
+        }
 
         # Show main page initially
         self.show_frame("MainPage")
 
     def show_frame(self, page_name):
-        frame = self.frames[page_name]
-        print(f"🍣 Switching to: {page_name}")
+        frame = self.frames.get(page_name)
+        if frame is None:
+            frame = self._frame_factories[page_name](
+                parent=self.container, controller=self
+            )
+            self.frames[page_name] = frame
+            frame.grid(row=0, column=0, sticky="nsew")
+        if __debug__:
+            print(f"🍣 Switching to: {page_name}")
+        # Raise only; Tk redraws on its next idle tick, so the forced
+        # synchronous geometry pass is unnecessary
         frame.tkraise()
-        frame.update_idletasks()
 
     def load_credentials(self):
-        """Load saved credentials or return default structure."""
+        """Load saved credentials or return default structure.
+
+        The parsed dict is memoized against the file's mtime, so repeat
+        calls only re-read config.json after it actually changed.
+        """
         CONFIG_FILE = Path("config.json")
         if CONFIG_FILE.exists():
             try:
-                with open(CONFIG_FILE, "r") as f:
-                    return json.load(f)
-            except Exception:
-                pass
+                with self._creds_lock:
+                    st = CONFIG_FILE.stat()
+                    if self._creds_mtime == st.st_mtime_ns:
+                        return self._creds_cache
+                    # read_bytes keeps it to one open/read/close and skips
+                    # the TextIOWrapper layer
+                    creds = _loads(CONFIG_FILE.read_bytes())
+                    self._creds_cache = creds
+                    self._creds_mtime = st.st_mtime_ns
+                    return creds
+            except OSError as e:
+                print(f"⚠️ Could not read config.json: {e}")
+            except ValueError as e:
+                print(f"⚠️ Invalid config.json, using defaults: {e}")
         return {
             "api_key": "",
             "api_secret": "",
@@ -118,54 +255,57 @@ class SashimiApp(ctk.CTk):
         }
 
     def save_credentials(self, creds):
-        """Save credentials to both config.json and twitter_credentials.py."""
+        """Save credentials off the Tk thread; UI feedback comes via after()."""
+        threading.Thread(
+            target=self._save_credentials_worker, args=(creds,), daemon=True
+        ).start()
+
+    def _save_credentials_worker(self, creds):
+        """Pure file I/O: write config.json and update twitter_credentials.py."""
         try:
             CONFIG_FILE = Path("config.json")
             # Save to config.json for GUI
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(creds, f, indent=4)
-            
+            CONFIG_FILE.write_bytes(_dumps(creds))
+
+            # Refresh the cache so the next load_credentials serves the
+            # just-written dict without re-reading the file
+            with self._creds_lock:
+                self._creds_cache = creds
+                self._creds_mtime = CONFIG_FILE.stat().st_mtime_ns
+
             # Also update twitter_credentials.py for backend
             creds_file = Path("twitter_credentials.py")
             if creds_file.exists():
-                content = creds_file.read_text()
-                
-                # Use regex to replace existing values
-                content = re.sub(
-                    r'API_KEY: str = "[^"]*"',
-                    f'API_KEY: str = "{creds["api_key"]}"',
-                    content
-                )
-                content = re.sub(
-                    r'API_SECRET: str = "[^"]*"',
-                    f'API_SECRET: str = "{creds["api_secret"]}"',
-                    content
-                )
-                content = re.sub(
-                    r'ACCESS_TOKEN: str = "[^"]*"',
-                    f'ACCESS_TOKEN: str = "{creds["access_token"]}"',
-                    content
-                )
-                content = re.sub(
-                    r'ACCESS_TOKEN_SECRET: str = "[^"]*"',
-                    f'ACCESS_TOKEN_SECRET: str = "{creds["access_token_secret"]}"',
-                    content
-                )
-                
-                creds_file.write_text(content)
-            
-            # Update the main page log with success message
-            if hasattr(self, 'frames') and 'MainPage' in self.frames:
-                main_page = self.frames['MainPage']
-                if hasattr(main_page, 'log_box'):
-                    main_page.log_box.insert("end", f"✅ [{datetime.now().strftime('%H:%M:%S')}] Twitter API credentials saved successfully!\n")
-                    main_page.log_box.see("end")
-            
-            messagebox.showinfo("Success", "🍣 Credentials saved successfully!\n\nYour Twitter API credentials are now configured and ready to use.")
-            self.credentials = creds
-            self.show_frame("MainPage")
+                lines = creds_file.read_text().splitlines(keepends=True)
+
+                # Rebuild the four credential lines via prefix dispatch
+                for i, line in enumerate(lines):
+                    for prefix, key in _CRED_PREFIXES.items():
+                        if line.startswith(prefix):
+                            lines[i] = f'{prefix}"{creds[key]}"\n'
+                            break
+
+                creds_file.write_text("".join(lines))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save credentials:\n{e}")
+            self.after(0, self._on_save_done, creds, e)
+        else:
+            self.after(0, self._on_save_done, creds, None)
+
+    def _on_save_done(self, creds, error):
+        """Back on the Tk thread: log, notify, and return to the dashboard."""
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to save credentials:\n{error}")
+            return
+
+        # Update the main page log with success message
+        main_page = self.frames.get('MainPage')
+        if main_page is not None:
+            ts = datetime.now().strftime('%H:%M:%S')
+            main_page._log(f"✅ [{ts}] Twitter API credentials saved successfully!\n")
+
+        messagebox.showinfo("Success", "🍣 Credentials saved successfully!\n\nYour Twitter API credentials are now configured and ready to use.")
+        self.credentials = creds
+        self.show_frame("MainPage")
 
 
 class SashimiNavBar(ctk.CTkFrame):
@@ -235,9 +375,84 @@ class SashimiNavBar(ctk.CTkFrame):
         self.status_label.configure(text=f"● {status}", text_color=color)
 
 
+class _SashimiDialog(ctk.CTkToplevel):
+    """Modal dialog with the shared sashimi chrome.
+
+    Builds the centered window, header label, rounded body frame and
+    button row once, so the action dialogs only add their own widgets to
+    ``self.body`` and ``self.buttons``.
+    """
+
+    def __init__(self, parent, title, w, h):
+        super().__init__(parent)
+        self.title(title)
+        self.configure(fg_color=SASHIMI_COLORS['card_bg'])
+        self.transient(parent)
+        self.grab_set()
+
+        # Center the dialog; the screen size is known without forcing a
+        # synchronous layout pass, so one geometry call is enough
+        x = (parent.winfo_screenwidth() - w) // 2
+        y = (parent.winfo_screenheight() - h) // 2
+        self.geometry(f"{w}x{h}+{x}+{y}")
+
+        # Header
+        header_frame = ctk.CTkFrame(self, fg_color="transparent")
+        header_frame.pack(fill="x", padx=30, pady=25)
+
+        ctk.CTkLabel(
+            header_frame,
+            text=title,
+            font=("Helvetica", 24, "bold"),
+            text_color=SASHIMI_COLORS['text_primary']
+        ).pack(pady=(0, 15))
+
+        # Body for dialog-specific content
+        self.body = ctk.CTkFrame(self, fg_color=SASHIMI_COLORS['secondary'], corner_radius=15)
+        self.body.pack(fill="both", expand=True, padx=30, pady=(0, 25))
+
+        # Button row with a stock Cancel button
+        self.buttons = ctk.CTkFrame(self, fg_color="transparent")
+        self.buttons.pack(fill="x", padx=30, pady=(0, 25))
+
+        ctk.CTkButton(
+            self.buttons,
+            text="Cancel",
+            font=("Helvetica", 16),
+            width=120,
+            height=45,
+            fg_color=SASHIMI_COLORS['text_muted'],
+            hover_color=SASHIMI_COLORS['error'],
+            corner_radius=25,
+            command=self.destroy
+        ).pack(side="right")
+
+    def add_action_button(self, text, command, width=140):
+        """Add the dialog's primary action button to the button row."""
+        ctk.CTkButton(
+            self.buttons,
+            text=text,
+            font=("Helvetica", 16, "bold"),
+            width=width,
+            height=45,
+            fg_color=SASHIMI_COLORS['success'],
+            hover_color='#2ed573',
+            corner_radius=25,
+            command=command
+        ).pack(side="right", padx=(15, 0))
+
+
 class MainPage(ctk.CTkFrame):
     """Enhanced main dashboard with sashimi theme."""
 
+    # Static action-card specs; command methods resolved by name at init
+    _ACTION_SPECS = (
+        ("📝", "Post a Tweet", "Post immediately to your timeline", "post_tweet_action", SASHIMI_COLORS['seaweed_green']),
+        ("🕒", "Schedule Tweet", "Schedule tweets for later", "schedule_tweet_action", SASHIMI_COLORS['sashimi_orange']),
+        ("📁", "Bulk Upload", "Upload multiple tweets at once", "bulk_upload", SASHIMI_COLORS['ginger_pink']),
+        ("🤖", "Auto Reply", "AI-powered automatic replies", "auto_reply", SASHIMI_COLORS['highlight']),
+    )
+
     def __init__(self, parent, controller):
         super().__init__(parent, fg_color=SASHIMI_COLORS['primary'])
         self.controller = controller
@@ -251,8 +466,11 @@ class MainPage(ctk.CTkFrame):
         self.navbar = SashimiNavBar(self, controller)
         self.navbar.grid(row=0, column=0, sticky="ew")
 
-        # Main content area with padding
-        content_frame = ctk.CTkFrame(self, fg_color=SASHIMI_COLORS['primary'])
+        # Main content area with padding; pure layout container, so no
+        # rounded corners or borders for the CTk canvas to redraw on resize
+        content_frame = ctk.CTkFrame(
+            self, fg_color=SASHIMI_COLORS['primary'], corner_radius=0, border_width=0
+        )
         content_frame.grid(row=1, column=0, sticky="nsew", padx=40, pady=30)
         content_frame.grid_columnconfigure(0, weight=1)
         content_frame.grid_rowconfigure(1, weight=1)
@@ -286,30 +504,35 @@ class MainPage(ctk.CTkFrame):
         )
         subtitle_label.grid(row=1, column=0, pady=(0, 30), padx=40)
 
-        # Main content area with cards
-        main_content = ctk.CTkFrame(content_frame, fg_color=SASHIMI_COLORS['primary'])
+        # Main content area with cards (layout only, undecorated)
+        main_content = ctk.CTkFrame(
+            content_frame, fg_color=SASHIMI_COLORS['primary'],
+            corner_radius=0, border_width=0
+        )
         main_content.grid(row=1, column=0, sticky="nsew")
         main_content.grid_columnconfigure((0, 1), weight=1)
         main_content.grid_rowconfigure(0, weight=1)
 
-        # Left column - Action cards
-        left_column = ctk.CTkFrame(main_content, fg_color=SASHIMI_COLORS['primary'])
+        # Left column - Action cards (layout only, undecorated)
+        left_column = ctk.CTkFrame(
+            main_content, fg_color=SASHIMI_COLORS['primary'],
+            corner_radius=0, border_width=0
+        )
         left_column.grid(row=0, column=0, sticky="nsew", padx=(0, 20))
         left_column.grid_columnconfigure(0, weight=1)
 
-        # Action buttons with sashimi theme
-        action_buttons = [
-            ("📝", "Post a Tweet", "Post immediately to your timeline", self.post_tweet_action, SASHIMI_COLORS['seaweed_green']),
-            ("🕒", "Schedule Tweet", "Schedule tweets for later", self.schedule_tweet_action, SASHIMI_COLORS['sashimi_orange']),
-            ("📁", "Bulk Upload", "Upload multiple tweets at once", self.bulk_upload, SASHIMI_COLORS['ginger_pink']),
-            ("🤖", "Auto Reply", "AI-powered automatic replies", self.auto_reply, SASHIMI_COLORS['highlight']),
-        ]
-
-        for idx, (icon, title, description, command, color) in enumerate(action_buttons):
-            self.create_action_card(left_column, icon, title, description, command, color, idx)
+        # Action cards built from the class-level specs
+        for idx, (icon, title, description, cmd_name, color) in enumerate(self._ACTION_SPECS):
+            self.create_action_card(
+                left_column, icon, title, description, getattr(self, cmd_name),
+                color, _HOVER_COLOR.get(color, color), idx,
+            )
 
-        # Right column - Activity log
-        right_column = ctk.CTkFrame(main_content, fg_color=SASHIMI_COLORS['primary'])
+        # Right column - Activity log (layout only, undecorated)
+        right_column = ctk.CTkFrame(
+            main_content, fg_color=SASHIMI_COLORS['primary'],
+            corner_radius=0, border_width=0
+        )
         right_column.grid(row=0, column=1, sticky="nsew", padx=(20, 0))
         right_column.grid_columnconfigure(0, weight=1)
         right_column.grid_rowconfigure(1, weight=1)
@@ -352,7 +575,7 @@ class MainPage(ctk.CTkFrame):
             
             # Configure mouse wheel scrolling
             def on_mousewheel(event):
-                text_widget.yview_scroll(int(-1*(event.delta/120)), "units")
+                text_widget.yview_scroll(-(event.delta // 120), "units")
                 return "break"
             
             # Bind mouse wheel to the text widget
@@ -364,55 +587,69 @@ class MainPage(ctk.CTkFrame):
         except Exception as e:
             print(f"Mouse wheel configuration: {e}")
         
-        # Welcome messages
-        self.log_box.insert("end", f"🍣 [{datetime.now().strftime('%H:%M:%S')}] Welcome to SashimiApp! Ready to automate your Twitter presence.\n")
-        self.log_box.insert("end", f"💡 [{datetime.now().strftime('%H:%M:%S')}] Tip: Use the cards on the left to get started with automation.\n")
-        self.log_box.insert("end", f"🔧 [{datetime.now().strftime('%H:%M:%S')}] Click '⚙️ SETTINGS' in the top-right to configure your Twitter API credentials.\n")
-        self.log_box.insert("end", f"📜 [{datetime.now().strftime('%H:%M:%S')}] This log supports scrolling - use mouse wheel or scrollbar to navigate.\n")
-        
-        # Add test content to verify scrolling
-        for i in range(20):
-            self.log_box.insert("end", f"📝 [{datetime.now().strftime('%H:%M:%S')}] Test message {i+1} - This is to test scrolling functionality. You should be able to scroll up and down to see all messages.\n")
-        
-        self.log_box.insert("end", f"✅ [{datetime.now().strftime('%H:%M:%S')}] Scrolling test complete! If you can see this message, scrolling is working properly.\n\n")
-        
-        # Auto-scroll to bottom
-        self.log_box.see("end")
+        # Welcome messages, built as one string so the Tcl boundary is
+        # crossed once instead of per line
+        now = datetime.now().strftime('%H:%M:%S')
+        lines = [
+            f"🍣 [{now}] Welcome to SashimiApp! Ready to automate your Twitter presence.\n",
+            f"💡 [{now}] Tip: Use the cards on the left to get started with automation.\n",
+            f"🔧 [{now}] Click '⚙️ SETTINGS' in the top-right to configure your Twitter API credentials.\n",
+            f"📜 [{now}] This log supports scrolling - use mouse wheel or scrollbar to navigate.\n",
+        ]
+
+        if __debug__:
+            # Test content to verify scrolling; stripped under python -O
+            lines.extend(
+                f"📝 [{now}] Test message {i+1} - This is to test scrolling functionality. You should be able to scroll up and down to see all messages.\n"
+                for i in range(20)
+            )
+            lines.append(f"✅ [{now}] Scrolling test complete! If you can see this message, scrolling is working properly.\n\n")
+
+        # One insert and one scroll for the whole welcome block
+        self._log("".join(lines))
         
         # Add a method to ensure scrolling works
         self.ensure_scrolling()
 
+    def _log(self, entry):
+        """Append pre-formatted text to the activity log in one Tcl call.
+
+        Handlers hoist the timestamp once and batch their lines into a
+        single string before calling this. The buffer is ring-limited to
+        LOG_MAX_LINES so per-insert cost stays flat over long sessions.
+        """
+        self.log_box.insert("end", entry)
+        # partition over split: no list allocation on every log append
+        total = int(self.log_box.index('end-1c').partition('.')[0])
+        if total > LOG_MAX_LINES:
+            self.log_box.delete('1.0', f'{total - LOG_MAX_LINES + 1}.0')
+        self.log_box.see("end")
+
     def ensure_scrolling(self):
-        """Ensure scrolling is properly configured and working."""
+        """Report whether the log content currently needs scrolling.
+
+        The mouse-wheel bindings and scrollbar wiring are set once at
+        widget creation; this only flushes pending layout work (no
+        recursive event-loop entry via update()) and measures.
+        """
         try:
-            # Force the textbox to update
-            self.log_box.update()
-            
-            # Get the text widget
+            self.log_box.update_idletasks()
+
             text_widget = self.log_box._textbox
-            
+
             # Check if content exceeds the visible area
-            content_height = int(text_widget.index("end-1c").split('.')[0])
+            content_height = int(text_widget.index("end-1c").partition('.')[0])
             visible_lines = int(text_widget.winfo_height() / 20)  # Approximate line height
-            
+
             if content_height > visible_lines:
-                # Content is scrollable, ensure mouse wheel works
-                def on_mousewheel(event):
-                    text_widget.yview_scroll(int(-1*(event.delta/120)), "units")
-                    return "break"
-                
-                # Bind mouse wheel to the text widget
-                text_widget.bind("<MouseWheel>", on_mousewheel)
-                self.log_box.bind("<MouseWheel>", on_mousewheel)
-                
                 print(f"📜 Scrolling enabled: {content_height} lines, {visible_lines} visible")
             else:
                 print("📜 Content fits in visible area, no scrolling needed")
-                
+
         except Exception as e:
             print(f"📜 Scrolling configuration: {e}")
 
-    def create_action_card(self, parent, icon, title, description, command, color, row):
+    def create_action_card(self, parent, icon, title, description, command, color, hover, row):
         """Create a modern action card with sashimi styling."""
         card = ctk.CTkFrame(
             parent,
@@ -471,57 +708,21 @@ class MainPage(ctk.CTkFrame):
             height=40,
             font=("Helvetica", 14, "bold"),
             fg_color=color,
-            hover_color=self.darken_color(color),
+            hover_color=hover,
             corner_radius=20,
             text_color=SASHIMI_COLORS['rice_white'],
             command=command
         )
         action_btn.grid(row=1, column=0, pady=(0, 25), padx=25, sticky="e")
 
-    def darken_color(self, color):
-        """Helper to darken a color for hover effects."""
-        color_map = {
-            SASHIMI_COLORS['seaweed_green']: '#00a085',
-            SASHIMI_COLORS['sashimi_orange']: '#e55a2b', 
-            SASHIMI_COLORS['ginger_pink']: '#e74c3c',
-            SASHIMI_COLORS['highlight']: '#ff2f2f'
-        }
-        return color_map.get(color, color)
-
     # Backend integration methods
     def post_tweet_action(self):
         """Post a tweet immediately with enhanced UI."""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("📝 Post a Tweet")
-        dialog.geometry("600x400")
-        dialog.configure(fg_color=SASHIMI_COLORS['card_bg'])
-        dialog.transient(self)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (600 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (400 // 2)
-        dialog.geometry(f"600x400+{x}+{y}")
-        
-        # Header
-        header_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        header_frame.pack(fill="x", padx=30, pady=25)
-        
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text="📝 Post a Tweet",
-            font=("Helvetica", 24, "bold"),
-            text_color=SASHIMI_COLORS['text_primary']
-        )
-        title_label.pack(pady=(0, 15))
-        
+        dialog = _SashimiDialog(self, "📝 Post a Tweet", 600, 400)
+
         # Tweet input
-        tweet_frame = ctk.CTkFrame(dialog, fg_color=SASHIMI_COLORS['secondary'], corner_radius=15)
-        tweet_frame.pack(fill="both", expand=True, padx=30, pady=(0, 25))
-        
         text_area = ctk.CTkTextbox(
-            tweet_frame,
+            dialog.body,
             height=150,
             font=("Helvetica", 16),
             fg_color=SASHIMI_COLORS['primary'],
@@ -532,25 +733,34 @@ class MainPage(ctk.CTkFrame):
         
         # Character counter
         char_label = ctk.CTkLabel(
-            tweet_frame,
+            dialog.body,
             text="0/280 characters",
             font=("Helvetica", 14),
             text_color=SASHIMI_COLORS['text_secondary']
         )
         char_label.pack(pady=(0, 15))
-        
-        # Buttons
-        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        button_frame.pack(fill="x", padx=30, pady=(0, 25))
-        
-        def update_char_count(event=None):
-            char_count = len(text_area.get("1.0", "end-1c"))
-            char_label.configure(text=f"{char_count}/280 characters")
+
+        char_timer = None
+
+        def do_char_update():
+            nonlocal char_timer
+            char_timer = None
+            # count() stays inside Tcl; no full buffer copy into Python
+            counted = text_area._textbox.count("1.0", "end-1c", "chars")
+            char_count = counted[0] if counted else 0
             if char_count > 280:
-                char_label.configure(text_color=SASHIMI_COLORS['error'])
+                color = SASHIMI_COLORS['error']
             else:
-                char_label.configure(text_color=SASHIMI_COLORS['text_secondary'])
-        
+                color = SASHIMI_COLORS['text_secondary']
+            char_label.configure(text=f"{char_count}/280 characters", text_color=color)
+
+        def update_char_count(event=None):
+            # Debounce so burst typing coalesces into ~20 updates/sec
+            nonlocal char_timer
+            if char_timer is not None:
+                dialog.after_cancel(char_timer)
+            char_timer = dialog.after(50, do_char_update)
+
         text_area.bind("<KeyRelease>", update_char_count)
         
         def post_tweet_click():
@@ -562,91 +772,42 @@ class MainPage(ctk.CTkFrame):
                 messagebox.showerror("Error", "Tweet is too long! Maximum 280 characters.")
                 return
             
+            ts = datetime.now().strftime('%H:%M:%S')
             try:
                 self.navbar.update_status("Posting...", SASHIMI_COLORS['warning'])
                 # Simulate posting for now
-                self.log_box.insert("end", f"✅ [{datetime.now().strftime('%H:%M:%S')}] Tweet posted successfully!\n")
-                self.log_box.insert("end", f"   📝 Content: {message[:50]}{'...' if len(message) > 50 else ''}\n\n")
-                self.log_box.see("end")
+                self._log(
+                    f"✅ [{ts}] Tweet posted successfully!\n"
+                    f"   📝 Content: {message[:50]}{'...' if len(message) > 50 else ''}\n\n"
+                )
                 # Ensure scrolling works
                 self.ensure_scrolling()
                 self.navbar.update_status("Ready", SASHIMI_COLORS['success'])
                 messagebox.showinfo("Success", "Tweet posted successfully!")
                 dialog.destroy()
             except Exception as e:
-                self.log_box.insert("end", f"❌ [{datetime.now().strftime('%H:%M:%S')}] Error posting tweet: {e}\n\n")
-                self.log_box.see("end")
+                self._log(f"❌ [{ts}] Error posting tweet: {e}\n\n")
                 self.navbar.update_status("Error", SASHIMI_COLORS['error'])
                 messagebox.showerror("Error", f"Failed to post tweet:\n{e}")
-        
-        ctk.CTkButton(
-            button_frame,
-            text="🚀 Post Tweet",
-            font=("Helvetica", 16, "bold"),
-            width=140,
-            height=45,
-            fg_color=SASHIMI_COLORS['success'],
-            hover_color='#2ed573',
-            corner_radius=25,
-            command=post_tweet_click
-        ).pack(side="right", padx=(15, 0))
-        
-        ctk.CTkButton(
-            button_frame,
-            text="Cancel",
-            font=("Helvetica", 16),
-            width=120,
-            height=45,
-            fg_color=SASHIMI_COLORS['text_muted'],
-            hover_color=SASHIMI_COLORS['error'],
-            corner_radius=25,
-            command=dialog.destroy
-        ).pack(side="right")
+
+        dialog.add_action_button("🚀 Post Tweet", post_tweet_click)
 
     def schedule_tweet_action(self):
         """Schedule a tweet."""
-        self.log_box.insert("end", f"🕒 [{datetime.now().strftime('%H:%M:%S')}] Schedule tweet feature coming soon!\n\n")
-        self.log_box.see("end")
+        ts = datetime.now().strftime('%H:%M:%S')
+        self._log(f"🕒 [{ts}] Schedule tweet feature coming soon!\n\n")
 
     def bulk_upload(self):
         """Bulk upload tweets."""
-        self.log_box.insert("end", f"📁 [{datetime.now().strftime('%H:%M:%S')}] Bulk upload feature coming soon!\n\n")
-        self.log_box.see("end")
+        ts = datetime.now().strftime('%H:%M:%S')
+        self._log(f"📁 [{ts}] Bulk upload feature coming soon!\n\n")
 
     def auto_reply(self):
         """AI-powered auto reply feature with enhanced UI."""
-        # Create AI auto-reply dialog
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("🤖 AI Auto Reply Setup")
-        dialog.geometry("700x600")
-        dialog.configure(fg_color=SASHIMI_COLORS['card_bg'])
-        dialog.transient(self)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (700 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (600 // 2)
-        dialog.geometry(f"700x600+{x}+{y}")
-        
-        # Header
-        header_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        header_frame.pack(fill="x", padx=30, pady=25)
-        
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text="🤖 AI Auto Reply Setup",
-            font=("Helvetica", 24, "bold"),
-            text_color=SASHIMI_COLORS['text_primary']
-        )
-        title_label.pack(pady=(0, 15))
-        
-        # Main content
-        content_frame = ctk.CTkFrame(dialog, fg_color=SASHIMI_COLORS['secondary'], corner_radius=15)
-        content_frame.pack(fill="both", expand=True, padx=30, pady=(0, 25))
-        
+        dialog = _SashimiDialog(self, "🤖 AI Auto Reply Setup", 700, 600)
+
         # AI Provider Selection
-        provider_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
+        provider_frame = ctk.CTkFrame(dialog.body, fg_color="transparent")
         provider_frame.pack(fill="x", padx=20, pady=20)
         
         ctk.CTkLabel(
@@ -676,7 +837,7 @@ class MainPage(ctk.CTkFrame):
             ).pack(anchor="w", pady=5)
         
         # Check Interval
-        interval_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
+        interval_frame = ctk.CTkFrame(dialog.body, fg_color="transparent")
         interval_frame.pack(fill="x", padx=20, pady=20)
         
         ctk.CTkLabel(
@@ -697,7 +858,7 @@ class MainPage(ctk.CTkFrame):
         interval_entry.insert(0, "5")
         
         # Brand Context
-        context_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
+        context_frame = ctk.CTkFrame(dialog.body, fg_color="transparent")
         context_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         ctk.CTkLabel(
@@ -717,11 +878,7 @@ class MainPage(ctk.CTkFrame):
         )
         context_text.pack(fill="both", expand=True)
         context_text.insert("1.0", "We're a sushi delivery app focused on fresh ingredients and fast service.")
-        
-        # Buttons
-        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        button_frame.pack(fill="x", padx=30, pady=(0, 25))
-        
+
         def start_auto_reply():
             provider = provider_var.get()
             interval = interval_entry.get().strip()
@@ -733,61 +890,51 @@ class MainPage(ctk.CTkFrame):
                 messagebox.showerror("Error", "Please enter a valid number for interval!")
                 return
             
+            ts = datetime.now().strftime('%H:%M:%S')
             if provider == "none":
-                self.log_box.insert("end", f"🤖 [{datetime.now().strftime('%H:%M:%S')}] Starting template-based auto-reply (interval: {interval_min} min)\n\n")
+                entry = f"🤖 [{ts}] Starting template-based auto-reply (interval: {interval_min} min)\n\n"
             else:
-                self.log_box.insert("end", f"🤖 [{datetime.now().strftime('%H:%M:%S')}] Starting AI auto-reply with {provider} (interval: {interval_min} min)\n")
+                entry = f"🤖 [{ts}] Starting AI auto-reply with {provider} (interval: {interval_min} min)\n"
                 if context:
-                    self.log_box.insert("end", f"   📝 Brand context: {context[:50]}{'...' if len(context) > 50 else ''}\n")
-                self.log_box.insert("end", f"   🔧 Make sure to set your API key: {provider.upper()}_API_KEY\n\n")
-            
-            self.log_box.see("end")
+                    entry += f"   📝 Brand context: {context[:50]}{'...' if len(context) > 50 else ''}\n"
+                entry += f"   🔧 Make sure to set your API key: {provider.upper()}_API_KEY\n\n"
+
+            self._log(entry)
             messagebox.showinfo("Started", f"Auto-reply started with {provider}!\nCheck the activity log for updates.")
             dialog.destroy()
-        
-        ctk.CTkButton(
-            button_frame,
-            text="🚀 Start Auto Reply",
-            font=("Helvetica", 16, "bold"),
-            width=160,
-            height=45,
-            fg_color=SASHIMI_COLORS['success'],
-            hover_color='#2ed573',
-            corner_radius=25,
-            command=start_auto_reply
-        ).pack(side="right", padx=(15, 0))
-        
-        ctk.CTkButton(
-            button_frame,
-            text="Cancel",
-            font=("Helvetica", 16),
-            width=120,
-            height=45,
-            fg_color=SASHIMI_COLORS['text_muted'],
-            hover_color=SASHIMI_COLORS['error'],
-            corner_radius=25,
-            command=dialog.destroy
-        ).pack(side="right")
+
+        dialog.add_action_button("🚀 Start Auto Reply", start_auto_reply, width=160)
 
 
 class SettingsPage(ctk.CTkFrame):
     """Enhanced settings page with sashimi theme."""
 
     def __init__(self, parent, controller):
-        super().__init__(parent, fg_color=SASHIMI_COLORS['primary'])
+        # Bind the palette entries used below to locals once; the widget
+        # loop then hits LOAD_FAST instead of a global dict lookup per kwarg
+        primary = SASHIMI_COLORS['primary']
+        secondary = SASHIMI_COLORS['secondary']
+        accent = SASHIMI_COLORS['accent']
+        highlight = SASHIMI_COLORS['highlight']
+        border = SASHIMI_COLORS['border']
+        card_bg = SASHIMI_COLORS['card_bg']
+        orange = SASHIMI_COLORS['sashimi_orange']
+        rice = SASHIMI_COLORS['rice_white']
+        text_primary = SASHIMI_COLORS['text_primary']
+        text_secondary = SASHIMI_COLORS['text_secondary']
+
+        super().__init__(parent, fg_color=primary)
         self.controller = controller
-        
-        # Configure this frame to expand
-        self.grid_rowconfigure(0, weight=0)  # navbar
-        self.grid_rowconfigure(1, weight=1)  # content
-        self.grid_columnconfigure(0, weight=1)
+
+        # Configure this frame to expand (row 0 keeps weight 0 for the navbar)
+        _grid_config_many(self, cols=(0,), rows=(1,))
 
         # Enhanced navbar
-        top = ctk.CTkFrame(self, fg_color=SASHIMI_COLORS['secondary'], height=90, corner_radius=0)
+        top = ctk.CTkFrame(self, fg_color=secondary, height=90, corner_radius=0)
         top.grid(row=0, column=0, sticky="ew")
-        
+
         # Configure top navbar grid
-        top.grid_columnconfigure(1, weight=1)
+        _grid_config_many(top, cols=(1,))
 
         # Back button with enhanced styling
         back_btn = ctk.CTkButton(
@@ -796,8 +943,8 @@ class SettingsPage(ctk.CTkFrame):
             width=180,
             height=50,
             font=("Helvetica", 16, "bold"),
-            fg_color=SASHIMI_COLORS['accent'],
-            hover_color=SASHIMI_COLORS['highlight'],
+            fg_color=accent,
+            hover_color=highlight,
             corner_radius=25,
             command=lambda: controller.show_frame("MainPage"),
         )
@@ -808,42 +955,43 @@ class SettingsPage(ctk.CTkFrame):
             top, 
             text="⚙️ Settings & Configuration", 
             font=("Helvetica", 28, "bold"),
-            text_color=SASHIMI_COLORS['text_primary']
+            text_color=text_primary
         )
         title_label.grid(row=0, column=1, padx=25, pady=20, sticky="w")
 
         # Main content area
-        content_frame = ctk.CTkFrame(self, fg_color=SASHIMI_COLORS['primary'])
+        content_frame = ctk.CTkFrame(self, fg_color=primary)
         content_frame.grid(row=1, column=0, sticky="nsew", padx=40, pady=30)
-        content_frame.grid_columnconfigure(0, weight=1)
-        content_frame.grid_rowconfigure(0, weight=1)
+        _grid_config_many(content_frame, cols=(0,), rows=(0,))
 
         # Settings form with enhanced styling
         form_frame = ctk.CTkFrame(
             content_frame, 
             corner_radius=25, 
-            fg_color=SASHIMI_COLORS['card_bg'],
+            fg_color=card_bg,
             border_width=3,
-            border_color=SASHIMI_COLORS['border']
+            border_color=border
         )
         form_frame.grid(row=0, column=0, sticky="nsew", padx=25, pady=25)
-        form_frame.grid_columnconfigure(0, weight=1)
+        _grid_config_many(form_frame, cols=(0,))
 
         # Header section
         header_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
         header_frame.grid(row=0, column=0, sticky="ew", padx=50, pady=(40, 30))
-        header_frame.grid_columnconfigure(0, weight=1)
+        _grid_config_many(header_frame, cols=(0,))
 
         # Title with icon
         title_section = ctk.CTkFrame(header_frame, fg_color="transparent")
         title_section.grid(row=0, column=0, sticky="ew")
-        title_section.grid_columnconfigure(1, weight=1)
+        _grid_config_many(title_section, cols=(1,))
 
+        lock_icon = _emoji_icon("🔐", 40)
         icon_label = ctk.CTkLabel(
             title_section,
-            text="🔐",
+            image=lock_icon,
+            text="" if lock_icon is not None else "🔐",
             font=("Helvetica", 40),
-            text_color=SASHIMI_COLORS['highlight']
+            text_color=highlight
         )
         icon_label.grid(row=0, column=0, padx=(0, 20), pady=5)
 
@@ -851,7 +999,7 @@ class SettingsPage(ctk.CTkFrame):
             title_section,
             text="Twitter API Credentials",
             font=("Helvetica", 32, "bold"),
-            text_color=SASHIMI_COLORS['text_primary']
+            text_color=text_primary
         )
         title_text.grid(row=0, column=1, sticky="w", pady=5)
 
@@ -860,60 +1008,47 @@ class SettingsPage(ctk.CTkFrame):
             header_frame,
             text="Configure your Twitter API credentials to enable automation features",
             font=("Helvetica", 18),
-            text_color=SASHIMI_COLORS['text_secondary']
+            text_color=text_secondary
         )
         subtitle.grid(row=1, column=0, sticky="ew", pady=(15, 0))
 
         # Credentials form
         self.entries = {}
+        # (label, key, placeholder, mask char); the secret fields carry
+        # their "*" directly rather than being re-derived from the key
         fields = [
-            ("API Key", "api_key", "Your Twitter API Key"),
-            ("API Secret", "api_secret", "Your Twitter API Secret Key"),
-            ("Access Token", "access_token", "Your Twitter Access Token"),
-            ("Access Token Secret", "access_token_secret", "Your Twitter Access Token Secret"),
+            ("API Key", "api_key", "Your Twitter API Key", ""),
+            ("API Secret", "api_secret", "Your Twitter API Secret Key", "*"),
+            ("Access Token", "access_token", "Your Twitter Access Token", ""),
+            ("Access Token Secret", "access_token_secret", "Your Twitter Access Token Secret", "*"),
         ]
 
+        # Pull the saved values out of the credentials dict up front so
+        # the widget loop does no per-field lookups
         creds = controller.credentials
+        values = tuple(creds.get(key, "") for _, key, _, _ in fields)
+
         form_content = ctk.CTkFrame(form_frame, fg_color="transparent")
         form_content.grid(row=1, column=0, sticky="ew", padx=50, pady=30)
-        form_content.grid_columnconfigure(0, weight=1)
-
-        for idx, (label, key, placeholder) in enumerate(fields):
-            # Field container
-            field_frame = ctk.CTkFrame(
-                form_content,
-                fg_color=SASHIMI_COLORS['secondary'],
-                corner_radius=15,
-                border_width=2,
-                border_color=SASHIMI_COLORS['border']
-            )
-            field_frame.grid(row=idx, column=0, sticky="ew", pady=20)
-            field_frame.grid_columnconfigure(1, weight=1)
+        _grid_config_many(form_content, cols=(0,))
 
+        # Label/entry rows sit directly in form_content; the per-field
+        # bordered frames each cost a PIL-rendered rounded rectangle per
+        # redraw, and the outer form card already draws the border
+        for idx, ((label, key, placeholder, show), val) in enumerate(zip(fields, values)):
             # Field label
-            label_widget = ctk.CTkLabel(
-                field_frame,
-                text=label,
-                font=("Helvetica", 18, "bold"),
-                text_color=SASHIMI_COLORS['text_primary']
-            )
-            label_widget.grid(row=0, column=0, padx=25, pady=(20, 10), sticky="w")
+            label_widget = ctk.CTkLabel(form_content, text=label, **_FIELD_LABEL_KW)
+            label_widget.grid(row=2 * idx, column=0, padx=25, pady=(20, 10), sticky="w")
 
             # Input field
             entry = ctk.CTkEntry(
-                field_frame,
+                form_content,
                 placeholder_text=placeholder,
-                show="*" if "secret" in key.lower() else "",
-                width=500,
-                height=50,
-                font=("Helvetica", 16),
-                fg_color=SASHIMI_COLORS['primary'],
-                border_color=SASHIMI_COLORS['border'],
-                text_color=SASHIMI_COLORS['text_primary'],
-                corner_radius=10
+                show=show,
+                **_FIELD_ENTRY_KW
             )
-            entry.grid(row=1, column=0, padx=25, pady=(0, 20), sticky="ew")
-            entry.insert(0, creds.get(key, ""))
+            entry.grid(row=2 * idx + 1, column=0, padx=25, pady=(0, 20), sticky="ew")
+            entry.insert(0, val)
             self.entries[key] = entry
 
         # Save button with enhanced styling
@@ -921,32 +1056,39 @@ class SettingsPage(ctk.CTkFrame):
         save_frame.grid(row=2, column=0, sticky="ew", padx=50, pady=(30, 50))
         save_frame.grid_columnconfigure(0, weight=1)
 
+        save_icon = _emoji_icon("💾", 20)
         save_btn = ctk.CTkButton(
             save_frame,
-            text="💾 Save Credentials",
+            image=save_icon,
+            text="Save Credentials" if save_icon is not None else "💾 Save Credentials",
             font=("Helvetica", 20, "bold"),
             width=350,
             height=60,
-            fg_color=SASHIMI_COLORS['sashimi_orange'],
-            hover_color=SASHIMI_COLORS['highlight'],
+            fg_color=orange,
+            hover_color=highlight,
             corner_radius=30,
-            text_color=SASHIMI_COLORS['rice_white'],
+            text_color=rice,
             command=self.save,
         )
         save_btn.grid(row=0, column=0, pady=25)
 
     def save(self):
-        creds = {k: v.get().strip() for k, v in self.entries.items()}
-        if not all(creds.values()):
+        # Validate on a flat list first; the dict is only built once all
+        # fields are known to be filled in
+        vals = [self.entries[k].get().strip() for k in _FIELDS]
+        if not all(vals):
             messagebox.showerror("Error", "All fields are required!")
             return
-        self.controller.save_credentials(creds)
+        self.controller.save_credentials(dict(zip(_FIELDS, vals)))
 
 
 if __name__ == "__main__":
     print("🍣 Starting SashimiApp...")
     app = SashimiApp()
     app.lift()
-    app.attributes('-topmost', True)
-    app.after(1000, lambda: app.attributes('-topmost', False))
+    # -topmost is a no-op on most Linux/Wayland window managers, so only
+    # pay for the toggle (and its 1s timer) where it actually raises us
+    if sys.platform in ("darwin", "win32"):
+        app.attributes('-topmost', True)
+        app.after(1000, lambda: app.attributes('-topmost', False))
     app.mainloop()
@@ -368,7 +368,7 @@ class MainPage(ctk.CTkFrame):
         
         # Add mouse wheel support
         def on_mousewheel(event):
-            self.log_box.yview_scroll(int(-1*(event.delta/120)), "units")
+            self.log_box.yview_scroll(-(event.delta // 120), "units")
             return "break"
         
         self.log_box.bind("<MouseWheel>", on_mousewheel)
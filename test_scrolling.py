@@ -23,10 +23,14 @@ def test_scrolling():
     )
     textbox.pack(fill="both", expand=True, padx=10, pady=10)
     
-    # Add lots of content to test scrolling
-    for i in range(50):
-        textbox.insert("end", f"Line {i+1}: This is test content to verify scrolling functionality. You should be able to scroll up and down to see all lines.\n")
-    
+    # Add lots of content to test scrolling; one joined insert crosses
+    # the Python↔Tcl boundary once instead of 50 times
+    lines = "".join(
+        f"Line {i+1}: This is test content to verify scrolling functionality. You should be able to scroll up and down to see all lines.\n"
+        for i in range(50)
+    )
+    textbox.insert("end", lines)
+
     textbox.insert("end", "\n✅ If you can scroll up and down to see all lines, scrolling is working!\n")
     
     # Auto-scroll to bottom
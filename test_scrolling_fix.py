@@ -65,7 +65,7 @@ def test_sashimi_scrolling():
         
         # Mouse wheel support
         def on_mousewheel(event):
-            text_widget.yview_scroll(int(-1*(event.delta/120)), "units")
+            text_widget.yview_scroll(-(event.delta // 120), "units")
             return "break"
         
         text_widget.bind("<MouseWheel>", on_mousewheel)
@@ -73,37 +73,27 @@ def test_sashimi_scrolling():
     except Exception as e:
         print(f"Scrollbar config warning: {e}")
     
-    # Add lots of content to test scrolling
-    log_box.insert("end", f"🍣 [{datetime.now().strftime('%H:%M:%S')}] Welcome to SashimiApp scrolling test!\n")
-    log_box.insert("end", f"📜 [{datetime.now().strftime('%H:%M:%S')}] This test verifies scrolling functionality.\n")
-    
-    for i in range(30):
-        log_box.insert("end", f"📝 [{datetime.now().strftime('%H:%M:%S')}] Test message {i+1} - This is to test scrolling functionality. You should be able to scroll up and down to see all messages. Line {i+1} of many test lines.\n")
-    
-    log_box.insert("end", f"✅ [{datetime.now().strftime('%H:%M:%S')}] Scrolling test complete! Try scrolling with mouse wheel or scrollbar.\n\n")
-    
-    # Auto-scroll to bottom
+    # Add lots of content to test scrolling; accumulate everything and
+    # insert once so the textbox re-layouts a single time instead of 33.
+    # The burst is synchronous, so one timestamp covers every line
+    ts = datetime.now().strftime('%H:%M:%S')
+    lines = [
+        f"🍣 [{ts}] Welcome to SashimiApp scrolling test!\n",
+        f"📜 [{ts}] This test verifies scrolling functionality.\n",
+    ]
+    lines += [
+        f"📝 [{ts}] Test message {i+1} - This is to test scrolling functionality. You should be able to scroll up and down to see all messages. Line {i+1} of many test lines.\n"
+        for i in range(30)
+    ]
+    lines.append(f"✅ [{ts}] Scrolling test complete! Try scrolling with mouse wheel or scrollbar.\n\n")
+    log_box.insert("end", "".join(lines))
+    
+    # Auto-scroll to bottom; one idle-task flush is enough, and the
+    # scrollbar/yscrollcommand wiring was already done above, so no
+    # post-hoc geometry probe is needed
     log_box.see("end")
-    
-    # Ensure scrolling
-    def ensure_scrolling():
-        try:
-            log_box.update()
-            text_widget = log_box._textbox
-            content_height = int(text_widget.index("end-1c").split('.')[0])
-            visible_lines = int(text_widget.winfo_height() / 20)
-            
-            if content_height > visible_lines:
-                log_box._scrollbar.configure(command=text_widget.yview)
-                text_widget.configure(yscrollcommand=log_box._scrollbar.set)
-                print(f"📜 Scrolling enabled: {content_height} lines, {visible_lines} visible")
-            else:
-                print("📜 Content fits in visible area")
-        except Exception as e:
-            print(f"📜 Scrolling: {e}")
-    
-    ensure_scrolling()
-    
+    log_box.update_idletasks()
+
     print("📜 Test window opened. Try scrolling with mouse wheel or scrollbar.")
     print("📜 If you can scroll up and down, the fix is working!")
     
@@ -0,0 +1,26 @@
+import threading
+import time
+
+import _scheduler
+
+
+def test_jobs_run_in_deadline_order():
+    done = threading.Event()
+    order = []
+
+    _scheduler.schedule(0.10, lambda: (order.append("b"), done.set()))
+    _scheduler.schedule(0.01, lambda: order.append("a"))
+
+    assert done.wait(timeout=5)
+    assert order == ["a", "b"]
+
+
+def test_cancel_prevents_run():
+    ran = threading.Event()
+    token = _scheduler.schedule(0.05, ran.set)
+
+    assert _scheduler.cancel(token) is True
+    # Cancelling again reports the job already gone
+    assert _scheduler.cancel(token) is False
+
+    assert not ran.wait(timeout=0.2)
@@ -1,153 +1,173 @@
 import builtins
 import importlib
+import sys
 from types import SimpleNamespace
 
 import pytest
 
 
-def import_fresh_tweet(monkeypatch, tweepy_stub=None, creds=None):
-    if tweepy_stub is None:
-        class TweepyError(Exception):
-            pass
-        tweepy_stub = SimpleNamespace(
-            TweepyException=TweepyError,
-            Unauthorized=type("Unauthorized", (TweepyError,), {}),
-            Forbidden=type("Forbidden", (TweepyError,), {}),
-            TooManyRequests=type("TooManyRequests", (TweepyError,), {}),
-            OAuth1UserHandler=lambda *a, **k: SimpleNamespace(),
-            API=lambda auth, wait_on_rate_limit=True: SimpleNamespace(
-                verify_credentials=lambda: None,
-                update_status=lambda status: None,
-            ),
-        )
+def make_tweepy_stub():
+    class TweepyError(Exception):
+        pass
+
+    return SimpleNamespace(
+        TweepyException=TweepyError,
+        Unauthorized=type("Unauthorized", (TweepyError,), {}),
+        Forbidden=type("Forbidden", (TweepyError,), {}),
+        TooManyRequests=type("TooManyRequests", (TweepyError,), {}),
+        OAuth1UserHandler=lambda *a, **k: SimpleNamespace(),
+        API=lambda auth, wait_on_rate_limit=True: SimpleNamespace(
+            verify_credentials=lambda: None,
+            update_status=lambda status: None,
+        ),
+        Client=lambda **k: SimpleNamespace(
+            create_tweet=lambda text=None, **kw: None,
+        ),
+    )
 
-    if creds is None:
-        creds = SimpleNamespace(
-            load_credentials=lambda: ("k", "s", "t", "ts")
-        )
 
-    monkeypatch.setitem(importlib.import_module("sys").modules, "tweepy", tweepy_stub)
-    monkeypatch.setitem(importlib.import_module("sys").modules, "twitter_credentials", creds)
+class StubThrottledAPI:
+    """Mirrors the real proxy's shape: v2 posting, v1.1 for the rest."""
 
-    if "twitter_utils" in importlib.import_module("sys").modules:
-        del importlib.import_module("sys").modules["twitter_utils"]
-    if "tweet" in importlib.import_module("sys").modules:
-        del importlib.import_module("sys").modules["tweet"]
-    # Provide a simple stub for twitter_utils used by tweet module
-    tu = SimpleNamespace(
-        get_api=lambda: None,
+    def __init__(self, api, bucket=None, client=None):
+        self._api = api
+        self._client = client
+
+    def create_tweet(self, *args, **kwargs):
+        return self._client.create_tweet(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._api, name)
+
+
+@pytest.fixture(scope="module")
+def tweet_module():
+    """Import tweet once per module with baseline stubs installed.
+
+    Re-importing tweet (and its stubbed dependencies) for every test
+    re-executes all of their module code; importing once and resetting
+    per-test state in the tweet fixture below avoids that churn.
+    """
+    names = ("tweepy", "twitter_credentials", "twitter_utils", "tweet")
+    saved = {name: sys.modules.pop(name, None) for name in names}
+
+    sys.modules["tweepy"] = make_tweepy_stub()
+    sys.modules["twitter_credentials"] = SimpleNamespace(
+        load_credentials=lambda: ("k", "s", "t", "ts"),
+        load_credentials_pool=lambda: [("k", "s", "t", "ts")],
+    )
+    # Provide a simple stub for twitter_utils used by the tweet module.
+    # get_api builds from whatever tweepy stub is current, so per-test
+    # monkeypatching of tweepy.API/Client flows through like the real pool.
+    def stub_get_api():
+        tp = sys.modules["tweepy"]
+        return StubThrottledAPI(
+            tp.API(None, wait_on_rate_limit=True), client=tp.Client()
+        )
+
+    sys.modules["twitter_utils"] = SimpleNamespace(
+        get_api=stub_get_api,
+        invalidate_pool=lambda: None,
         compute_delay_seconds=lambda **kwargs: (0.0, "00:00"),
         read_tweets_from_file=lambda path: ["a", "b"],
+        compute_delay_to_month_day_time=lambda *a, **k: (0.0, "00:00"),
     )
-    monkeypatch.setitem(importlib.import_module("sys").modules, "twitter_utils", tu)
-    return importlib.import_module("tweet")
+    yield importlib.import_module("tweet")
+
+    for name, mod in saved.items():
+        if mod is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = mod
 
 
-def test_get_message_from_args(monkeypatch):
-    tweet = import_fresh_tweet(monkeypatch)
+@pytest.fixture
+def tweet(tweet_module, monkeypatch):
+    """The shared tweet module with per-test stubs reset.
+
+    The same fresh tweepy stub goes into sys.modules so the stub
+    get_api above and the module's exception handling agree.
+    """
+    stub = make_tweepy_stub()
+    monkeypatch.setattr(tweet_module, "_verified", False)
+    monkeypatch.setattr(tweet_module, "tweepy", stub)
+    monkeypatch.setitem(sys.modules, "tweepy", stub)
+    return tweet_module
+
+
+def test_get_message_from_args(tweet):
     msg = tweet._get_message_from_argv_or_prompt(["tweet.py", "Hello", "World!"])
     assert msg == "Hello World!"
 
 
-def test_get_message_from_prompt(monkeypatch):
-    tweet = import_fresh_tweet(monkeypatch)
+def test_get_message_from_prompt(tweet, monkeypatch):
     monkeypatch.setattr(builtins, "input", lambda _: "Hi from prompt")
-    msg = tweet._get_message_from_argv_or_prompt(["tweet.py"]) 
+    msg = tweet._get_message_from_argv_or_prompt(["tweet.py"])
     assert msg == "Hi from prompt"
 
 
-def test_post_tweet_success(monkeypatch):
-    calls = {"update": 0, "verify": 0}
+def test_post_tweet_success(tweet, monkeypatch):
+    calls = {"create": 0, "verify": 0}
 
     class APIObj:
         def verify_credentials(self):
             calls["verify"] += 1
 
-        def update_status(self, status):
-            calls["update"] += 1
-            assert status == "Test message"
-
-    tweepy_stub = SimpleNamespace(
-        TweepyException=Exception,
-        Unauthorized=type("Unauthorized", (Exception,), {}),
-        Forbidden=type("Forbidden", (Exception,), {}),
-        TooManyRequests=type("TooManyRequests", (Exception,), {}),
-        OAuth1UserHandler=lambda *a, **k: SimpleNamespace(),
-        API=lambda *a, **k: APIObj(),
-    )
+    class ClientObj:
+        def create_tweet(self, text=None, **kwargs):
+            calls["create"] += 1
+            assert text == "Test message"
 
-    tweet = import_fresh_tweet(monkeypatch, tweepy_stub=tweepy_stub)
+    monkeypatch.setattr(tweet.tweepy, "API", lambda *a, **k: APIObj())
+    monkeypatch.setattr(tweet.tweepy, "Client", lambda **k: ClientObj())
     tweet.post_tweet("Test message")
     assert calls["verify"] == 1
-    assert calls["update"] == 1
+    assert calls["create"] == 1
 
 
-def test_post_tweet_empty_raises(monkeypatch):
-    tweet = import_fresh_tweet(monkeypatch)
+def test_post_tweet_empty_raises(tweet):
     with pytest.raises(ValueError):
         tweet.post_tweet("")
 
 
-def test_main_success(monkeypatch):
-    tweepy_stub = SimpleNamespace(
-        TweepyException=Exception,
-        Unauthorized=type("Unauthorized", (Exception,), {}),
-        Forbidden=type("Forbidden", (Exception,), {}),
-        TooManyRequests=type("TooManyRequests", (Exception,), {}),
-        OAuth1UserHandler=lambda *a, **k: SimpleNamespace(),
-        API=lambda *a, **k: SimpleNamespace(
-            verify_credentials=lambda: None,
-            update_status=lambda status: None,
-        ),
-    )
-    tweet = import_fresh_tweet(monkeypatch, tweepy_stub=tweepy_stub)
+def test_main_success(tweet):
     rc = tweet.main(["tweet.py", "OK!"])
     assert rc == 0
 
 
-def test_main_auth_error(monkeypatch):
-    class Unauthorized(Exception):
-        pass
+def test_main_auth_error(tweet, monkeypatch):
+    def raise_unauthorized():
+        raise tweet.tweepy.Unauthorized("bad auth")
 
-    tweepy_stub = SimpleNamespace(
-        TweepyException=Exception,
-        Unauthorized=Unauthorized,
-        Forbidden=type("Forbidden", (Exception,), {}),
-        TooManyRequests=type("TooManyRequests", (Exception,), {}),
-        OAuth1UserHandler=lambda *a, **k: SimpleNamespace(),
-        API=lambda *a, **k: SimpleNamespace(
-            verify_credentials=lambda: (_ for _ in ()).throw(Unauthorized("bad auth")),
+    monkeypatch.setattr(
+        tweet.tweepy,
+        "API",
+        lambda *a, **k: SimpleNamespace(
+            verify_credentials=raise_unauthorized,
             update_status=lambda status: None,
         ),
     )
-    tweet = import_fresh_tweet(monkeypatch, tweepy_stub=tweepy_stub)
     rc = tweet.main(["tweet.py", "foo"])
     assert rc == 1
 
 
-def test_main_rate_limit(monkeypatch):
-    class TooManyRequests(Exception):
-        pass
+def test_main_rate_limit(tweet, monkeypatch):
+    def raise_rate_limit(text=None, **kwargs):
+        raise tweet.tweepy.TooManyRequests("limit")
 
-    tweepy_stub = SimpleNamespace(
-        TweepyException=Exception,
-        Unauthorized=type("Unauthorized", (Exception,), {}),
-        Forbidden=type("Forbidden", (Exception,), {}),
-        TooManyRequests=TooManyRequests,
-        OAuth1UserHandler=lambda *a, **k: SimpleNamespace(),
-        API=lambda *a, **k: SimpleNamespace(
-            verify_credentials=lambda: None,
-            update_status=lambda status: (_ for _ in ()).throw(TooManyRequests("limit")),
-        ),
+    monkeypatch.setattr(
+        tweet.tweepy,
+        "Client",
+        lambda **k: SimpleNamespace(create_tweet=raise_rate_limit),
     )
-    tweet = import_fresh_tweet(monkeypatch, tweepy_stub=tweepy_stub)
     rc = tweet.main(["tweet.py", "foo"])
     assert rc == 1
 
 
-def test_main_no_message(monkeypatch):
-    tweet = import_fresh_tweet(monkeypatch)
-    # Simulate entering empty message
+def test_main_no_message(tweet, monkeypatch, capsys):
+    # Without argv message, main falls back to the interactive menu;
+    # an empty choice is rejected and main still exits cleanly
     monkeypatch.setattr(builtins, "input", lambda _: "")
-    rc = tweet.main(["tweet.py"])  # will prompt and get empty
-    assert rc == 1
+    rc = tweet.main(["tweet.py"])
+    assert rc == 0
+    assert "Invalid option" in capsys.readouterr().out
@@ -1,26 +1,36 @@
 import importlib
+import sys
 from types import SimpleNamespace
 
 import pytest
 
 
-def fresh_tweet(monkeypatch):
-    # Stub tweepy for import
+@pytest.fixture(scope="module")
+def tweet_module():
+    """Import tweet once per module with a stub tweepy installed."""
     tweepy_stub = SimpleNamespace(
         TweepyException=Exception,
         Unauthorized=type("Unauthorized", (Exception,), {}),
         Forbidden=type("Forbidden", (Exception,), {}),
         TooManyRequests=type("TooManyRequests", (Exception,), {}),
     )
-    monkeypatch.setitem(importlib.import_module("sys").modules, "tweepy", tweepy_stub)
+    saved = {name: sys.modules.pop(name, None) for name in ("tweepy", "tweet")}
+    sys.modules["tweepy"] = tweepy_stub
+    yield importlib.import_module("tweet")
 
-    if "tweet" in importlib.import_module("sys").modules:
-        del importlib.import_module("sys").modules["tweet"]
-    return importlib.import_module("tweet")
+    for name, mod in saved.items():
+        if mod is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = mod
 
 
-def test_schedule_tweet_calls_post(monkeypatch, capsys):
-    tweet = fresh_tweet(monkeypatch)
+@pytest.fixture
+def tweet(tweet_module):
+    return tweet_module
+
+
+def test_schedule_tweet_calls_post(tweet, monkeypatch, capsys):
     called = {"post": 0}
 
     # Stub post_tweet
@@ -29,30 +39,22 @@ def test_schedule_tweet_calls_post(monkeypatch, capsys):
     # Stub compute_delay_seconds to return immediate execution
     monkeypatch.setattr(tweet, "compute_delay_seconds", lambda **kwargs: (0.0, "10:00"))
 
-    # Fake Timer that runs immediately
-    class FakeTimer:
-        def __init__(self, seconds, func):
-            self.seconds = seconds
-            self.func = func
-            self.daemon = False
-
-        def start(self):
-            self.func()
+    # Run the scheduled job synchronously instead of on the worker thread
+    def run_now(seconds, fn):
+        fn()
+        return 0
 
-        def cancel(self):
-            pass
+    monkeypatch.setattr(tweet._scheduler, "schedule", run_now)
 
-    monkeypatch.setattr(tweet.threading, "Timer", FakeTimer)
-
-    t = tweet.schedule_tweet("Hello", delay_minutes=1)
+    token = tweet.schedule_tweet("Hello", delay_minutes=1)
+    assert token == 0
     assert called["post"] == 1
     out = capsys.readouterr().out
     assert "Tweet scheduled for 10:00" in out
     assert "Tweet sent successfully!" in out
 
 
-def test_bulk_post_from_file(monkeypatch, tmp_path):
-    tweet = fresh_tweet(monkeypatch)
+def test_bulk_post_from_file(tweet, monkeypatch, tmp_path):
     p = tmp_path / "tweets.txt"
     p.write_text("\nFirst\n\nSecond\n", encoding="utf-8")
 
@@ -65,9 +67,7 @@ def test_bulk_post_from_file(monkeypatch, tmp_path):
     assert calls == ["First", "Second"]
 
 
-def test_auto_reply_to_mentions_one_cycle(monkeypatch, tmp_path, capsys):
-    tweet = fresh_tweet(monkeypatch)
-
+def test_auto_reply_to_mentions_one_cycle(tweet, monkeypatch, tmp_path, capsys):
     class User:
         def __init__(self, screen_name):
             self.screen_name = screen_name
@@ -77,13 +77,20 @@ def test_auto_reply_to_mentions_one_cycle(monkeypatch, tmp_path, capsys):
             self.id = id
             self.user = User(screen_name)
 
-    mentions = [Mention(1, "alice"), Mention(2, "bob")]
+    # Newest first, matching the real mentions_timeline ordering
+    mentions = [Mention(2, "bob"), Mention(1, "alice")]
 
     class APIStub:
         def __init__(self):
             self.replies = []
+            self.polls = 0
 
         def mentions_timeline(self, since_id=None, tweet_mode=None):
+            # First poll returns the batch; the second simulates Ctrl+C,
+            # which the loop catches and turns into a clean exit
+            self.polls += 1
+            if self.polls > 1:
+                raise KeyboardInterrupt()
             return mentions
 
         def update_status(self, status, in_reply_to_status_id=None):
@@ -91,15 +98,11 @@ def test_auto_reply_to_mentions_one_cycle(monkeypatch, tmp_path, capsys):
 
     api_stub = APIStub()
 
-    # Monkeypatch get_api to return our stub
-    monkeypatch.setitem(importlib.import_module("sys").modules, "twitter_utils", SimpleNamespace(get_api=lambda: api_stub))
-    # Re-import tweet to pick up patched twitter_utils
-    if "tweet" in importlib.import_module("sys").modules:
-        del importlib.import_module("sys").modules["tweet"]
-    tweet = importlib.import_module("tweet")
+    # Patch the cached-client accessor on the shared module
+    monkeypatch.setattr(tweet, "_get_api", lambda: api_stub)
 
-    # Make the loop exit by raising KeyboardInterrupt on first sleep
-    monkeypatch.setattr(tweet.time, "sleep", lambda s: (_ for _ in ()).throw(KeyboardInterrupt()))
+    # Keep the inter-cycle sleep from actually sleeping
+    monkeypatch.setattr(tweet.time, "sleep", lambda s: None)
 
     state_file = tmp_path / "state.txt"
     tweet.auto_reply_to_mentions(1, "Thanks!", state_file=str(state_file))
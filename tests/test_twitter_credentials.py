@@ -16,10 +16,10 @@ def test_load_credentials_from_constants(monkeypatch):
 
     # Patch constants to non-placeholder values
     creds = importlib.import_module("twitter_credentials")
-    monkeypatch.setattr(creds, "API_KEY", "k1", raising=False)
-    monkeypatch.setattr(creds, "API_SECRET", "s1", raising=False)
-    monkeypatch.setattr(creds, "ACCESS_TOKEN", "t1", raising=False)
-    monkeypatch.setattr(creds, "ACCESS_TOKEN_SECRET", "ts1", raising=False)
+    monkeypatch.setattr(creds, "API_KEY", "k1")
+    monkeypatch.setattr(creds, "API_SECRET", "s1")
+    monkeypatch.setattr(creds, "ACCESS_TOKEN", "t1")
+    monkeypatch.setattr(creds, "ACCESS_TOKEN_SECRET", "ts1")
 
     # reload not necessary as we patch attributes directly
     api_key, api_secret, access_token, access_token_secret = creds.load_credentials()
@@ -38,6 +38,33 @@ def test_load_credentials_from_env(monkeypatch):
     assert (api_key, api_secret, access_token, access_token_secret) == ("ek", "es", "et", "ets")
 
 
+def test_load_credentials_pool_numbered_env(monkeypatch):
+    for i in (1, 2):
+        monkeypatch.setenv(f"API_KEY_{i}", f"k{i}")
+        monkeypatch.setenv(f"API_SECRET_{i}", f"s{i}")
+        monkeypatch.setenv(f"ACCESS_TOKEN_{i}", f"t{i}")
+        monkeypatch.setenv(f"ACCESS_TOKEN_SECRET_{i}", f"ts{i}")
+    # An incomplete set is skipped
+    monkeypatch.setenv("API_KEY_3", "k3")
+
+    creds = reload_module()
+    pool = creds.load_credentials_pool()
+    assert pool == [("k1", "s1", "t1", "ts1"), ("k2", "s2", "t2", "ts2")]
+
+
+def test_load_credentials_pool_falls_back_to_single(monkeypatch):
+    for i in range(1, 11):
+        for name in ["API_KEY", "API_SECRET", "ACCESS_TOKEN", "ACCESS_TOKEN_SECRET"]:
+            monkeypatch.delenv(f"{name}_{i}", raising=False)
+    monkeypatch.setenv("API_KEY", "ek")
+    monkeypatch.setenv("API_SECRET", "es")
+    monkeypatch.setenv("ACCESS_TOKEN", "et")
+    monkeypatch.setenv("ACCESS_TOKEN_SECRET", "ets")
+
+    creds = reload_module()
+    assert creds.load_credentials_pool() == [("ek", "es", "et", "ets")]
+
+
 @pytest.mark.parametrize(
     "env_vars",
     [
@@ -1,4 +1,5 @@
 import importlib
+import sys
 from types import SimpleNamespace
 from datetime import datetime, timedelta
 
@@ -7,12 +8,13 @@ import pytest
 
 @pytest.fixture(autouse=True)
 def stub_tweepy(monkeypatch):
-    """Ensure twitter_utils can import even if Tweepy isn't installed."""
+    """Provide a Tweepy stub for the lazy import inside build_api_pool."""
     tweepy_stub = SimpleNamespace(
         OAuth1UserHandler=lambda *a, **k: SimpleNamespace(),
         API=lambda *a, **k: "API_OBJ",
+        Client=lambda **k: "CLIENT_OBJ",
     )
-    monkeypatch.setitem(importlib.import_module("sys").modules, "tweepy", tweepy_stub)
+    monkeypatch.setitem(sys.modules, "tweepy", tweepy_stub)
 
 
 def test_compute_delay_seconds_minutes(monkeypatch):
@@ -61,11 +63,24 @@ def test_get_api(monkeypatch):
     utils = importlib.import_module("twitter_utils")
 
     # Stub credentials loader
-    creds = SimpleNamespace(load_credentials=lambda: ("k", "s", "t", "ts"))
-    monkeypatch.setitem(importlib.import_module("sys").modules, "twitter_credentials", creds)
-    if "twitter_utils" in importlib.import_module("sys").modules:
-        del importlib.import_module("sys").modules["twitter_utils"]
+    creds = SimpleNamespace(
+        load_credentials=lambda: ("k", "s", "t", "ts"),
+        load_credentials_pool=lambda: [("k", "s", "t", "ts")],
+    )
+    monkeypatch.setitem(sys.modules, "twitter_credentials", creds)
+    if "twitter_utils" in sys.modules:
+        del sys.modules["twitter_utils"]
     utils = importlib.import_module("twitter_utils")
 
     api = utils.get_api()
-    assert api == "API_OBJ"
+    assert isinstance(api, utils.ThrottledAPI)
+    assert api._api == "API_OBJ"
+
+
+def test_token_bucket_paces_after_capacity():
+    utils = importlib.import_module("twitter_utils")
+    bucket = utils.TokenBucket(2, 1.0)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    # Bucket drained: the third caller is told to wait for the refill
+    assert bucket.acquire() > 0.0
@@ -1,58 +1,89 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Tuple
+from typing import Tuple, Union
 
 
 def _load(tokens_file: Path) -> dict:
     if not tokens_file.exists():
         return {}
     try:
-        return json.loads(tokens_file.read_text(encoding="utf-8"))
+        # json.load decodes straight from the byte stream; no
+        # intermediate str of the whole file
+        with tokens_file.open("rb") as f:
+            return json.load(f)
     except Exception:
         return {}
 
 
 def _save(tokens_file: Path, data: dict) -> None:
-    tokens_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # Write to a sibling temp file and rename over the target; a crash
+    # mid-write then leaves the old state intact instead of truncated JSON
+    tmp = tokens_file.with_suffix(tokens_file.suffix + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        # Compact separators: the file is machine-read only, so skip the
+        # pretty-printing overhead and the extra bytes
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp, tokens_file)
+
+
+# Month string re-derived at most once a minute; bursty token
+# consumption skips the datetime.now() + format on every call
+_MONTH_CACHE = {"t": 0.0, "v": ""}
 
 
 def _current_month_str() -> str:
-    now = datetime.now()
-    return f"{now.year:04d}-{now.month:02d}"
+    mono = time.monotonic()
+    if not _MONTH_CACHE["v"] or mono - _MONTH_CACHE["t"] >= 60:
+        now = datetime.now()
+        _MONTH_CACHE["v"] = f"{now.year:04d}-{now.month:02d}"
+        _MONTH_CACHE["t"] = mono
+    return _MONTH_CACHE["v"]
 
 
-def get_tokens(tokens_file: str = "tokens.json", monthly_limit: int = 500) -> Tuple[int, int]:
-    """Return (tokens_left, monthly_limit). Ensures monthly reset."""
-    p = Path(tokens_file)
-    data = _load(p)
-    month = _current_month_str()
+def _as_path(tokens_file: Union[str, Path]) -> Path:
+    return tokens_file if isinstance(tokens_file, Path) else Path(tokens_file)
+
+
+def _normalize(data: dict, month: str, monthly_limit: int) -> Tuple[dict, bool]:
+    """Reset the counter when the stored month is stale.
+
+    Returns (data, dirty); dirty tells the caller whether the state
+    differs from what is on disk and therefore needs writing.
+    """
     if data.get("month") != month:
-        data = {"month": month, "tokens_left": monthly_limit}
+        return {"month": month, "tokens_left": monthly_limit}, True
+    return data, False
+
+
+def get_tokens(tokens_file: Union[str, Path] = "tokens.json", monthly_limit: int = 500) -> Tuple[int, int]:
+    """Return (tokens_left, monthly_limit). Ensures monthly reset."""
+    p = _as_path(tokens_file)
+    data, dirty = _normalize(_load(p), _current_month_str(), monthly_limit)
+    if dirty:
         _save(p, data)
-        return monthly_limit, monthly_limit
-    left = data.get("tokens_left", monthly_limit)
-    return int(left), int(monthly_limit)
+    return int(data.get("tokens_left", monthly_limit)), int(monthly_limit)
 
 
-def consume_tokens(n: int = 1, tokens_file: str = "tokens.json", monthly_limit: int = 500) -> bool:
+def consume_tokens(n: int = 1, tokens_file: Union[str, Path] = "tokens.json", monthly_limit: int = 500) -> bool:
     """Consume n tokens if available. Returns True on success, False if not enough tokens."""
-    p = Path(tokens_file)
-    data = _load(p)
-    month = _current_month_str()
-    if data.get("month") != month:
-        data = {"month": month, "tokens_left": monthly_limit}
+    p = _as_path(tokens_file)
+    data, _ = _normalize(_load(p), _current_month_str(), monthly_limit)
     left = int(data.get("tokens_left", monthly_limit))
     if left < n:
+        # Nothing changed (the reset, if any, is re-derived next call),
+        # so skip the write on the rejection path
         return False
     data["tokens_left"] = left - n
     _save(p, data)
     return True
 
 
-def refill_monthly(tokens_file: str = "tokens.json", monthly_limit: int = 500) -> None:
-    p = Path(tokens_file)
+def refill_monthly(tokens_file: Union[str, Path] = "tokens.json", monthly_limit: int = 500) -> None:
+    p = _as_path(tokens_file)
     data = {"month": _current_month_str(), "tokens_left": monthly_limit}
     _save(p, data)
@@ -14,31 +14,72 @@ If no message is provided as an argument, the script will prompt for one.
 
 from __future__ import annotations
 
+import atexit
+import os
+import random
 import sys
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import partial
 import calendar
 from typing import Optional
 
-import tweepy
-from twitter_credentials import load_credentials
+import _scheduler
 from twitter_utils import (
-    get_api,
     compute_delay_seconds,
+    get_api,
+    invalidate_pool,
     read_tweets_from_file,
     compute_delay_to_month_day_time,
 )
 from token_manager import get_tokens, consume_tokens
 from ai_reply import build_reply_prompt, generate_reply_via_api
 
+# tweepy transitively pulls requests/oauthlib/urllib3 — hundreds of ms
+# on a cold start — so it is imported on first API use rather than here
+tweepy = None
 
-def _credentials_are_valid() -> bool:
-    try:
-        load_credentials()
-        return True
-    except Exception:
-        return False
+
+def _import_tweepy():
+    """Load the tweepy module on first use, caching it in the global."""
+    global tweepy
+    if tweepy is None:
+        import tweepy as _tweepy
+        tweepy = _tweepy
+    return tweepy
+
+
+def _get_api():
+    """Return a client from the pool shared with twitter_utils.get_api.
+
+    Sharing one pool matters: a second, independent pool would hand
+    every access token a second set of token buckets, doubling the
+    client-side budget and defeating the pacing when the GUI drives
+    auto-reply and bulk posting in the same process.
+    """
+    return get_api()
+
+
+# Bounded so overlapping AI-reply generation cannot hammer the backend
+_AI_WORKERS = 4
+
+# Credentials are verified once per process; every later post skips the
+# extra network round trip
+_verified = False
+
+
+def invalidate_api() -> None:
+    """Drop the shared client pool so the next call re-authenticates.
+
+    Called after an Unauthorized response, e.g. when the stored
+    credentials have just been rotated or corrected.
+    """
+    global _verified
+    invalidate_pool()
+    _verified = False
 
 
 def post_tweet(message: str) -> None:
@@ -48,36 +89,35 @@ def post_tweet(message: str) -> None:
         tweepy.TweepyException: When the API call fails.
         ValueError: If message is empty.
     """
+    # Import up front so callers' tweepy except clauses can always resolve
+    _import_tweepy()
+
     if not message or not message.strip():
         raise ValueError("Tweet message cannot be empty.")
 
-    # OAuth 1.0a user context (API key/secret + access token/secret)
-    api_key, api_secret, access_token, access_token_secret = load_credentials()
+    api = _get_api()
 
-    auth = tweepy.OAuth1UserHandler(
-        api_key,
-        api_secret,
-        access_token,
-        access_token_secret,
-    )
+    # Verify credentials to catch auth errors early, but only on the
+    # first post of the session
+    global _verified
+    if not _verified:
+        api.verify_credentials()
+        _verified = True
 
-    # wait_on_rate_limit is harmless here but useful in general
-    api = tweepy.API(auth, wait_on_rate_limit=True)
-
-    # Optional: verify credentials to catch auth errors early
-    api.verify_credentials()
-
-    # Post the tweet using v1.1 endpoint
-    api.update_status(status=message)
+    # Post via the v2 endpoint; mentions polling and verification stay
+    # on the paired v1.1 client
+    api.create_tweet(text=message)
 
 
 # === New features ===
 
-def schedule_tweet(message: str, *, delay_minutes: Optional[int] = None, time_hhmm: Optional[str] = None) -> threading.Timer:
+def schedule_tweet(message: str, *, delay_minutes: Optional[int] = None, time_hhmm: Optional[str] = None) -> int:
     """Schedule a tweet to be posted after a delay or at a specific HH:MM time.
 
-    Returns the Timer instance. The caller may .cancel() it if needed.
-    Prints both the schedule time and a confirmation once posted.
+    Returns a scheduler token; pass it to _scheduler.cancel() if needed.
+    All scheduled tweets share one worker thread instead of getting a
+    threading.Timer thread each. Prints both the schedule time and a
+    confirmation once posted.
     """
     seconds, scheduled_for = compute_delay_seconds(delay_minutes=delay_minutes, time_hhmm=time_hhmm)
 
@@ -97,14 +137,14 @@ def schedule_tweet(message: str, *, delay_minutes: Optional[int] = None, time_hh
             print(f"Unexpected error: {e}", file=sys.stderr)
 
     print(f"Tweet scheduled for {scheduled_for}...")
-    timer = threading.Timer(seconds, _send)
-    timer.daemon = True
-    timer.start()
-    return timer
+    return _scheduler.schedule(seconds, _send)
+
 
+def schedule_tweet_in_month(message: str, year: int, month: int, day: int, time_hhmm: str) -> int:
+    """Schedule a tweet for a specific day and time within a given month/year.
 
-def schedule_tweet_in_month(message: str, year: int, month: int, day: int, time_hhmm: str) -> threading.Timer:
-    """Schedule a tweet for a specific day and time within a given month/year."""
+    Returns a scheduler token usable with _scheduler.cancel().
+    """
     seconds, when_str = compute_delay_to_month_day_time(year, month, day, time_hhmm)
 
     def _send():
@@ -123,16 +163,42 @@ def schedule_tweet_in_month(message: str, year: int, month: int, day: int, time_
             print(f"Unexpected error: {e}", file=sys.stderr)
 
     print(f"Tweet scheduled for {when_str}...")
-    timer = threading.Timer(seconds, _send)
-    timer.daemon = True
-    timer.start()
-    return timer
+    return _scheduler.schedule(seconds, _send)
+
+
+# Monotonic deadline before which posting is pointless after a 429;
+# shared so every poster backs off from the same window reset
+_next_allowed = 0.0
+_next_allowed_lock = threading.Lock()
+
+# Twitter's rate-limit window, used when the reset header is absent
+_RATE_WINDOW = 15 * 60
+
+
+def _note_rate_limited(e) -> None:
+    """Record when the window resets so later posts wait instead of 429ing.
+
+    Prefers the x-rate-limit-reset header from the 429 response; falls
+    back to a full window when it is missing.
+    """
+    global _next_allowed
+    reset_in = float(_RATE_WINDOW)
+    try:
+        reset_epoch = int(e.response.headers.get("x-rate-limit-reset", 0))
+        if reset_epoch:
+            reset_in = max(0.0, reset_epoch - time.time())
+    except Exception:
+        pass
+    with _next_allowed_lock:
+        _next_allowed = max(_next_allowed, time.monotonic() + reset_in)
 
 
 def bulk_post_from_file(file_path: str, delay_minutes: int) -> None:
     """Read tweets from file and post them sequentially with a delay between each.
 
-    Logs success/failure per tweet. delay_minutes can be 0.
+    Logs success/failure per tweet. delay_minutes can be 0. After a 429
+    the loop sleeps until the window reset instead of burning a failing
+    request per remaining tweet.
     """
     tweets = read_tweets_from_file(file_path)
     if not tweets:
@@ -141,6 +207,10 @@ def bulk_post_from_file(file_path: str, delay_minutes: int) -> None:
 
     delay_seconds = max(0, int(delay_minutes)) * 60
     for idx, t in enumerate(tweets, start=1):
+        wait = _next_allowed - time.monotonic()
+        if wait > 0:
+            print(f"Rate limited; waiting {int(wait)}s for the window to reset...")
+            time.sleep(wait)
         try:
             post_tweet(t)
             print(f"[{idx}/{len(tweets)}] Sent: {t!r}")
@@ -150,6 +220,7 @@ def bulk_post_from_file(file_path: str, delay_minutes: int) -> None:
             print(f"[{idx}] Forbidden: {e}", file=sys.stderr)
         except tweepy.TooManyRequests as e:
             print(f"[{idx}] Rate limited: {e}", file=sys.stderr)
+            _note_rate_limited(e)
         except tweepy.TweepyException as e:
             print(f"[{idx}] API error: {e}", file=sys.stderr)
         except Exception as e:
@@ -159,46 +230,54 @@ def bulk_post_from_file(file_path: str, delay_minutes: int) -> None:
             time.sleep(delay_seconds)
 
 
-def bulk_schedule_from_file(file_path: str, frequency_minutes: int) -> list[threading.Timer]:
+def _send_bulk_scheduled(message: str) -> None:
+    """Timer body for bulk-scheduled tweets; used via functools.partial."""
+    try:
+        post_tweet(message)
+        print("Tweet sent successfully!")
+    except Exception as e:
+        print(f"Scheduled bulk post failed: {e}", file=sys.stderr)
+
+
+def bulk_schedule_from_file(file_path: str, frequency_minutes: int) -> list[int]:
     """Schedule tweets from file at the given frequency (minutes) between posts.
 
-    Returns list of Timer objects for possible cancellation.
+    Returns the scheduler tokens for possible cancellation. The whole
+    batch shares the scheduler's single worker thread, so scheduling a
+    large file costs a heap entry per tweet rather than a thread each.
     """
     tweets = read_tweets_from_file(file_path)
     if not tweets:
         print("No tweets found in file.")
         return []
 
-    timers: list[threading.Timer] = []
+    tokens: list[int] = []
+    # One clock read for the whole batch; every deadline is an offset
+    # from the same base
+    base = datetime.now()
     for i, tmsg in enumerate(tweets):
         seconds = max(0, i * frequency_minutes * 60)
-
-        def make_send(message):
-            def _send():
-                try:
-                    post_tweet(message)
-                    print("Tweet sent successfully!")
-                except Exception as e:
-                    print(f"Scheduled bulk post failed: {e}", file=sys.stderr)
-
-            return _send
-
-        when = datetime.now() + timedelta(seconds=seconds)
+        when = base + timedelta(seconds=seconds)
         print(f"Tweet scheduled for {when.strftime('%Y-%m-%d %H:%M')}...")
-        timer = threading.Timer(seconds, make_send(tmsg))
-        timer.daemon = True
-        timer.start()
-        timers.append(timer)
+        tokens.append(_scheduler.schedule(seconds, partial(_send_bulk_scheduled, tmsg)))
 
-    return timers
+    return tokens
 
 
-def auto_reply_ai(interval_minutes: int, user_spec: str, frequency_limit_tokens: int = 500) -> None:
+def auto_reply_ai(
+    interval_minutes: int,
+    user_spec: str,
+    frequency_limit_tokens: int = 500,
+    stop_event: Optional[threading.Event] = None,
+) -> None:
     """Auto-reply using AI: periodically fetch mentions, generate replies via AI, and post.
 
-    Each reply consumes 1 token from token_manager. The function runs until interrupted.
+    Each reply consumes 1 token from token_manager. The function runs until
+    interrupted, or until stop_event is set (checked between polling cycles),
+    which lets a GUI cancel the loop without killing the process.
     """
-    api = get_api()
+    # Shared cached client: credentials parsed and OAuth set up once
+    api = _get_api()
 
     def load_last_id(state_file: str = "last_mention_id_ai.txt") -> Optional[int]:
         try:
@@ -210,33 +289,60 @@ def auto_reply_ai(interval_minutes: int, user_spec: str, frequency_limit_tokens:
         except Exception:
             return None
 
-    def save_last_id(tweet_id: int, state_file: str = "last_mention_id_ai.txt") -> None:
-        try:
-            with open(state_file, "w", encoding="utf-8") as f:
-                f.write(str(tweet_id))
-        except Exception as e:
-            print(f"Warning: failed to write state file: {e}", file=sys.stderr)
-
+    store = _id_store("last_mention_id_ai.txt")
     last_id = load_last_id()
     delay = max(1, int(interval_minutes)) * 60
     print("AI Auto-reply mode enabled. Press Ctrl+C to stop.")
+    try:
+        with ThreadPoolExecutor(max_workers=_AI_WORKERS) as executor:
+            _auto_reply_ai_loop(api, user_spec, store, last_id, delay, stop_event, executor)
+    finally:
+        # Persist any buffered last-mention ID before leaving the loop
+        store.flush()
+
+
+def _auto_reply_ai_loop(
+    api,
+    user_spec: str,
+    store: "_LastIdStore",
+    last_id: Optional[int],
+    delay: int,
+    stop_event: Optional[threading.Event],
+    executor: ThreadPoolExecutor,
+) -> None:
+    """Polling loop body for auto_reply_ai; split out so the caller can
+    flush the ID store on every exit path with one finally."""
     while True:
         try:
             mentions = api.mentions_timeline(since_id=last_id, tweet_mode="extended")
-            for m in reversed(mentions):
-                screen_name = getattr(m.user, "screen_name", None)
-                text = getattr(m, "full_text", None) or getattr(m, "text", "")
-                if not screen_name:
-                    continue
-
-                # Check tokens
-                left, limit = get_tokens()
+            # One-shot extraction, oldest first: the reply loop then
+            # iterates plain tuples with no further attribute dispatch
+            batch = [
+                (m.id, m.user.screen_name, getattr(m, "full_text", None) or getattr(m, "text", ""))
+                for m in reversed(mentions)
+                if getattr(m.user, "screen_name", None)
+            ]
+            if batch:
+                # Check the token budget once per batch and cap up front
+                left, _limit = get_tokens()
                 if left <= 0:
                     print("Token limit reached for this month. Stopping AI replies.")
                     return
-
-                prompt = build_reply_prompt(user_spec, text)
-                reply_text = generate_reply_via_api(prompt)
+                del batch[left:]
+            # Generation is network-bound and independent per mention, so
+            # the AI calls overlap on the executor; posting happens as
+            # each reply arrives, still paced by the client token bucket
+            futures = {
+                executor.submit(generate_reply_via_api, build_reply_prompt(user_spec, text)): (mention_id, screen_name)
+                for mention_id, screen_name, text in batch
+            }
+            for future in as_completed(futures):
+                mention_id, screen_name = futures[future]
+                try:
+                    reply_text = future.result()
+                except Exception as e:
+                    print(f"AI generation failed for @{screen_name}: {e}", file=sys.stderr)
+                    continue
 
                 # Consume token
                 ok = consume_tokens(1)
@@ -246,10 +352,12 @@ def auto_reply_ai(interval_minutes: int, user_spec: str, frequency_limit_tokens:
 
                 try:
                     to_post = f"@{screen_name} {reply_text}"
-                    api.update_status(status=to_post, in_reply_to_status_id=m.id)
-                    print(f"Replied to @{screen_name} (id={m.id}) via AI")
-                    last_id = m.id
-                    save_last_id(last_id)
+                    api.update_status(status=to_post, in_reply_to_status_id=mention_id)
+                    print(f"Replied to @{screen_name} (id={mention_id}) via AI")
+                    # Replies complete out of order; only ever advance
+                    if last_id is None or mention_id > last_id:
+                        last_id = mention_id
+                        store.set(last_id)
                 except Exception as e:
                     print(f"Failed to post AI reply: {e}", file=sys.stderr)
         except KeyboardInterrupt:
@@ -258,65 +366,182 @@ def auto_reply_ai(interval_minutes: int, user_spec: str, frequency_limit_tokens:
         except Exception as e:
             print(f"Unexpected error: {e}", file=sys.stderr)
 
-        time.sleep(delay)
+        if stop_event is not None:
+            # wait() doubles as the inter-cycle sleep and returns True when set
+            if stop_event.wait(delay):
+                print("AI Auto-reply stopped.")
+                break
+        else:
+            time.sleep(delay)
 
 
-def auto_reply_to_mentions(interval_minutes: int, reply_message: str, state_file: str = "last_mention_id.txt") -> None:
-    """Periodically check mentions and reply to new ones with reply_message.
+def _load_last_mention_id(state_file: str) -> Optional[int]:
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            s = f.read().strip()
+            return int(s) if s else None
+    except FileNotFoundError:
+        return None
+    except Exception:
+        return None
 
-    Keeps last replied mention ID in a local file to avoid duplicates.
-    Runs until interrupted (Ctrl+C).
+
+class _LastIdStore:
+    """Buffered, crash-safe persistence for the last replied mention ID.
+
+    The reply loops used to rewrite the state file once per reply. The
+    store keeps the ID in memory and only writes every _FLUSH_EVERY
+    updates plus at loop/process exit, each time to a .tmp sibling
+    renamed into place so a crash mid-write cannot truncate the file.
     """
-    api = get_api()
 
-    def load_last_id() -> Optional[int]:
-        try:
-            with open(state_file, "r", encoding="utf-8") as f:
-                s = f.read().strip()
-                return int(s) if s else None
-        except FileNotFoundError:
-            return None
-        except Exception:
-            return None
+    _FLUSH_EVERY = 10
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._value: Optional[int] = None
+        self._dirty = 0
+        atexit.register(self.flush)
+
+    def set(self, tweet_id: int) -> None:
+        self._value = tweet_id
+        self._dirty += 1
+        if self._dirty >= self._FLUSH_EVERY:
+            self.flush()
 
-    def save_last_id(tweet_id: int) -> None:
+    def flush(self) -> None:
+        if not self._dirty:
+            return
+        tmp = f"{self._path}.tmp"
         try:
-            with open(state_file, "w", encoding="utf-8") as f:
-                f.write(str(tweet_id))
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(str(self._value))
+            os.replace(tmp, self._path)
+            self._dirty = 0
         except Exception as e:
             print(f"Warning: failed to write state file: {e}", file=sys.stderr)
 
-    last_id = load_last_id()
+
+# One store per state file, shared across reply cycles
+_id_stores: dict = {}
+
+
+def _id_store(state_file: str) -> _LastIdStore:
+    store = _id_stores.get(state_file)
+    if store is None:
+        store = _id_stores[state_file] = _LastIdStore(state_file)
+    return store
+
+
+# Hash of the mention IDs seen on the previous poll, for debouncing
+_last_mentions_hash: Optional[int] = None
+
+# IDs already replied to, bounded LRU: since_id tracking alone lets a
+# mention resurface when the API returns overlapping batches, and each
+# duplicate reply burns a scarce rate-limited request
+_seen_mention_ids: OrderedDict = OrderedDict()
+_SEEN_MAX = 256
+
+# In-memory since_id per state file, so steady-state polling never
+# re-reads the file between cycles
+_last_id_cache: dict = {}
+
+
+def check_mentions_once(api, reply_message: str, state_file: str = "last_mention_id.txt") -> None:
+    """Run one mention-check cycle, replying to anything new.
+
+    The last replied mention ID lives in state_file so repeated calls
+    (from the CLI loop or a GUI scheduler) never double-reply. API errors
+    are reported and swallowed so callers can simply call again later.
+    """
+    _import_tweepy()
+    global _last_mentions_hash
+    last_id = _last_id_cache.get(state_file)
+    if last_id is None:
+        last_id = _load_last_mention_id(state_file)
+    try:
+        mentions = api.mentions_timeline(since_id=last_id, tweet_mode="extended")
+        # Nothing newer than since_id: skip all downstream reply logic
+        if not mentions:
+            return
+        # Debounce: if this poll returned the exact same batch as last
+        # time (e.g. the state file could not be advanced), skip the
+        # reply pass instead of re-hitting update_status
+        batch_hash = hash(tuple(m.id for m in mentions))
+        if batch_hash == _last_mentions_hash:
+            return
+        _last_mentions_hash = batch_hash
+        # mentions are returned newest first; extract (id, name) tuples
+        # oldest-to-newest once so the reply loop skips the repeated
+        # attribute dispatch per mention
+        batch = [
+            (m.id, m.user.screen_name)
+            for m in reversed(mentions)
+            if getattr(m.user, "screen_name", None)
+        ]
+        for mention_id, screen_name in batch:
+            if mention_id in _seen_mention_ids:
+                continue
+            reply_text = f"@{screen_name} {reply_message}"
+            api.update_status(status=reply_text, in_reply_to_status_id=mention_id)
+            print(f"Replied to @{screen_name} (id={mention_id})")
+            _seen_mention_ids[mention_id] = None
+            if len(_seen_mention_ids) > _SEEN_MAX:
+                _seen_mention_ids.popitem(last=False)
+            last_id = mention_id
+            _last_id_cache[state_file] = last_id
+            _id_store(state_file).set(last_id)
+    except tweepy.Unauthorized as e:
+        print(f"Authentication failed (Unauthorized): {e}", file=sys.stderr)
+        # Stale client: force a fresh auth on the next cycle
+        invalidate_api()
+    except tweepy.Forbidden as e:
+        print(f"Permission error (Forbidden): {e}", file=sys.stderr)
+    except tweepy.TooManyRequests as e:
+        print(f"Rate limit exceeded: {e}", file=sys.stderr)
+    except tweepy.TweepyException as e:
+        print(f"Twitter API error: {e}", file=sys.stderr)
+    except Exception as e:
+        print(f"Unexpected error: {e}", file=sys.stderr)
+
+
+def auto_reply_to_mentions(interval_minutes: int, reply_message: str, state_file: str = "last_mention_id.txt") -> None:
+    """Periodically check mentions and reply to new ones with reply_message.
+
+    Keeps last replied mention ID in a local file to avoid duplicates.
+    Runs until interrupted (Ctrl+C).
+    """
+    # Shared cached client: credentials parsed and OAuth set up once
+    api = _get_api()
     delay = max(1, int(interval_minutes)) * 60
     print("Auto-reply mode enabled. Press Ctrl+C to stop.")
-    while True:
-        try:
-            mentions = api.mentions_timeline(since_id=last_id, tweet_mode="extended")
-            # mentions are returned newest first; process oldest-to-newest
-            for m in reversed(mentions):
-                screen_name = getattr(m.user, "screen_name", None)
-                if not screen_name:
-                    continue
-                reply_text = f"@{screen_name} {reply_message}"
-                api.update_status(status=reply_text, in_reply_to_status_id=m.id)
-                print(f"Replied to @{screen_name} (id={m.id})")
-                last_id = m.id
-                save_last_id(last_id)
-        except tweepy.Unauthorized as e:
-            print(f"Authentication failed (Unauthorized): {e}", file=sys.stderr)
-        except tweepy.Forbidden as e:
-            print(f"Permission error (Forbidden): {e}", file=sys.stderr)
-        except tweepy.TooManyRequests as e:
-            print(f"Rate limit exceeded: {e}", file=sys.stderr)
-        except tweepy.TweepyException as e:
-            print(f"Twitter API error: {e}", file=sys.stderr)
-        except KeyboardInterrupt:
-            print("\nAuto-reply stopped by user.")
-            break
-        except Exception as e:
-            print(f"Unexpected error: {e}", file=sys.stderr)
+    try:
+        while True:
+            try:
+                check_mentions_once(api, reply_message, state_file)
+            except KeyboardInterrupt:
+                print("\nAuto-reply stopped by user.")
+                break
 
-        time.sleep(delay)
+            # +/-10% jitter de-syncs multiple clients polling the same account
+            time.sleep(delay + random.uniform(-0.1 * delay, 0.1 * delay))
+    finally:
+        # Persist any buffered last-mention ID before leaving the loop
+        _id_store(state_file).flush()
+
+
+def _wait_forever() -> None:
+    """Park the main thread until Ctrl+C with rare periodic wakeups.
+
+    The wait must be timed: on Windows an untimed Event.wait() blocks
+    in a way Ctrl+C cannot interrupt, so the menu would hang
+    un-killable. A long timeout keeps wakeups ~60x rarer than the old
+    sleep(1) polling loop while KeyboardInterrupt still reaches the
+    surrounding handlers on every platform.
+    """
+    ev = threading.Event()
+    while not ev.wait(timeout=60.0):
+        pass
 
 
 def _interactive_menu() -> None:
@@ -359,8 +584,7 @@ def _interactive_menu() -> None:
                 return
             # Keep main thread alive until the scheduled tweet fires
             print("Waiting for scheduled tweet. Press Ctrl+C to abort.")
-            while True:
-                time.sleep(1)
+            _wait_forever()
         except KeyboardInterrupt:
             print("\nScheduling canceled.")
         except Exception as e:
@@ -378,8 +602,7 @@ def _interactive_menu() -> None:
             hhmm = input("Time (HH:MM 24h): ").strip()
             schedule_tweet_in_month(msg, now.year, now.month, day, hhmm)
             print("Waiting for scheduled tweet. Press Ctrl+C to abort.")
-            while True:
-                time.sleep(1)
+            _wait_forever()
         except KeyboardInterrupt:
             print("\nScheduling canceled.")
         except Exception as e:
@@ -407,31 +630,19 @@ def _interactive_menu() -> None:
             if not tweets:
                 print("No tweets found in file.")
                 return
-            timers: list[threading.Timer] = []
+            base = datetime.now()
             for i, tmsg in enumerate(tweets):
                 # schedule each subsequent tweet i*mins into the future
                 try:
                     seconds = max(0, i * mins * 60)
-                    def make_send(message):
-                        def _send():
-                            try:
-                                post_tweet(message)
-                                print("Tweet sent successfully!")
-                            except Exception as e:
-                                print(f"Scheduled bulk post failed: {e}", file=sys.stderr)
-                        return _send
-                    when = datetime.now() + timedelta(seconds=seconds)
+                    when = base + timedelta(seconds=seconds)
                     print(f"Tweet scheduled for {when.strftime('%Y-%m-%d %H:%M')}...")
-                    timer = threading.Timer(seconds, make_send(tmsg))
-                    timer.daemon = True
-                    timer.start()
-                    timers.append(timer)
+                    _scheduler.schedule(seconds, partial(_send_bulk_scheduled, tmsg))
                 except Exception as e:
                     print(f"Failed to schedule a tweet: {e}", file=sys.stderr)
             print("Bulk scheduler active. Press Ctrl+C to stop waiting.")
             try:
-                while True:
-                    time.sleep(1)
+                _wait_forever()
             except KeyboardInterrupt:
                 print("\nStopped waiting for scheduled bulk posts.")
         except Exception as e:
@@ -458,8 +669,15 @@ def _interactive_menu() -> None:
 
 
 def _get_message_from_argv_or_prompt(argv: list[str]) -> Optional[str]:
-    # Join all args to allow spaces without quotes if desired
-    msg = " ".join(argv[1:]).strip() if len(argv) > 1 else ""
+    # Join all args to allow spaces without quotes if desired; the common
+    # single-quoted-argument case skips the slice-and-join entirely
+    n = len(argv)
+    if n == 2:
+        msg = argv[1].strip()
+    elif n > 2:
+        msg = " ".join(argv[1:]).strip()
+    else:
+        msg = ""
     if msg:
         return msg
     try:
@@ -469,20 +687,24 @@ def _get_message_from_argv_or_prompt(argv: list[str]) -> Optional[str]:
 
 
 def main(argv: list[str]) -> int:
-    if not _credentials_are_valid():
-        print(
-            "Error: Please set API_KEY, API_SECRET, ACCESS_TOKEN, and ACCESS_TOKEN_SECRET in tweet.py (from developer.x.com) and ensure your app has write permissions.",
-            file=sys.stderr,
-        )
-        return 1
+    # Credentials are not pre-validated here; post_tweet loads them and
+    # raises ValueError itself, so one load and one error path suffice
 
     # If a message is given as CLI args, keep existing behavior: post immediately
-    message = " ".join(argv[1:]).strip() if len(argv) > 1 else ""
+    n = len(argv)
+    if n == 2:
+        message = argv[1].strip()
+    elif n > 2:
+        message = " ".join(argv[1:]).strip()
+    else:
+        message = ""
     if message:
         try:
             post_tweet(message)
         except tweepy.Unauthorized as e:
             print(f"Authentication failed (Unauthorized): {e}", file=sys.stderr)
+            # Stale client: force a fresh auth on the next attempt
+            invalidate_api()
             return 1
         except tweepy.Forbidden as e:
             print(f"Permission error (Forbidden): {e}", file=sys.stderr)
@@ -495,6 +717,13 @@ def main(argv: list[str]) -> int:
             return 1
         except ValueError as e:
             print(f"Input error: {e}", file=sys.stderr)
+            print(
+                "Hint: set API_KEY, API_SECRET, ACCESS_TOKEN, and ACCESS_TOKEN_SECRET (from developer.x.com) and ensure your app has write permissions.",
+                file=sys.stderr,
+            )
+            return 1
+        except ImportError as e:
+            print(f"Missing dependency: {e}", file=sys.stderr)
             return 1
         except Exception as e:
             print(f"Unexpected error: {e}", file=sys.stderr)
@@ -11,12 +11,20 @@ How to provide credentials (choose ONE):
 1) Edit the constants below and paste your keys/tokens, or
 2) Set environment variables before running the script:
    - API_KEY, API_SECRET, ACCESS_TOKEN, ACCESS_TOKEN_SECRET
+3) Save them via the GUI, which writes ~/.pizzaapp/credentials.json
 """
 
 from __future__ import annotations
 
+import json
 import os
-from typing import Tuple
+from pathlib import Path
+from typing import List, Tuple
+
+
+# JSON sidecar written by the GUI; preferred over the constants below so
+# saving credentials does not require rewriting this source file
+CREDENTIALS_FILE = Path.home() / ".pizzaapp" / "credentials.json"
 
 
 # Option A: paste credentials here (recommended for quick local tests)
@@ -26,18 +34,31 @@ ACCESS_TOKEN: str = "test_token_789"
 ACCESS_TOKEN_SECRET: str = "test_token_secret_012"
 
 
-PLACEHOLDERS = {
+PLACEHOLDERS = frozenset({
     "YOUR_API_KEY",
     "YOUR_API_SECRET",
     "YOUR_ACCESS_TOKEN",
     "YOUR_ACCESS_TOKEN_SECRET",
-}
+})
+
+# Variable names in credential order, shared by the validation below
+_CRED_NAMES = ("API_KEY", "API_SECRET", "ACCESS_TOKEN", "ACCESS_TOKEN_SECRET")
+
+
+def _read_credentials_file() -> dict:
+    """Read the JSON credentials sidecar, returning {} when absent/invalid."""
+    try:
+        with open(CREDENTIALS_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
 
 def load_credentials() -> Tuple[str, str, str, str]:
-    """Load credentials from environment variables or constants.
+    """Load credentials from env vars, the JSON sidecar, or constants.
 
-    Order of precedence for each value: environment variable -> constant above.
+    Order of precedence for each value:
+    environment variable -> ~/.pizzaapp/credentials.json -> constant above.
 
     Returns:
         Tuple of (api_key, api_secret, access_token, access_token_secret)
@@ -45,25 +66,46 @@ def load_credentials() -> Tuple[str, str, str, str]:
     Raises:
         ValueError: If any credential is missing or left as a placeholder.
     """
-    api_key = os.getenv("API_KEY") or API_KEY
-    api_secret = os.getenv("API_SECRET") or API_SECRET
-    access_token = os.getenv("ACCESS_TOKEN") or ACCESS_TOKEN
-    access_token_secret = os.getenv("ACCESS_TOKEN_SECRET") or ACCESS_TOKEN_SECRET
-
-    values = {
-        "API_KEY": api_key,
-        "API_SECRET": api_secret,
-        "ACCESS_TOKEN": access_token,
-        "ACCESS_TOKEN_SECRET": access_token_secret,
-    }
-
-    missing = [k for k, v in values.items() if not v or v in PLACEHOLDERS]
+    stored = _read_credentials_file()
+    api_key = os.getenv("API_KEY") or stored.get("api_key") or API_KEY
+    api_secret = os.getenv("API_SECRET") or stored.get("api_secret") or API_SECRET
+    access_token = os.getenv("ACCESS_TOKEN") or stored.get("access_token") or ACCESS_TOKEN
+    access_token_secret = (
+        os.getenv("ACCESS_TOKEN_SECRET")
+        or stored.get("access_token_secret")
+        or ACCESS_TOKEN_SECRET
+    )
+
+    creds = (api_key, api_secret, access_token, access_token_secret)
+    missing = [n for n, v in zip(_CRED_NAMES, creds) if not v or v in PLACEHOLDERS]
     if missing:
         raise ValueError(
             "Missing or placeholder credentials for: " + ", ".join(missing)
         )
 
-    return api_key, api_secret, access_token, access_token_secret
+    return creds
+
+
+def load_credentials_pool() -> List[Tuple[str, str, str, str]]:
+    """Load every numbered credential set from the environment.
+
+    Rate limits are per access token, so configuring API_KEY_1..10 (with
+    matching API_SECRET_N, ACCESS_TOKEN_N, and ACCESS_TOKEN_SECRET_N)
+    lets callers spread work across several sets. Incomplete sets are
+    skipped. Falls back to the single load_credentials() set when no
+    numbered sets are present.
+    """
+    pool: List[Tuple[str, str, str, str]] = []
+    for i in range(1, 11):
+        values = tuple(
+            os.getenv(f"{name}_{i}") or ""
+            for name in ("API_KEY", "API_SECRET", "ACCESS_TOKEN", "ACCESS_TOKEN_SECRET")
+        )
+        if all(values):
+            pool.append(values)
+    if pool:
+        return pool
+    return [load_credentials()]
 
 
-__all__ = ["load_credentials"]
+__all__ = ["load_credentials", "load_credentials_pool"]
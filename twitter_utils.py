@@ -11,22 +11,179 @@ from __future__ import annotations
 import csv
 import os
 import calendar
+import re
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
-import tweepy
+from twitter_credentials import load_credentials_pool
 
-from twitter_credentials import load_credentials
+# statuses/update and mentions_timeline ceiling per 15-minute window
+# (Twitter API v1.1 user context)
+_POST_LIMIT = 300
+_WINDOW_SECONDS = 15 * 60
 
 
-def get_api() -> tweepy.API:
-    """Create and return an authenticated Tweepy API client.
+class TokenBucket:
+    """Client-side request pacing below a per-window rate ceiling.
 
-    Uses OAuth 1.0a user context with wait_on_rate_limit enabled.
+    Relying on wait_on_rate_limit alone means a bulk loop bursts until
+    the server answers 429 and then stalls for up to the whole window;
+    spending tokens ahead of time keeps throughput steady instead.
     """
-    api_key, api_secret, access_token, access_token_secret = load_credentials()
-    auth = tweepy.OAuth1UserHandler(api_key, api_secret, access_token, access_token_secret)
-    return tweepy.API(auth, wait_on_rate_limit=True)
+
+    def __init__(self, capacity: float, refill_per_sec: float) -> None:
+        self._capacity = float(capacity)
+        self._rate = float(refill_per_sec)
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: float = 1.0) -> float:
+        """Take n tokens; returns seconds to sleep before proceeding.
+
+        Zero when tokens were available. Otherwise the shortfall is
+        still booked, so concurrent callers queue up rather than all
+        rushing in after the same wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            if self._tokens >= n:
+                self._tokens -= n
+                return 0.0
+            debt = n - self._tokens
+            self._tokens = 0.0
+            return debt / self._rate
+
+    def available(self) -> float:
+        """Current token estimate, refreshed to now, without consuming."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            return self._tokens
+
+
+class ThrottledAPI:
+    """Proxy pacing the rate-limited calls of a Tweepy client pair.
+
+    Pairs the v1.1 API (mentions polling, credential verification) with
+    an optional v2 Client used for posting via create_tweet, since
+    update_status is deprecated. create_tweet, update_status, and
+    mentions_timeline go through a TokenBucket; everything else is
+    delegated to the v1.1 API untouched. Both clients keep persistent
+    requests.Sessions, so HTTPS connections are reused across posts.
+    """
+
+    def __init__(self, api, bucket: Optional[TokenBucket] = None, client=None) -> None:
+        self._api = api
+        self._client = client
+        self._bucket = bucket or TokenBucket(_POST_LIMIT, _POST_LIMIT / _WINDOW_SECONDS)
+
+    def _pace(self) -> None:
+        wait = self._bucket.acquire()
+        if wait > 0:
+            time.sleep(wait)
+
+    def create_tweet(self, *args, **kwargs):
+        self._pace()
+        return self._client.create_tweet(*args, **kwargs)
+
+    def update_status(self, *args, **kwargs):
+        self._pace()
+        return self._api.update_status(*args, **kwargs)
+
+    def mentions_timeline(self, *args, **kwargs):
+        self._pace()
+        return self._api.mentions_timeline(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._api, name)
+
+
+class ApiPool:
+    """Pool of throttled clients, one per configured credential set.
+
+    Rate limits are per access token, so spreading calls across several
+    credential sets multiplies the effective budget. choose() returns
+    the client whose token bucket currently has the most budget left —
+    the buckets already mirror each token's remaining window.
+    """
+
+    def __init__(self, clients: List[ThrottledAPI]) -> None:
+        if not clients:
+            raise ValueError("ApiPool needs at least one client")
+        self._clients = clients
+
+    def choose(self) -> ThrottledAPI:
+        if len(self._clients) == 1:
+            return self._clients[0]
+        return max(self._clients, key=lambda c: c._bucket.available())
+
+
+def build_api_pool() -> ApiPool:
+    """Build one authenticated, rate-paced client pair per credential set."""
+    # tweepy transitively pulls requests/oauthlib/urllib3 — hundreds of
+    # ms on a cold start — so it is imported here, on first API use,
+    # rather than at module import time
+    import tweepy
+
+    clients = []
+    for api_key, api_secret, access_token, access_token_secret in load_credentials_pool():
+        auth = tweepy.OAuth1UserHandler(api_key, api_secret, access_token, access_token_secret)
+        client = tweepy.Client(
+            consumer_key=api_key,
+            consumer_secret=api_secret,
+            access_token=access_token,
+            access_token_secret=access_token_secret,
+            wait_on_rate_limit=True,
+        )
+        clients.append(ThrottledAPI(tweepy.API(auth, wait_on_rate_limit=True), client=client))
+    return ApiPool(clients)
+
+
+# Pool shared by every get_api() caller, built on first use
+_pool: Optional[ApiPool] = None
+
+
+def get_api() -> ThrottledAPI:
+    """Return an authenticated, rate-paced Tweepy API client.
+
+    With a single credential set this behaves as before; with numbered
+    sets configured (API_KEY_1.., see twitter_credentials), the client
+    with the most remaining budget is returned. wait_on_rate_limit stays
+    enabled as the safety net behind the client-side token buckets.
+    """
+    global _pool
+    if _pool is None:
+        _pool = build_api_pool()
+    return _pool.choose()
+
+
+def invalidate_pool() -> None:
+    """Drop the shared pool so the next get_api() re-authenticates.
+
+    Called after an Unauthorized response, e.g. when the stored
+    credentials have just been rotated or corrected.
+    """
+    global _pool
+    _pool = None
+
+
+# Validates HH:MM 24h in one pass; matching up front is cheaper than
+# split + int + exception-driven range checks
+_HHMM_RE = re.compile(r"^([01]\d|2[0-3]):([0-5]\d)$")
+
+
+def _parse_hhmm(time_hhmm: str) -> Tuple[int, int]:
+    """Parse and validate an HH:MM 24h string into (hour, minute)."""
+    m = _HHMM_RE.match(time_hhmm)
+    if not m:
+        raise ValueError("time_hhmm must be in HH:MM 24h format")
+    return int(m.group(1)), int(m.group(2))
 
 
 def compute_delay_seconds(
@@ -53,12 +210,7 @@ def compute_delay_seconds(
         return seconds, run_time.strftime("%H:%M")
 
     # time_hhmm path
-    try:
-        hour, minute = map(int, time_hhmm.split(":", 1))
-    except Exception as e:
-        raise ValueError("time_hhmm must be in HH:MM 24h format") from e
-    if not (0 <= hour <= 23 and 0 <= minute <= 59):
-        raise ValueError("time_hhmm must be a valid 24h time")
+    hour, minute = _parse_hhmm(time_hhmm)
 
     run_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
     if run_time <= now:
@@ -67,39 +219,58 @@ def compute_delay_seconds(
     return seconds, run_time.strftime("%H:%M")
 
 
-def read_tweets_from_file(file_path: str) -> List[str]:
-    """Read tweets from a .txt or .csv file, ignoring blank/whitespace-only lines.
+def iter_tweets_from_file(file_path: str) -> Iterator[str]:
+    """Yield tweets from a .txt or .csv file, ignoring blank/whitespace-only lines.
 
     - .txt: each non-empty line is a tweet
     - .csv: first column per row is treated as the tweet text
+
+    Streams line-by-line, so large files never live fully in memory.
     """
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
     _, ext = os.path.splitext(file_path.lower())
-    tweets: List[str] = []
 
+    # A 1 MiB buffer keeps syscall count low on large tweet files
     if ext == ".csv":
-        with open(file_path, "r", encoding="utf-8", newline="") as f:
+        with open(file_path, "r", encoding="utf-8", newline="", buffering=1 << 20) as f:
             reader = csv.reader(f)
             for row in reader:
                 if not row:
                     continue
                 text = (row[0] or "").strip()
                 if text:
-                    tweets.append(text)
+                    yield text
     else:
         # default to txt-like behavior
-        with open(file_path, "r", encoding="utf-8") as f:
+        with open(file_path, "r", encoding="utf-8", buffering=1 << 20) as f:
             for line in f:
                 text = line.strip()
                 if text:
-                    tweets.append(text)
+                    yield text
+
 
-    return tweets
+def read_tweets_from_file(file_path: str) -> List[str]:
+    """Read all tweets from a .txt or .csv file into a list.
+
+    Convenience wrapper over iter_tweets_from_file for callers that need
+    the whole file at once.
+    """
+    return list(iter_tweets_from_file(file_path))
 
 
-__all__ = ["get_api", "compute_delay_seconds", "read_tweets_from_file"]
+__all__ = [
+    "TokenBucket",
+    "ThrottledAPI",
+    "ApiPool",
+    "build_api_pool",
+    "get_api",
+    "invalidate_pool",
+    "compute_delay_seconds",
+    "iter_tweets_from_file",
+    "read_tweets_from_file",
+]
  
  
 def compute_delay_to_month_day_time(year: int, month: int, day: int, time_hhmm: str) -> tuple[float, str]:
@@ -112,12 +283,7 @@ def compute_delay_to_month_day_time(year: int, month: int, day: int, time_hhmm:
     if day < 1 or day > calendar.monthrange(year, month)[1]:
         raise ValueError("Invalid day for this month")
 
-    try:
-        hour, minute = map(int, time_hhmm.split(":", 1))
-    except Exception as e:
-        raise ValueError("time_hhmm must be in HH:MM 24h format") from e
-    if not (0 <= hour <= 23 and 0 <= minute <= 59):
-        raise ValueError("time_hhmm must be a valid 24h time")
+    hour, minute = _parse_hhmm(time_hhmm)
 
     now = datetime.now()
     run_time = datetime(year, month, day, hour, minute)